@@ -1,13 +1,71 @@
+import io
 import json
-import re
-from typing import Any
 
 from src.agents.base import BaseAgent
 from src.config.settings import Settings
-from src.core.types import AgentState, AnalysisResult, QueryIntentType
+from src.core.types import (
+    AgentState,
+    AnalysisResult,
+    CollectedData,
+    MarketData,
+    QueryIntent,
+    QueryIntentType,
+    RAGContext,
+)
+from src.infrastructure.semantic_cache import SemanticCache
 from src.rag.retriever import RAGRetriever
 
 
+class _JsonObjectScanner:
+    """Incrementally locate the first balanced {...} block in streamed text."""
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._length = 0
+        self._start: int | None = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> str | None:
+        """Consume a chunk and return the JSON block once its braces balance."""
+        offset = self._length
+        self._parts.append(chunk)
+        self._length += len(chunk)
+
+        for index, char in enumerate(chunk, offset):
+            if self._start is None:
+                if char == "{":
+                    self._start = index
+                    self._depth = 1
+            elif self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    return self.text[self._start : index + 1]
+
+        return None
+
+
+def _extract_json_object(text: str) -> str | None:
+    """Return the first balanced {...} block in text, ignoring braces inside strings."""
+    return _JsonObjectScanner().feed(text)
+
+
 class AnalystAgent(BaseAgent):
     """Agent responsible for analyzing collected data and generating insights."""
 
@@ -18,9 +76,11 @@ class AnalystAgent(BaseAgent):
         self,
         settings: Settings,
         retriever: RAGRetriever | None = None,
+        semantic_cache: SemanticCache | None = None,
     ) -> None:
         super().__init__(settings)
         self._retriever = retriever
+        self._semantic_cache = semantic_cache
 
     @property
     def system_prompt(self) -> str:
@@ -61,6 +121,17 @@ Não faça recomendações de investimento. Foque em análise factual."""
         if not query:
             return self.add_error(state, ValueError("Query required"))
 
+        query_embedding = await self._embed_for_cache(query.raw_query)
+        cache_scope = self._cache_scope(intent)
+        if query_embedding is not None and self._semantic_cache:
+            cached = await self._semantic_cache.get(query_embedding, scope=cache_scope)
+            if cached:
+                self.logger.info("analysis_cache_hit")
+                return self.update_state(
+                    state,
+                    {"analysis": AnalysisResult.model_validate(cached)},
+                )
+
         analysis_context = self._build_analysis_context(
             query.raw_query,
             intent,
@@ -69,11 +140,10 @@ Não faça recomendações de investimento. Foque em análise factual."""
         )
 
         try:
-            llm_response = await self.invoke_llm(
-                user_message=analysis_context,
-            )
+            llm_response = await self._stream_analysis(analysis_context)
 
-            analysis = self._parse_analysis(llm_response)
+            parsed = self._try_parse_analysis(llm_response)
+            analysis = parsed if parsed is not None else self._fallback_analysis(llm_response)
             analysis.sources_used = self._get_sources(collected_data, rag_context)
 
             self.logger.info(
@@ -84,73 +154,143 @@ Não faça recomendações de investimento. Foque em análise factual."""
                 confidence=analysis.confidence_score,
             )
 
+            # Only parsed analyses are cached; a fallback would answer similar queries.
+            if parsed is not None and query_embedding is not None and self._semantic_cache:
+                await self._semantic_cache.put(
+                    query_embedding,
+                    analysis.model_dump(mode="json"),
+                    scope=cache_scope,
+                )
+
             return self.update_state(state, {"analysis": analysis})
 
         except Exception as e:
             self.logger.exception("analysis_error", error=str(e))
             return self.add_error(state, e)
 
+    async def _stream_analysis(self, user_message: str) -> str:
+        """Stream the analysis and stop as soon as its JSON object is complete."""
+        scanner = _JsonObjectScanner()
+        stream = self.invoke_llm_stream(user_message)
+
+        try:
+            async for chunk in stream:
+                json_text = scanner.feed(chunk)
+                if json_text is not None:
+                    return json_text
+        finally:
+            await stream.aclose()
+
+        return scanner.text
+
+    def _cache_scope(self, intent: QueryIntent | None) -> str:
+        """Scope cached analyses to the intent, tickers and period they were built for.
+
+        Queries that differ only in ticker or period embed almost identically, so the
+        embedding alone cannot keep one company's analysis from answering another's.
+        """
+        if intent is None:
+            return self.name
+        return (
+            f"{self.name}:{intent.intent_type.value}:"
+            f"{sorted(intent.tickers)}:{intent.time_range or ''}"
+        )
+
+    async def _embed_for_cache(self, raw_query: str) -> list[float] | None:
+        """Embed the query for semantic cache lookup, if caching is available."""
+        if not self._semantic_cache or not self._retriever:
+            return None
+
+        try:
+            return await self._retriever.embed_query(raw_query)
+        except Exception as e:
+            self.logger.warning("semantic_cache_embed_error", error=str(e))
+            return None
+
     def _build_analysis_context(
         self,
         raw_query: str,
-        intent: Any,
-        collected_data: Any,
-        rag_context: Any,
+        intent: QueryIntent | None,
+        collected_data: CollectedData | None,
+        rag_context: RAGContext | None,
     ) -> str:
         """Build context string for analysis."""
-        parts = [f"## Consulta do Usuário\n{raw_query}\n"]
+        buffer = io.StringIO()
+        write = buffer.write
+
+        write(f"## Consulta do Usuário\n{raw_query}\n")
 
         if intent:
-            parts.append(f"## Tipo de Análise\n{intent.intent_type.value}\n")
-            if intent.tickers:
-                parts.append(f"Tickers: {', '.join(intent.tickers)}\n")
+            write(f"\n## Tipo de Análise\n{intent.intent_type.value}\n")
+            tickers = intent.tickers
+            if tickers:
+                write(f"\nTickers: {', '.join(tickers)}\n")
 
         if collected_data:
-            if collected_data.market_data:
-                parts.append("## Dados de Mercado\n")
-                for md in collected_data.market_data:
-                    parts.append(f"""
-**{md.ticker} - {md.company_name}**
-- Preço Atual: R$ {md.current_price:.2f}
-- Variação: {md.change_percent:.2f}%
-- Volume: {md.volume:,}
-- Market Cap: R$ {md.market_cap:,.0f if md.market_cap else 'N/A'}
-- P/E: {md.pe_ratio:.2f if md.pe_ratio else 'N/A'}
-- Dividend Yield: {md.dividend_yield * 100:.2f}% if md.dividend_yield else 'N/A'
-""")
-
-            if collected_data.news_items:
-                parts.append("\n## Notícias Recentes\n")
-                for news in collected_data.news_items[:5]:
-                    parts.append(f"- **{news.title}** ({news.source}, {news.published_at.strftime('%d/%m/%Y')})\n")
-
-            if collected_data.raw_data.get("cvm"):
-                parts.append("\n## Documentos CVM Disponíveis\n")
-                for doc in collected_data.raw_data["cvm"][:5]:
-                    parts.append(f"- {doc.get('document_type', 'N/A')} - {doc.get('year', 'N/A')}\n")
+            market_data = collected_data.market_data
+            if market_data:
+                write("\n## Dados de Mercado\n")
+                for md in market_data:
+                    write("\n")
+                    write(self._format_market_data(md))
+
+            news_items = collected_data.news_items[:5]
+            if news_items:
+                write("\n\n## Notícias Recentes\n")
+                for news in news_items:
+                    published = news.published_at.strftime("%d/%m/%Y")
+                    write(f"\n- **{news.title}** ({news.source}, {published})\n")
+
+            cvm_docs = collected_data.raw_data.get("cvm")
+            if cvm_docs:
+                write("\n\n## Documentos CVM Disponíveis\n")
+                for doc in cvm_docs[:5]:
+                    write(f"\n- {doc.get('document_type', 'N/A')} - {doc.get('year', 'N/A')}\n")
 
         if rag_context and rag_context.chunks:
-            parts.append("\n## Informações de Documentos\n")
+            write("\n\n## Informações de Documentos\n")
             if self._retriever:
-                formatted = self._retriever.format_context(rag_context, max_tokens=3000)
-                parts.append(formatted)
+                write("\n")
+                write(self._retriever.format_context(rag_context, max_tokens=3000))
             else:
                 for i, chunk in enumerate(rag_context.chunks[:5]):
-                    parts.append(f"\n[Documento {i + 1}]\n{chunk.content[:500]}...\n")
+                    write(f"\n\n[Documento {i + 1}]\n{chunk.preview}...\n")
+
+        write("""
 
-        parts.append("""
 ## Instruções
 Com base nas informações acima, forneça uma análise financeira completa em formato JSON.
 Inclua todos os campos solicitados no formato de resposta.""")
 
-        return "\n".join(parts)
+        return buffer.getvalue()
+
+    def _format_market_data(self, md: MarketData) -> str:
+        """Format a ticker's market data block for the analysis context."""
+        market_cap = f"R$ {md.market_cap:,.0f}" if md.market_cap else "N/A"
+        pe_ratio = f"{md.pe_ratio:.2f}" if md.pe_ratio else "N/A"
+        dividend_yield = f"{md.dividend_yield * 100:.2f}%" if md.dividend_yield else "N/A"
+
+        return f"""
+**{md.ticker} - {md.company_name}**
+- Preço Atual: R$ {md.current_price:.2f}
+- Variação: {md.change_percent:.2f}%
+- Volume: {md.volume:,}
+- Market Cap: {market_cap}
+- P/E: {pe_ratio}
+- Dividend Yield: {dividend_yield}
+"""
 
     def _parse_analysis(self, llm_response: str) -> AnalysisResult:
         """Parse LLM response into AnalysisResult."""
+        analysis = self._try_parse_analysis(llm_response)
+        return analysis if analysis is not None else self._fallback_analysis(llm_response)
+
+    def _try_parse_analysis(self, llm_response: str) -> AnalysisResult | None:
+        """Parse LLM response into AnalysisResult, or None if it has no JSON object."""
         try:
-            json_match = re.search(r"\{[\s\S]*\}", llm_response)
-            if json_match:
-                data = json.loads(json_match.group())
+            json_text = _extract_json_object(llm_response)
+            if json_text:
+                data = json.loads(json_text)
 
                 return AnalysisResult(
                     summary=data.get("summary", "Análise não disponível"),
@@ -165,6 +305,11 @@ Inclua todos os campos solicitados no formato de resposta.""")
         except (json.JSONDecodeError, KeyError) as e:
             self.logger.warning("analysis_parse_error", error=str(e))
 
+        return None
+
+    @staticmethod
+    def _fallback_analysis(llm_response: str) -> AnalysisResult:
+        """Wrap an unparseable response as a low-confidence analysis."""
         return AnalysisResult(
             summary=llm_response[:500] if llm_response else "Análise não disponível",
             key_findings=[],
@@ -177,8 +322,8 @@ Inclua todos os campos solicitados no formato de resposta.""")
 
     def _get_sources(
         self,
-        collected_data: Any,
-        rag_context: Any,
+        collected_data: CollectedData | None,
+        rag_context: RAGContext | None,
     ) -> list[str]:
         """Get list of sources used in analysis."""
         sources: list[str] = []
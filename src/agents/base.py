@@ -1,16 +1,23 @@
+import hashlib
 import time
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import AsyncGenerator
+from typing import Any, cast
 
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
+import httpx
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessageChunk, HumanMessage, SystemMessage
 
 from src.config.logging import LoggerMixin
 from src.config.settings import Settings
 from src.core.exceptions import AgentError
 from src.core.types import AgentState
 
+LLM_MAX_KEEPALIVE_CONNECTIONS = 64
+LLM_BATCH_MAX_CONCURRENCY = 16
+
+_llm_clients: dict[tuple[str, str, float, int, str], BaseChatModel] = {}
+
 
 class BaseAgent(ABC, LoggerMixin):
     """Abstract base class for all agents in the system."""
@@ -21,29 +28,72 @@ class BaseAgent(ABC, LoggerMixin):
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
         self._llm = self._create_llm()
+        self._system_message = self._build_system_message(self.system_prompt)
 
-    def _create_llm(self) -> ChatOpenAI | ChatAnthropic:
-        """Create the LLM client based on settings."""
-        if self._settings.llm_provider == "openai":
-            api_key = self._settings.openai_api_key
+    def _create_llm(self) -> BaseChatModel:
+        """Get the shared LLM client for the configured provider and model."""
+        settings = self._settings
+        if settings.llm_provider == "openai":
+            api_key = settings.openai_api_key
             if not api_key:
                 raise ValueError("OpenAI API key required")
-            return ChatOpenAI(
-                model=self._settings.llm_model,
-                temperature=self._settings.llm_temperature,
-                max_tokens=self._settings.llm_max_tokens,
-                api_key=api_key.get_secret_value(),
-            )
         else:
-            api_key = self._settings.anthropic_api_key
+            api_key = settings.anthropic_api_key
             if not api_key:
                 raise ValueError("Anthropic API key required")
-            return ChatAnthropic(
+
+        secret = api_key.get_secret_value()
+        client_key = (
+            settings.llm_provider,
+            settings.llm_model,
+            settings.llm_temperature,
+            settings.llm_max_tokens,
+            hashlib.sha256(secret.encode()).hexdigest(),
+        )
+
+        llm = _llm_clients.get(client_key)
+        if llm is None:
+            llm = self._build_llm(secret)
+            _llm_clients[client_key] = llm
+        return llm
+
+    def _build_llm(self, api_key: str) -> BaseChatModel:
+        """Create a new LLM client based on settings, importing only that provider."""
+        if self._settings.llm_provider == "openai":
+            from langchain_openai import ChatOpenAI
+
+            return ChatOpenAI(
                 model=self._settings.llm_model,
                 temperature=self._settings.llm_temperature,
                 max_tokens=self._settings.llm_max_tokens,
-                api_key=api_key.get_secret_value(),
+                api_key=api_key,
+                http_async_client=httpx.AsyncClient(
+                    limits=httpx.Limits(max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS),
+                ),
+            )
+
+        from langchain_anthropic import ChatAnthropic
+
+        return ChatAnthropic(
+            model=self._settings.llm_model,
+            temperature=self._settings.llm_temperature,
+            max_tokens=self._settings.llm_max_tokens,
+            api_key=api_key,
+        )
+
+    def _build_system_message(self, content: str) -> SystemMessage:
+        """Build a system message, marking it cacheable for Anthropic prompt caching."""
+        if self._settings.llm_provider == "anthropic":
+            return SystemMessage(
+                content=[
+                    {
+                        "type": "text",
+                        "text": content,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
             )
+        return SystemMessage(content=content)
 
     @abstractmethod
     async def execute(self, state: AgentState) -> AgentState:
@@ -62,14 +112,10 @@ class BaseAgent(ABC, LoggerMixin):
         system_message: str | None = None,
     ) -> str:
         """Invoke the LLM with the given messages."""
-        messages = []
-
-        if system_message:
-            messages.append(SystemMessage(content=system_message))
-        else:
-            messages.append(SystemMessage(content=self.system_prompt))
-
-        messages.append(HumanMessage(content=user_message))
+        messages = [
+            self._build_system_message(system_message) if system_message else self._system_message,
+            HumanMessage(content=user_message),
+        ]
 
         start_time = time.perf_counter()
 
@@ -98,22 +144,120 @@ class BaseAgent(ABC, LoggerMixin):
                 agent_name=self.name,
             )
 
+    async def invoke_llm_stream(
+        self,
+        user_message: str,
+        system_message: str | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Stream the LLM response as text chunks."""
+        messages = [
+            self._build_system_message(system_message) if system_message else self._system_message,
+            HumanMessage(content=user_message),
+        ]
+
+        start_time = time.perf_counter()
+        # astream is typed as an iterator but is an async generator that must be closed.
+        stream = cast(AsyncGenerator[BaseMessageChunk, None], self._llm.astream(messages))
+
+        try:
+            async for chunk in stream:
+                yield self._chunk_text(chunk)
+
+            self.log_operation(
+                f"{self.name}_llm_stream",
+                status="success",
+                duration_ms=(time.perf_counter() - start_time) * 1000,
+            )
+
+        except GeneratorExit:
+            self.log_operation(
+                f"{self.name}_llm_stream",
+                status="stopped",
+                duration_ms=(time.perf_counter() - start_time) * 1000,
+            )
+            raise
+
+        except Exception as e:
+            self.log_operation(
+                f"{self.name}_llm_stream",
+                status="failed",
+                duration_ms=(time.perf_counter() - start_time) * 1000,
+                error=str(e),
+            )
+            raise AgentError(
+                message=f"LLM invocation failed: {str(e)}",
+                agent_name=self.name,
+            ) from e
+
+        finally:
+            await stream.aclose()
+
+    @staticmethod
+    def _chunk_text(chunk: BaseMessageChunk) -> str:
+        """Extract the text from a streamed message chunk."""
+        content = chunk.content
+        if isinstance(content, str):
+            return content
+        return "".join(
+            block if isinstance(block, str) else block.get("text", "") for block in content
+        )
+
+    async def invoke_llm_batch(
+        self,
+        user_messages: list[str],
+        system_message: str | None = None,
+    ) -> list[str]:
+        """Invoke the LLM for several user messages concurrently."""
+        system = (
+            self._build_system_message(system_message) if system_message else self._system_message
+        )
+        batch = [[system, HumanMessage(content=message)] for message in user_messages]
+
+        start_time = time.perf_counter()
+
+        try:
+            responses = await self._llm.abatch(
+                batch,
+                config={"max_concurrency": LLM_BATCH_MAX_CONCURRENCY},
+            )
+            duration_ms = (time.perf_counter() - start_time) * 1000
+
+            self.log_operation(
+                f"{self.name}_llm_batch_invoke",
+                status="success",
+                duration_ms=duration_ms,
+                batch_size=len(batch),
+            )
+
+            return [str(response.content) for response in responses]
+
+        except Exception as e:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            self.log_operation(
+                f"{self.name}_llm_batch_invoke",
+                status="failed",
+                duration_ms=duration_ms,
+                batch_size=len(batch),
+                error=str(e),
+            )
+            raise AgentError(
+                message=f"LLM batch invocation failed: {str(e)}",
+                agent_name=self.name,
+            ) from e
+
     def update_state(
         self,
         state: AgentState,
         updates: dict[str, Any],
     ) -> AgentState:
         """Update the agent state with new values."""
-        new_state = dict(state)
-        new_state.update(updates)
-        new_state["current_agent"] = self.name
+        new_state: AgentState = {**state, **updates, "current_agent": self.name}
 
-        completed = list(new_state.get("completed_agents", []))
+        completed = new_state.get("completed_agents", [])
         if self.name not in completed:
-            completed.append(self.name)
-        new_state["completed_agents"] = completed
+            new_state["completed_agents"] = [*completed, self.name]
 
-        return AgentState(**new_state)
+        return new_state
 
     def add_error(
         self,
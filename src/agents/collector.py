@@ -1,14 +1,18 @@
 import asyncio
-from datetime import datetime
+from collections.abc import Awaitable
+from typing import TypeVar
 
 from src.agents.base import BaseAgent
 from src.config.settings import Settings
+from src.core.clock import utc_now
 from src.core.types import AgentState, CollectedData, MarketData, NewsItem
 from src.infrastructure.cache import CacheService
 from src.tools.cvm import CVMTool
 from src.tools.news import NewsTool
 from src.tools.yahoo_finance import YahooFinanceTool
 
+T = TypeVar("T")
+
 
 class CollectorAgent(BaseAgent):
     """Agent responsible for collecting data from external sources."""
@@ -26,6 +30,7 @@ class CollectorAgent(BaseAgent):
         self._yahoo_tool = YahooFinanceTool()
         self._cvm_tool = CVMTool()
         self._news_tool = NewsTool(settings)
+        self._semaphore = asyncio.Semaphore(settings.max_concurrent_requests)
 
     @property
     def system_prompt(self) -> str:
@@ -42,7 +47,7 @@ Você não analisa os dados, apenas coleta e organiza."""
         tickers = intent.tickers
         collected_data = CollectedData(
             sources=[],
-            collection_timestamp=datetime.utcnow(),
+            collection_timestamp=utc_now(),
         )
 
         tasks = []
@@ -89,26 +94,42 @@ Você não analisa os dados, apenas coleta e organiza."""
         tickers: list[str],
     ) -> dict[str, list[MarketData]]:
         """Collect market data for tickers."""
-        market_data: list[MarketData] = []
-
-        for ticker in tickers:
-            cache_key = None
-            if self._cache:
-                cache_key = CacheService.generate_key("quote", ticker)
-                cached = await self._cache.get_model(cache_key, MarketData)
-                if cached:
-                    market_data.append(cached)
-                    continue
+        cached: list[MarketData | None] = [None] * len(tickers)
+        if self._cache:
+            cached = await self._cache.get_models_many(
+                [CacheService.generate_key("quote", ticker) for ticker in tickers],
+                MarketData,
+            )
 
-            result = await self._yahoo_tool.execute(action="quote", ticker=ticker)
+        misses = [ticker for ticker, data in zip(tickers, cached, strict=True) if not data]
 
-            if result.success and result.data:
-                data = result.data
-                if isinstance(data, MarketData):
-                    market_data.append(data)
-                    if self._cache and cache_key:
-                        await self._cache.set_model(cache_key, data, ttl=300)
+        results = await asyncio.gather(
+            *[self._limited(self._yahoo_tool.execute(action="quote", ticker=t)) for t in misses],
+            return_exceptions=True,
+        )
+
+        fetched: dict[str, MarketData] = {}
+        for ticker, result in zip(misses, results, strict=True):
+            if isinstance(result, Exception):
+                self.logger.warning("quote_collection_error", ticker=ticker, error=str(result))
+                continue
+            if result.success and isinstance(result.data, MarketData):
+                fetched[ticker] = result.data
+
+        if self._cache and fetched:
+            await self._cache.set_many(
+                {
+                    CacheService.generate_key("quote", ticker): data.model_dump_json()
+                    for ticker, data in fetched.items()
+                },
+                ttl=300,
+            )
 
+        market_data = [
+            data
+            for ticker, hit in zip(tickers, cached, strict=True)
+            if (data := hit or fetched.get(ticker))
+        ]
         return {"market_data": market_data}
 
     async def _collect_news(
@@ -132,19 +153,29 @@ Você não analisa os dados, apenas coleta e organiza."""
         tickers: list[str],
     ) -> dict[str, list[dict]]:
         """Collect CVM regulatory information."""
-        cvm_data: list[dict] = []
-
-        for ticker in tickers:
-            result = await self._cvm_tool.execute(
-                action="list_filings",
-                ticker=ticker,
-            )
+        results = await asyncio.gather(
+            *[
+                self._limited(self._cvm_tool.execute(action="list_filings", ticker=ticker))
+                for ticker in tickers
+            ],
+            return_exceptions=True,
+        )
 
+        cvm_data: list[dict] = []
+        for ticker, result in zip(tickers, results, strict=True):
+            if isinstance(result, Exception):
+                self.logger.warning("cvm_collection_error", ticker=ticker, error=str(result))
+                continue
             if result.success and result.data:
                 cvm_data.extend(result.data)
 
         return {"cvm_data": cvm_data}
 
+    async def _limited(self, coro: Awaitable[T]) -> T:
+        """Await a coroutine while holding the fan-out semaphore."""
+        async with self._semaphore:
+            return await coro
+
     async def collect_detailed_info(
         self,
         ticker: str,
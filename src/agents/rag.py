@@ -1,6 +1,9 @@
+import re
+
 from src.agents.base import BaseAgent
 from src.config.settings import Settings
-from src.core.types import AgentState, QueryIntentType, RAGContext
+from src.core.types import AgentState, QueryIntent, QueryIntentType, RAGContext
+from src.infrastructure.semantic_cache import SemanticCache
 from src.rag.retriever import RAGRetriever
 
 
@@ -10,13 +13,40 @@ class RAGAgent(BaseAgent):
     name = "rag"
     description = "Retrieves and processes relevant documents from the knowledge base"
 
+    FINANCIAL_TERMS = (
+        "receita",
+        "lucro",
+        "prejuízo",
+        "ebitda",
+        "margem",
+        "dívida",
+        "caixa",
+        "ativo",
+        "passivo",
+        "patrimônio",
+        "dividendo",
+        "ação",
+        "resultado",
+        "trimestre",
+        "semestre",
+        "ano",
+        "crescimento",
+        "queda",
+        "variação",
+    )
+    FINANCIAL_TERMS_PATTERN = re.compile(
+        "(?=(" + "|".join(map(re.escape, FINANCIAL_TERMS)) + "))"
+    )
+
     def __init__(
         self,
         settings: Settings,
         retriever: RAGRetriever,
+        semantic_cache: SemanticCache | None = None,
     ) -> None:
         super().__init__(settings)
         self._retriever = retriever
+        self._semantic_cache = semantic_cache
 
     @property
     def system_prompt(self) -> str:
@@ -44,18 +74,39 @@ Você prioriza documentos oficiais como balanços, relatórios trimestrais e fat
             filters = self._build_filters(intent)
             keywords = self._extract_keywords(query.raw_query, intent)
 
+            query_embedding = None
+            cache_scope = f"{self.name}:{sorted((filters or {}).items())}"
+            if self._semantic_cache:
+                query_embedding = await self._retriever.embed_query(search_query)
+                cached = await self._semantic_cache.get(query_embedding, scope=cache_scope)
+                if cached:
+                    self.logger.info("rag_cache_hit", filters=filters)
+                    return self.update_state(
+                        state,
+                        {"rag_context": RAGContext.model_validate(cached)},
+                    )
+
             if keywords:
                 rag_context = await self._retriever.hybrid_search(
                     query=search_query,
                     keywords=keywords,
                     filters=filters,
                     top_k=self._settings.rag_top_k,
+                    query_embedding=query_embedding,
                 )
             else:
                 rag_context = await self._retriever.retrieve(
                     query=search_query,
                     filters=filters,
                     top_k=self._settings.rag_top_k,
+                    query_embedding=query_embedding,
+                )
+
+            if self._semantic_cache and query_embedding is not None:
+                await self._semantic_cache.put(
+                    query_embedding,
+                    rag_context.model_dump(mode="json"),
+                    scope=cache_scope,
                 )
 
             self.logger.info(
@@ -71,59 +122,39 @@ Você prioriza documentos oficiais como balanços, relatórios trimestrais e fat
             self.logger.exception("rag_error", error=str(e))
             return self.add_error(state, e)
 
-    def _build_search_query(self, raw_query: str, intent: any) -> str:
+    def _build_search_query(self, raw_query: str, intent: QueryIntent) -> str:
         """Build optimized search query based on intent."""
-        if intent.intent_type == QueryIntentType.FINANCIAL_ANALYSIS:
+        intent_type = intent.intent_type
+        if intent_type == QueryIntentType.FINANCIAL_ANALYSIS:
             return f"{raw_query} resultados financeiros balanço demonstrações"
-        elif intent.intent_type == QueryIntentType.DOCUMENT_SEARCH:
+        elif intent_type == QueryIntentType.DOCUMENT_SEARCH:
             return raw_query
-        elif intent.intent_type == QueryIntentType.COMPARISON:
+        elif intent_type == QueryIntentType.COMPARISON:
             return f"{raw_query} indicadores métricas comparativo"
         else:
             return raw_query
 
-    def _build_filters(self, intent: any) -> dict | None:
+    def _build_filters(self, intent: QueryIntent) -> dict[str, str] | None:
         """Build search filters based on intent."""
-        filters = {}
+        filters: dict[str, str] = {}
 
-        if intent.tickers and len(intent.tickers) == 1:
-            filters["ticker"] = intent.tickers[0]
+        tickers = intent.tickers
+        if len(tickers) == 1:
+            filters["ticker"] = tickers[0]
 
-        if intent.entities.get("companies") and len(intent.entities["companies"]) == 1:
-            filters["company"] = intent.entities["companies"][0]
+        companies = intent.entities.get("companies")
+        if companies and len(companies) == 1:
+            filters["company"] = companies[0]
 
         return filters if filters else None
 
-    def _extract_keywords(self, query: str, intent: any) -> list[str] | None:
+    def _extract_keywords(self, query: str, intent: QueryIntent) -> list[str] | None:
         """Extract important keywords for hybrid search."""
-        financial_terms = [
-            "receita",
-            "lucro",
-            "prejuízo",
-            "ebitda",
-            "margem",
-            "dívida",
-            "caixa",
-            "ativo",
-            "passivo",
-            "patrimônio",
-            "dividendo",
-            "ação",
-            "resultado",
-            "trimestre",
-            "semestre",
-            "ano",
-            "crescimento",
-            "queda",
-            "variação",
-        ]
-
-        query_lower = query.lower()
-        found_keywords = [term for term in financial_terms if term in query_lower]
-
-        found_keywords.extend(intent.tickers)
-
-        return found_keywords if found_keywords else None
+        found = set(self.FINANCIAL_TERMS_PATTERN.findall(query.lower()))
+        return [
+            *(term for term in self.FINANCIAL_TERMS if term in found),
+            *intent.tickers,
+        ] or None
 
     async def retrieve_for_ticker(
         self,
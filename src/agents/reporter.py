@@ -1,8 +1,9 @@
-from datetime import datetime
+from typing import Any
 from uuid import uuid4
 
 from src.agents.base import BaseAgent
 from src.config.settings import Settings
+from src.core.clock import utc_now
 from src.core.types import AgentState, AnalysisResult, ResearchResponse
 
 
@@ -18,6 +19,48 @@ class ReporterAgent(BaseAgent):
         "Consulte um profissional qualificado antes de tomar decisões de investimento.",
     ]
 
+    FORMAT_INSTRUCTIONS = {
+        "markdown": (
+            "Use formatação Markdown com títulos (##), listas (-) e **negrito** para destaques."
+        ),
+        "plain": "Use texto simples sem formatação especial.",
+        "executive": "Seja extremamente conciso. Máximo 3-4 parágrafos curtos.",
+    }
+
+    PROMPT_TEMPLATE = """Pergunta do usuário: {query}
+
+## Análise Disponível
+
+**Resumo:** {summary}
+
+**Principais Descobertas:**
+{findings}
+
+**Métricas Financeiras:**
+{metrics}
+
+**Riscos Identificados:**
+{risks}
+
+**Oportunidades:**
+{opportunities}
+
+**Sentimento Geral:** {sentiment}
+
+**Fontes:** {sources}
+
+## Instruções de Formatação
+{format_instructions}
+
+Gere uma resposta completa e bem estruturada que responda diretamente à pergunta do usuário.
+Inclua os dados mais relevantes da análise de forma natural no texto."""
+
+    FALLBACK_MARKET_DATA_TEMPLATE = """
+**{ticker} - {company_name}**
+- Preço: R$ {price:.2f}
+- Variação: {change:+.2f}%
+"""
+
     @property
     def system_prompt(self) -> str:
         return """Você é um redator especializado em relatórios financeiros.
@@ -70,7 +113,7 @@ Sempre inclua:
                 analysis=analysis,
                 sources=analysis.sources_used if analysis else [],
                 disclaimers=self.DISCLAIMERS,
-                timestamp=datetime.utcnow(),
+                timestamp=utc_now(),
             )
 
             self.logger.info(
@@ -104,39 +147,20 @@ Sempre inclua:
         response_format: str,
     ) -> str:
         """Generate formatted response using LLM."""
-        format_instructions = {
-            "markdown": "Use formatação Markdown com títulos (##), listas (-) e **negrito** para destaques.",
-            "plain": "Use texto simples sem formatação especial.",
-            "executive": "Seja extremamente conciso. Máximo 3-4 parágrafos curtos.",
-        }
-
-        prompt = f"""Pergunta do usuário: {query}
-
-## Análise Disponível
-
-**Resumo:** {analysis.summary}
-
-**Principais Descobertas:**
-{chr(10).join(f'- {f}' for f in analysis.key_findings) if analysis.key_findings else 'N/A'}
-
-**Métricas Financeiras:**
-{self._format_metrics(analysis.financial_metrics)}
-
-**Riscos Identificados:**
-{chr(10).join(f'- {r}' for r in analysis.risks) if analysis.risks else 'N/A'}
-
-**Oportunidades:**
-{chr(10).join(f'- {o}' for o in analysis.opportunities) if analysis.opportunities else 'N/A'}
-
-**Sentimento Geral:** {analysis.sentiment}
-
-**Fontes:** {', '.join(analysis.sources_used) if analysis.sources_used else 'Dados de mercado'}
-
-## Instruções de Formatação
-{format_instructions.get(response_format, format_instructions['markdown'])}
-
-Gere uma resposta completa e bem estruturada que responda diretamente à pergunta do usuário.
-Inclua os dados mais relevantes da análise de forma natural no texto."""
+        sources = ", ".join(analysis.sources_used) if analysis.sources_used else "Dados de mercado"
+        prompt = self.PROMPT_TEMPLATE.format(
+            query=query,
+            summary=analysis.summary,
+            findings=self._format_bullets(analysis.key_findings),
+            metrics=self._format_metrics(analysis.financial_metrics),
+            risks=self._format_bullets(analysis.risks),
+            opportunities=self._format_bullets(analysis.opportunities),
+            sentiment=analysis.sentiment,
+            sources=sources,
+            format_instructions=self.FORMAT_INSTRUCTIONS.get(
+                response_format, self.FORMAT_INSTRUCTIONS["markdown"]
+            ),
+        )
 
         response = await self.invoke_llm(user_message=prompt)
 
@@ -145,36 +169,35 @@ Inclua os dados mais relevantes da análise de forma natural no texto."""
 
         return response
 
+    @staticmethod
+    def _format_bullets(items: list[str]) -> str:
+        """Format items as a markdown bullet list."""
+        return "\n".join(map("- {}".format, items)) if items else "N/A"
+
+    @staticmethod
+    def _fmt(value: Any) -> str:
+        """Format a single metric value."""
+        if isinstance(value, float):
+            return f"{value:,.2f}"
+        if isinstance(value, int):
+            return f"{value:,}"
+        return str(value)
+
     def _format_metrics(self, metrics: dict) -> str:
         """Format financial metrics for display."""
-        if not metrics:
-            return "N/A"
-
-        lines = []
-        for key, value in metrics.items():
-            if isinstance(value, float):
-                formatted_value = f"{value:,.2f}"
-            elif isinstance(value, int):
-                formatted_value = f"{value:,}"
-            else:
-                formatted_value = str(value)
-            lines.append(f"- {key}: {formatted_value}")
-
-        return "\n".join(lines)
+        fmt = self._fmt
+        return "\n".join(f"- {key}: {fmt(value)}" for key, value in metrics.items()) or "N/A"
 
     def _add_footer(self, content: str, sources: list[str]) -> str:
         """Add footer with sources and disclaimers."""
-        footer_parts = ["\n\n---\n"]
-
-        if sources:
-            footer_parts.append("**Fontes utilizadas:**")
-            for source in sources[:5]:
-                footer_parts.append(f"- {source}")
-
-        footer_parts.append("\n**Aviso Legal:**")
-        footer_parts.append(self.DISCLAIMERS[0])
-
-        return content + "\n".join(footer_parts)
+        source_lines = (
+            ["**Fontes utilizadas:**", *(f"- {source}" for source in sources[:5])]
+            if sources
+            else []
+        )
+        return content + "\n".join(
+            ["\n\n---\n", *source_lines, "\n**Aviso Legal:**", self.DISCLAIMERS[0]]
+        )
 
     def _generate_fallback_response(
         self,
@@ -188,12 +211,16 @@ Inclua os dados mais relevantes da análise de forma natural no texto."""
 
         if collected_data and collected_data.market_data:
             parts.append("## Dados de Mercado Disponíveis\n")
-            for md in collected_data.market_data:
-                parts.append(f"""
-**{md.ticker} - {md.company_name}**
-- Preço: R$ {md.current_price:.2f}
-- Variação: {md.change_percent:+.2f}%
-""")
+            template = self.FALLBACK_MARKET_DATA_TEMPLATE
+            parts.extend(
+                template.format(
+                    ticker=md.ticker,
+                    company_name=md.company_name,
+                    price=md.current_price,
+                    change=md.change_percent,
+                )
+                for md in collected_data.market_data
+            )
 
         if collected_data and collected_data.news_items:
             parts.append("\n## Notícias Recentes\n")
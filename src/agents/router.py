@@ -1,9 +1,32 @@
 import json
 import re
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
 
 from src.agents.base import BaseAgent
 from src.config.settings import Settings
 from src.core.types import AgentState, QueryIntent, QueryIntentType
+from src.infrastructure.cache import CacheService
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a prefix-factored regex alternation matching the longest word first."""
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
 
 
 class RouterAgent(BaseAgent):
@@ -14,24 +37,60 @@ class RouterAgent(BaseAgent):
 
     TICKER_PATTERN = re.compile(r"\b([A-Z]{4}[0-9]{1,2})\b")
     COMPANY_PATTERNS = {
-        "petrobras": ["PETR4", "PETR3"],
-        "vale": ["VALE3"],
-        "itau": ["ITUB4", "ITUB3"],
-        "itaú": ["ITUB4", "ITUB3"],
-        "bradesco": ["BBDC4", "BBDC3"],
-        "banco do brasil": ["BBAS3"],
-        "ambev": ["ABEV3"],
-        "weg": ["WEGE3"],
-        "localiza": ["RENT3"],
-        "renner": ["LREN3"],
-        "magazine luiza": ["MGLU3"],
-        "magalu": ["MGLU3"],
-        "b3": ["B3SA3"],
-        "suzano": ["SUZB3"],
-        "jbs": ["JBSS3"],
-        "gerdau": ["GGBR4"],
-        "csn": ["CSNA3"],
+        "petrobras": ("PETR4", "PETR3"),
+        "vale": ("VALE3",),
+        "itau": ("ITUB4", "ITUB3"),
+        "itaú": ("ITUB4", "ITUB3"),
+        "bradesco": ("BBDC4", "BBDC3"),
+        "banco do brasil": ("BBAS3",),
+        "ambev": ("ABEV3",),
+        "weg": ("WEGE3",),
+        "localiza": ("RENT3",),
+        "renner": ("LREN3",),
+        "magazine luiza": ("MGLU3",),
+        "magalu": ("MGLU3",),
+        "b3": ("B3SA3",),
+        "suzano": ("SUZB3",),
+        "jbs": ("JBSS3",),
+        "gerdau": ("GGBR4",),
+        "csn": ("CSNA3",),
     }
+    TICKER_COMPANY_PATTERN = re.compile(
+        r"\b(?P<ticker>[A-Z]{4}[0-9]{1,2})\b|(?P<company>" + _trie_pattern(COMPANY_PATTERNS) + ")",
+        re.IGNORECASE,
+    )
+    COMPANY_PATTERN = re.compile(
+        "(?P<company>" + _trie_pattern(COMPANY_PATTERNS) + ")",
+        re.IGNORECASE,
+    )
+    DIGITS = frozenset("0123456789")
+    JSON_BLOCK_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+    INTENT_CACHE_TTL = 300
+    INTENT_MEMO_SIZE = 512
+    INTENT_TYPE_MAP = {
+        "financial_analysis": QueryIntentType.FINANCIAL_ANALYSIS,
+        "market_data": QueryIntentType.MARKET_DATA,
+        "news_sentiment": QueryIntentType.NEWS_SENTIMENT,
+        "document_search": QueryIntentType.DOCUMENT_SEARCH,
+        "comparison": QueryIntentType.COMPARISON,
+        "general": QueryIntentType.GENERAL,
+    }
+    FALLBACK_INTENT = QueryIntent(
+        intent_type=QueryIntentType.GENERAL,
+        requires_rag=True,
+        requires_market_data=True,
+        requires_news=True,
+        confidence=0.5,
+    )
+
+    def __init__(
+        self,
+        settings: Settings,
+        cache_service: CacheService | None = None,
+    ) -> None:
+        super().__init__(settings)
+        self._cache = cache_service
+        self._intent_memo: OrderedDict[str, tuple[float, QueryIntent]] = OrderedDict()
 
     @property
     def system_prompt(self) -> str:
@@ -74,15 +133,30 @@ requires_news deve ser true se a pergunta envolve notícias recentes ou sentimen
             return self.add_error(state, ValueError("No query provided"))
 
         raw_query = query.raw_query
+        query_lower = raw_query.lower()
 
-        extracted_tickers = self._extract_tickers(raw_query)
+        cached_intent = await self._get_cached_intent(query_lower)
+        if cached_intent:
+            self.logger.info(
+                "query_intent_cache_hit",
+                intent_type=cached_intent.intent_type.value,
+            )
+            return self.update_state(state, {"intent": cached_intent})
+
+        extracted_tickers = self._extract_tickers(query_lower)
 
         try:
             llm_response = await self.invoke_llm(
                 f"Analise a seguinte consulta financeira:\n\n{raw_query}"
             )
 
-            intent = self._parse_intent(llm_response, extracted_tickers)
+            intent = self._try_parse_intent(llm_response, extracted_tickers)
+
+            # Only successful classifications are cached; a malformed reply is retried.
+            if intent is None:
+                intent = self._fallback_intent(extracted_tickers)
+            else:
+                await self._cache_intent(query_lower, intent)
 
             self.logger.info(
                 "query_analyzed",
@@ -98,30 +172,63 @@ requires_news deve ser true se a pergunta envolve notícias recentes ou sentimen
         except Exception as e:
             self.logger.exception("router_error", error=str(e))
 
-            default_intent = QueryIntent(
-                intent_type=QueryIntentType.GENERAL,
-                tickers=extracted_tickers,
-                requires_rag=True,
-                requires_market_data=True,
-                requires_news=True,
-                confidence=0.5,
-            )
+            default_intent = self._fallback_intent(extracted_tickers)
 
             return self.update_state(state, {"intent": default_intent})
 
+    async def _get_cached_intent(self, query_lower: str) -> QueryIntent | None:
+        """Look up a classified intent in process memory, then in Redis."""
+        memoized = self._intent_memo.get(query_lower)
+        if memoized and memoized[0] > time.monotonic():
+            self._intent_memo.move_to_end(query_lower)
+            return memoized[1]
+
+        if not self._cache:
+            return None
+
+        intent = await self._cache.get_model(
+            CacheService.generate_key("intent", query_lower),
+            QueryIntent,
+        )
+        if intent:
+            self._memoize_intent(query_lower, intent)
+        return intent
+
+    async def _cache_intent(self, query_lower: str, intent: QueryIntent) -> None:
+        """Store a classified intent in process memory and in Redis."""
+        self._memoize_intent(query_lower, intent)
+        if self._cache:
+            await self._cache.set_model(
+                CacheService.generate_key("intent", query_lower),
+                intent,
+                ttl=self.INTENT_CACHE_TTL,
+            )
+
+    def _memoize_intent(self, query_lower: str, intent: QueryIntent) -> None:
+        """Keep a successfully parsed intent in the bounded in-process LRU."""
+        self._intent_memo[query_lower] = (time.monotonic() + self.INTENT_CACHE_TTL, intent)
+        self._intent_memo.move_to_end(query_lower)
+        if len(self._intent_memo) > self.INTENT_MEMO_SIZE:
+            self._intent_memo.popitem(last=False)
+
     def _extract_tickers(self, query: str) -> list[str]:
-        """Extract stock tickers from query."""
-        tickers: list[str] = []
+        """Extract stock tickers from query, preferably already lowercased."""
+        tickers: dict[str, None] = {}
 
-        explicit_tickers = self.TICKER_PATTERN.findall(query.upper())
-        tickers.extend(explicit_tickers)
+        pattern = (
+            self.COMPANY_PATTERN if self.DIGITS.isdisjoint(query) else self.TICKER_COMPANY_PATTERN
+        )
+        for match in pattern.finditer(query):
+            if match.lastgroup == "ticker":
+                tickers[match.group().upper()] = None
+            else:
+                tickers.update(dict.fromkeys(self.COMPANY_PATTERNS[match.group().lower()]))
 
-        query_lower = query.lower()
-        for company, company_tickers in self.COMPANY_PATTERNS.items():
-            if company in query_lower:
-                tickers.extend(company_tickers)
+        return list(tickers)
 
-        return list(set(tickers))
+    def _fallback_intent(self, tickers: list[str]) -> QueryIntent:
+        """Build the intent used when the LLM classification is unavailable."""
+        return self.FALLBACK_INTENT.model_copy(update={"tickers": tickers})
 
     def _parse_intent(
         self,
@@ -129,26 +236,32 @@ requires_news deve ser true se a pergunta envolve notícias recentes ou sentimen
         extracted_tickers: list[str],
     ) -> QueryIntent:
         """Parse LLM response into QueryIntent."""
+        intent = self._try_parse_intent(llm_response, extracted_tickers)
+        return intent if intent is not None else self._fallback_intent(extracted_tickers)
+
+    def _try_parse_intent(
+        self,
+        llm_response: str,
+        extracted_tickers: list[str],
+    ) -> QueryIntent | None:
+        """Parse LLM response into QueryIntent, or None if it cannot be parsed."""
         try:
-            json_match = re.search(r"\{[\s\S]*\}", llm_response)
-            if json_match:
+            try:
+                data = json.loads(llm_response)
+            except json.JSONDecodeError:
+                json_match = self.JSON_BLOCK_PATTERN.search(llm_response)
+                if not json_match:
+                    raise ValueError("No JSON found in response") from None
                 data = json.loads(json_match.group())
-            else:
-                raise ValueError("No JSON found in response")
+
+            if not isinstance(data, dict):
+                raise ValueError("Intent response is not a JSON object")
 
             intent_type_str = data.get("intent_type", "general")
-            intent_type_map = {
-                "financial_analysis": QueryIntentType.FINANCIAL_ANALYSIS,
-                "market_data": QueryIntentType.MARKET_DATA,
-                "news_sentiment": QueryIntentType.NEWS_SENTIMENT,
-                "document_search": QueryIntentType.DOCUMENT_SEARCH,
-                "comparison": QueryIntentType.COMPARISON,
-                "general": QueryIntentType.GENERAL,
-            }
-            intent_type = intent_type_map.get(intent_type_str, QueryIntentType.GENERAL)
+            intent_type = self.INTENT_TYPE_MAP.get(intent_type_str, QueryIntentType.GENERAL)
 
             llm_tickers = data.get("tickers", [])
-            all_tickers = list(set(extracted_tickers + llm_tickers))
+            all_tickers = list(dict.fromkeys([*extracted_tickers, *llm_tickers]))
 
             return QueryIntent(
                 intent_type=intent_type,
@@ -164,14 +277,7 @@ requires_news deve ser true se a pergunta envolve notícias recentes ou sentimen
                 confidence=data.get("confidence", 0.8),
             )
 
-        except (json.JSONDecodeError, KeyError) as e:
+        except (ValueError, KeyError) as e:
             self.logger.warning("intent_parse_error", error=str(e))
 
-            return QueryIntent(
-                intent_type=QueryIntentType.GENERAL,
-                tickers=extracted_tickers,
-                requires_rag=True,
-                requires_market_data=True,
-                requires_news=True,
-                confidence=0.5,
-            )
+            return None
@@ -3,9 +3,14 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.api.dependencies import close_services, init_services
-from src.api.middleware.error_handler import error_handler_middleware
+from src.api.middleware.error_handler import (
+    UnexpectedErrorMiddleware,
+    register_exception_handlers,
+)
 from src.api.middleware.logging import LoggingMiddleware
 from src.api.routes import (
     documents_router,
@@ -15,6 +20,9 @@ from src.api.routes import (
 )
 from src.config.logging import setup_logging
 from src.config.settings import get_settings
+from src.infrastructure.http import close_http_client
+
+GZIP_MINIMUM_SIZE = 1024
 
 
 @asynccontextmanager
@@ -23,11 +31,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     settings = get_settings()
     setup_logging(settings)
 
-    await init_services(settings)
+    app.state.services = await init_services(settings)
 
     yield
 
-    await close_services()
+    await close_services(app.state.services)
+    await close_http_client()
 
 
 def create_app() -> FastAPI:
@@ -56,10 +65,13 @@ def create_app() -> FastAPI:
         """,
         version="1.0.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs" if settings.is_development else None,
         redoc_url="/redoc" if settings.is_development else None,
     )
 
+    # Innermost, so error responses still pass through CORS and request logging.
+    app.add_middleware(UnexpectedErrorMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"] if settings.is_development else ["https://yourdomain.com"],
@@ -68,11 +80,10 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
     app.add_middleware(LoggingMiddleware)
 
-    @app.middleware("http")
-    async def error_handling(request, call_next):
-        return await error_handler_middleware(request, call_next)
+    register_exception_handlers(app)
 
     app.include_router(health_router)
     app.include_router(research_router)
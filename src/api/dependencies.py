@@ -1,135 +1,182 @@
-from typing import Any
+import asyncio
+from dataclasses import dataclass
+from functools import lru_cache
 
+from fastapi import Depends, Request
+
+from src.config.logging import get_logger
 from src.config.settings import Settings, get_settings
 from src.infrastructure.cache import CacheService
 from src.infrastructure.database import DatabaseService
 from src.infrastructure.vector_store import VectorStoreService
+from src.rag import registry
 from src.rag.chunker import DocumentChunker
 from src.rag.embeddings import EmbeddingService
 from src.rag.processor import DocumentProcessor
 from src.rag.retriever import RAGRetriever
+from src.tools.news import NewsTool
+from src.tools.yahoo_finance import YahooFinanceTool
 from src.workflows.graph import FinancialResearchWorkflow
 
-_services: dict[str, Any] = {}
+logger = get_logger("dependencies")
 
+SERVICE_LABELS = {
+    "database": "Database",
+    "cache": "Cache",
+    "vector_store": "Vector store",
+}
 
-async def init_services(settings: Settings) -> None:
-    """Initialize all services."""
-    global _services
+ConnectableService = DatabaseService | CacheService | VectorStoreService
 
-    try:
-        db = DatabaseService(settings)
-        await db.connect()
-        _services["database"] = db
-    except Exception as e:
-        print(f"Warning: Database initialization failed: {e}")
-        _services["database"] = None
 
-    try:
-        cache = CacheService(settings)
-        await cache.connect()
-        _services["cache"] = cache
-    except Exception as e:
-        print(f"Warning: Cache initialization failed: {e}")
-        _services["cache"] = None
+@dataclass(slots=True)
+class ServiceRegistry:
+    """Services shared by the API for the lifetime of the application."""
 
-    try:
-        vector_store = VectorStoreService(settings)
-        await vector_store.connect()
-        _services["vector_store"] = vector_store
-    except Exception as e:
-        print(f"Warning: Vector store initialization failed: {e}")
-        _services["vector_store"] = None
+    database: DatabaseService | None = None
+    cache: CacheService | None = None
+    vector_store: VectorStoreService | None = None
+    embedding_service: EmbeddingService | None = None
+    retriever: RAGRetriever | None = None
+    processor: DocumentProcessor | None = None
+    workflow: FinancialResearchWorkflow | None = None
+
+
+async def init_services(settings: Settings) -> ServiceRegistry:
+    """Initialize all services."""
+    services = ServiceRegistry()
+
+    connectable = {
+        "database": DatabaseService(settings),
+        "cache": CacheService(settings),
+        "vector_store": VectorStoreService(settings),
+    }
+    results = await asyncio.gather(
+        *(service.connect() for service in connectable.values()),
+        return_exceptions=True,
+    )
+    failed: dict[str, ConnectableService] = {}
+    for (name, service), result in zip(connectable.items(), results, strict=True):
+        if isinstance(result, Exception):
+            print(f"Warning: {SERVICE_LABELS[name]} initialization failed: {result}")
+            failed[name] = service
+        else:
+            setattr(services, name, service)
+
+    # A partial connect can leave a pool or client open behind the failure.
+    await _close_all(failed)
 
     try:
-        embedding_service = EmbeddingService(settings)
-        _services["embedding_service"] = embedding_service
+        services.embedding_service = registry.get_embedding_service(settings)
     except Exception as e:
         print(f"Warning: Embedding service initialization failed: {e}")
-        _services["embedding_service"] = None
 
-    if _services.get("embedding_service") and _services.get("vector_store"):
-        retriever = RAGRetriever(
-            settings,
-            _services["embedding_service"],
-            _services["vector_store"],
-        )
-        _services["retriever"] = retriever
+    if services.embedding_service and services.vector_store:
+        services.retriever = registry.get_retriever(settings, services.vector_store)
 
         chunker = DocumentChunker(settings)
-        processor = DocumentProcessor(
+        services.processor = DocumentProcessor(
             settings,
-            _services["embedding_service"],
-            _services["vector_store"],
+            services.embedding_service,
+            services.vector_store,
             chunker,
         )
-        _services["processor"] = processor
 
-    workflow = FinancialResearchWorkflow(
+    services.workflow = FinancialResearchWorkflow(
         settings,
-        _services.get("cache"),
-        _services.get("retriever"),
+        services.cache,
+        services.retriever,
     )
-    _services["workflow"] = workflow
+    return services
 
 
-async def close_services() -> None:
+async def close_services(services: ServiceRegistry) -> None:
     """Close all services."""
-    global _services
-
-    if _services.get("database"):
-        await _services["database"].close()
+    await _close_all(
+        {
+            name: service
+            for name in SERVICE_LABELS
+            if (service := getattr(services, name)) is not None
+        }
+    )
 
-    if _services.get("cache"):
-        await _services["cache"].close()
+    registry.clear_registry()
 
-    if _services.get("vector_store"):
-        await _services["vector_store"].close()
 
-    _services.clear()
+async def _close_all(services: dict[str, ConnectableService]) -> None:
+    """Close services concurrently, reporting failures without aborting the rest."""
+    results = await asyncio.gather(
+        *(service.close() for service in services.values()),
+        return_exceptions=True,
+    )
+    for name, result in zip(services, results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning("service_close_failed", service=name, error=str(result))
 
 
-async def get_services() -> dict[str, Any]:
+def get_services(request: Request) -> ServiceRegistry:
     """Get all services."""
-    return _services
+    state = request.app.state
+    if not hasattr(state, "services"):
+        state.services = ServiceRegistry()
+    return state.services
 
 
-async def get_database() -> DatabaseService | None:
+async def get_database(
+    services: ServiceRegistry = Depends(get_services),
+) -> DatabaseService | None:
     """Get database service."""
-    return _services.get("database")
+    return services.database
 
 
-async def get_cache() -> CacheService | None:
+async def get_cache(
+    services: ServiceRegistry = Depends(get_services),
+) -> CacheService | None:
     """Get cache service."""
-    return _services.get("cache")
+    return services.cache
 
 
-async def get_vector_store() -> VectorStoreService | None:
+async def get_vector_store(
+    services: ServiceRegistry = Depends(get_services),
+) -> VectorStoreService | None:
     """Get vector store service."""
-    return _services.get("vector_store")
+    return services.vector_store
 
 
-async def get_workflow() -> FinancialResearchWorkflow:
+async def get_workflow(
+    services: ServiceRegistry = Depends(get_services),
+) -> FinancialResearchWorkflow:
     """Get workflow instance."""
-    workflow = _services.get("workflow")
-    if not workflow:
-        settings = get_settings()
-        workflow = FinancialResearchWorkflow(settings)
-        _services["workflow"] = workflow
-    return workflow
+    if not services.workflow:
+        services.workflow = FinancialResearchWorkflow(get_settings())
+    return services.workflow
 
 
-async def get_document_processor() -> DocumentProcessor:
+async def get_document_processor(
+    services: ServiceRegistry = Depends(get_services),
+) -> DocumentProcessor:
     """Get document processor."""
-    processor = _services.get("processor")
-    if not processor:
+    if not services.processor:
         raise RuntimeError("Document processor not initialized")
-    return processor
+    return services.processor
 
 
-async def get_retriever() -> RAGRetriever:
+async def get_retriever(
+    services: ServiceRegistry = Depends(get_services),
+) -> RAGRetriever:
     """Get RAG retriever."""
-    retriever = _services.get("retriever")
-    if not retriever:
+    if not services.retriever:
         raise RuntimeError("RAG retriever not initialized")
-    return retriever
+    return services.retriever
+
+
+@lru_cache
+def get_yahoo_tool() -> YahooFinanceTool:
+    """Get the shared Yahoo Finance tool."""
+    return YahooFinanceTool()
+
+
+@lru_cache
+def get_news_tool() -> NewsTool:
+    """Get the shared news tool."""
+    return NewsTool(get_settings())
@@ -1,9 +1,13 @@
-from src.api.middleware.error_handler import error_handler_middleware
-from src.api.middleware.logging import logging_middleware
+from src.api.middleware.error_handler import (
+    UnexpectedErrorMiddleware,
+    register_exception_handlers,
+)
+from src.api.middleware.logging import LoggingMiddleware
 from src.api.middleware.rate_limit import RateLimitMiddleware
 
 __all__ = [
+    "LoggingMiddleware",
     "RateLimitMiddleware",
-    "error_handler_middleware",
-    "logging_middleware",
+    "UnexpectedErrorMiddleware",
+    "register_exception_handlers",
 ]
@@ -1,7 +1,9 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from typing import Any
 
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.config.logging import get_logger
 from src.core.exceptions import (
@@ -15,107 +17,153 @@ from src.core.exceptions import (
 logger = get_logger("error_handler")
 
 
-async def error_handler_middleware(
-    request: Request,
-    call_next: Callable,
-) -> Response:
-    """Middleware for handling exceptions and returning proper error responses."""
-    try:
-        return await call_next(request)
-
-    except ValidationError as e:
-        logger.warning(
-            "validation_error",
-            path=request.url.path,
-            error=str(e),
-        )
-        return JSONResponse(
-            status_code=400,
-            content={
-                "error": "VALIDATION_ERROR",
-                "message": e.message,
-                "details": e.details,
-            },
-        )
-
-    except RateLimitError as e:
-        logger.warning(
-            "rate_limit_exceeded",
-            path=request.url.path,
-        )
-        headers = {}
-        if e.retry_after:
-            headers["Retry-After"] = str(e.retry_after)
-
-        return JSONResponse(
-            status_code=429,
-            content={
-                "error": "RATE_LIMIT_EXCEEDED",
-                "message": e.message,
-                "details": e.details,
-            },
-            headers=headers,
-        )
-
-    except ExternalAPIError as e:
-        logger.error(
-            "external_api_error",
-            service=e.service,
-            status_code=e.status_code,
-            error=str(e),
-        )
-        return JSONResponse(
-            status_code=502,
-            content={
-                "error": "EXTERNAL_API_ERROR",
-                "message": "Failed to fetch data from external service",
-                "details": {"service": e.service},
-            },
-        )
-
-    except AgentError as e:
-        logger.error(
-            "agent_error",
-            agent=e.agent_name,
-            error=str(e),
-        )
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": "AGENT_ERROR",
-                "message": "An error occurred during processing",
-                "details": {"agent": e.agent_name},
-            },
-        )
-
-    except BaseApplicationError as e:
-        logger.error(
-            "application_error",
-            code=e.code,
-            error=str(e),
-        )
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": e.code,
-                "message": e.message,
-                "details": e.details,
-            },
-        )
-
-    except Exception as e:
-        request_id = getattr(request.state, "request_id", "unknown")
-        logger.exception(
-            "unhandled_exception",
-            request_id=request_id,
-            path=request.url.path,
-            error=str(e),
-        )
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": "INTERNAL_SERVER_ERROR",
-                "message": "An unexpected error occurred",
-                "request_id": request_id,
-            },
-        )
+async def _handle_validation_error(request: Request, e: ValidationError) -> Response:
+    logger.warning(
+        "validation_error",
+        path=request.url.path,
+        error=str(e),
+    )
+    return ORJSONResponse(
+        status_code=400,
+        content={
+            "error": "VALIDATION_ERROR",
+            "message": e.message,
+            "details": e.details,
+        },
+    )
+
+
+async def _handle_rate_limit_error(request: Request, e: RateLimitError) -> Response:
+    logger.warning(
+        "rate_limit_exceeded",
+        path=request.url.path,
+    )
+    headers = {}
+    if e.retry_after:
+        headers["Retry-After"] = str(e.retry_after)
+
+    return ORJSONResponse(
+        status_code=429,
+        content={
+            "error": "RATE_LIMIT_EXCEEDED",
+            "message": e.message,
+            "details": e.details,
+        },
+        headers=headers,
+    )
+
+
+async def _handle_external_api_error(_request: Request, e: ExternalAPIError) -> Response:
+    logger.error(
+        "external_api_error",
+        service=e.service,
+        status_code=e.status_code,
+        error=str(e),
+    )
+    return ORJSONResponse(
+        status_code=502,
+        content={
+            "error": "EXTERNAL_API_ERROR",
+            "message": "Failed to fetch data from external service",
+            "details": {"service": e.service},
+        },
+    )
+
+
+async def _handle_agent_error(_request: Request, e: AgentError) -> Response:
+    logger.error(
+        "agent_error",
+        agent=e.agent_name,
+        error=str(e),
+    )
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "error": "AGENT_ERROR",
+            "message": "An error occurred during processing",
+            "details": {"agent": e.agent_name},
+        },
+    )
+
+
+async def _handle_application_error(_request: Request, e: BaseApplicationError) -> Response:
+    logger.error(
+        "application_error",
+        code=e.code,
+        error=str(e),
+    )
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "error": e.code,
+            "message": e.message,
+            "details": e.details,
+        },
+    )
+
+
+async def _handle_unexpected_error(request: Request, e: Exception) -> Response:
+    request_id = getattr(request.state, "request_id", "unknown")
+    logger.exception(
+        "unhandled_exception",
+        request_id=request_id,
+        path=request.url.path,
+        error=str(e),
+    )
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "error": "INTERNAL_SERVER_ERROR",
+            "message": "An unexpected error occurred",
+            "request_id": request_id,
+        },
+    )
+
+
+# Handlers take their own exception subclass, which Callable cannot express per key.
+EXCEPTION_HANDLERS: dict[type[Exception], Callable[[Request, Any], Awaitable[Response]]] = {
+    ValidationError: _handle_validation_error,
+    RateLimitError: _handle_rate_limit_error,
+    ExternalAPIError: _handle_external_api_error,
+    AgentError: _handle_agent_error,
+    BaseApplicationError: _handle_application_error,
+}
+
+
+class UnexpectedErrorMiddleware:
+    """Turn unhandled exceptions into a JSON 500 response.
+
+    Starlette serves an ``Exception`` handler from its outermost layer, past CORS and
+    request logging, so unexpected errors are caught here instead; add this middleware
+    first so it sits inside the others.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking_start)
+        except Exception as e:
+            if response_started:
+                raise
+            response = await _handle_unexpected_error(Request(scope), e)
+            await response(scope, receive, send)
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """Register the application's error responses as exception handlers."""
+    for exc_type, handler in EXCEPTION_HANDLERS.items():
+        app.add_exception_handler(exc_type, handler)
@@ -1,92 +1,74 @@
 import time
 import uuid
-from collections.abc import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from structlog.contextvars import bound_contextvars
 
 from src.config.logging import get_logger
 
 logger = get_logger("api")
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """Middleware for request/response logging."""
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
-
-        start_time = time.perf_counter()
-
-        logger.info(
-            "request_started",
-            request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            client_ip=request.client.host if request.client else None,
-        )
-
-        try:
-            response = await call_next(request)
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = uuid.uuid4().hex
+        scope.setdefault("state", {})["request_id"] = request_id
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        status_code = 500
+
+        start_ns = time.monotonic_ns()
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Processing-Time-Ms"] = f"{duration_ms:.2f}"
+            await send(message)
+
+        with bound_contextvars(request_id=request_id):
             logger.info(
-                "request_completed",
-                request_id=request_id,
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
-                duration_ms=round(duration_ms, 2),
-            )
-
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Processing-Time-Ms"] = str(round(duration_ms, 2))
-
-            return response
-
-        except Exception as e:
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            logger.exception(
-                "request_failed",
-                request_id=request_id,
-                method=request.method,
-                path=request.url.path,
-                error=str(e),
-                duration_ms=round(duration_ms, 2),
+                "request_started",
+                method=method,
+                path=path,
+                client_ip=client[0] if client else None,
             )
-            raise
-
-
-async def logging_middleware(request: Request, call_next: Callable) -> Response:
-    """Functional middleware for logging."""
-    request_id = str(uuid.uuid4())
-    request.state.request_id = request_id
 
-    start_time = time.perf_counter()
+            try:
+                await self.app(scope, receive, send_with_headers)
 
-    logger.info(
-        "request_started",
-        request_id=request_id,
-        method=request.method,
-        path=request.url.path,
-    )
+            except Exception as e:
+                duration_ms = round((time.monotonic_ns() - start_ns) / 1_000_000, 2)
 
-    response = await call_next(request)
-    duration_ms = (time.perf_counter() - start_time) * 1000
+                logger.exception(
+                    "request_failed",
+                    method=method,
+                    path=path,
+                    error=str(e),
+                    duration_ms=duration_ms,
+                )
+                raise
 
-    logger.info(
-        "request_completed",
-        request_id=request_id,
-        status_code=response.status_code,
-        duration_ms=round(duration_ms, 2),
-    )
+            duration_ms = round((time.monotonic_ns() - start_ns) / 1_000_000, 2)
 
-    response.headers["X-Request-ID"] = request_id
-
-    return response
+            logger.info(
+                "request_completed",
+                method=method,
+                path=path,
+                status_code=status_code,
+                duration_ms=duration_ms,
+            )
@@ -1,8 +1,8 @@
-from collections.abc import Callable
+import re
 
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.config.logging import get_logger
 from src.infrastructure.cache import CacheService
@@ -10,33 +10,39 @@ from src.infrastructure.cache import CacheService
 logger = get_logger("rate_limit")
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """Middleware for rate limiting requests."""
 
     def __init__(
         self,
-        app: any,
+        app: ASGIApp,
         cache_service: CacheService,
         requests_per_minute: int = 60,
         exclude_paths: list[str] | None = None,
+        sliding_window: bool = False,
     ) -> None:
-        super().__init__(app)
-        self._cache = cache_service
+        self.app = app
+        self._check = (
+            cache_service.check_rate_limit_sliding
+            if sliding_window
+            else cache_service.check_rate_limit
+        )
         self._limit = requests_per_minute
         self._window = 60
-        self._exclude_paths = exclude_paths or ["/health", "/docs", "/openapi.json"]
+        paths = exclude_paths or ["/health", "/docs", "/openapi.json"]
+        self._exclude_paths = frozenset(paths)
+        self._exclude_prefixes = re.compile(
+            "(?:" + "|".join(re.escape(path.rstrip("/")) for path in paths) + ")/"
+        )
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
-        if request.url.path in self._exclude_paths:
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._is_excluded(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
-        identifier = self._get_identifier(request)
+        identifier = self._get_identifier(scope)
 
-        allowed, remaining = await self._cache.check_rate_limit(
+        allowed, remaining = await self._check(
             identifier=identifier,
             limit=self._limit,
             window=self._window,
@@ -46,9 +52,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             logger.warning(
                 "rate_limit_exceeded",
                 identifier=identifier,
-                path=request.url.path,
+                path=scope["path"],
             )
-            return JSONResponse(
+            response = ORJSONResponse(
                 status_code=429,
                 content={
                     "error": "RATE_LIMIT_EXCEEDED",
@@ -61,25 +67,36 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     "X-RateLimit-Remaining": "0",
                 },
             )
+            await response(scope, receive, send)
+            return
 
-        response = await call_next(request)
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(self._limit)
+                headers["X-RateLimit-Remaining"] = str(remaining)
+            await send(message)
 
-        response.headers["X-RateLimit-Limit"] = str(self._limit)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
+        await self.app(scope, receive, send_with_headers)
 
-        return response
+    def _is_excluded(self, path: str) -> bool:
+        """Check whether a path or one of its parents is excluded."""
+        return path in self._exclude_paths or self._exclude_prefixes.match(path) is not None
 
-    def _get_identifier(self, request: Request) -> str:
+    def _get_identifier(self, scope: Scope) -> str:
         """Get unique identifier for rate limiting."""
-        forwarded = request.headers.get("X-Forwarded-For")
+        headers = Headers(scope=scope)
+
+        forwarded = headers.get("X-Forwarded-For")
+        client = scope.get("client")
         if forwarded:
             client_ip = forwarded.split(",")[0].strip()
-        elif request.client:
-            client_ip = request.client.host
+        elif client:
+            client_ip = client[0]
         else:
             client_ip = "unknown"
 
-        api_key = request.headers.get("X-API-Key")
+        api_key = headers.get("X-API-Key")
         if api_key:
             return f"apikey:{api_key}"
 
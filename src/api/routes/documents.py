@@ -1,7 +1,8 @@
 from datetime import datetime
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+import orjson
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile
 
 from src.api.dependencies import get_document_processor
 from src.api.schemas.responses import DocumentResponse
@@ -10,6 +11,10 @@ from src.rag.processor import DocumentProcessor
 
 router = APIRouter(prefix="/documents", tags=["Documents"])
 
+DOCUMENT_TYPES_BODY = orjson.dumps(
+    {"types": [{"value": t.value, "name": t.name} for t in DocumentType]}
+)
+
 
 @router.post(
     "/upload",
@@ -59,8 +64,8 @@ async def upload_document(
     )
 
     try:
-        content = await file.read()
-        file_hash, chunks_created = await processor.process_pdf(content, metadata)
+        await file.seek(0)
+        file_hash, chunks_created = await processor.process_pdf(file.file, metadata)
 
         return DocumentResponse(
             document_id=document_id,
@@ -118,11 +123,6 @@ async def delete_document(
     summary="List Document Types",
     description="Get list of valid document types",
 )
-async def list_document_types() -> dict:
+async def list_document_types() -> Response:
     """List all valid document types."""
-    return {
-        "types": [
-            {"value": t.value, "name": t.name}
-            for t in DocumentType
-        ]
-    }
+    return Response(content=DOCUMENT_TYPES_BODY, media_type="application/json")
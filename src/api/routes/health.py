@@ -1,12 +1,16 @@
-from datetime import datetime
+import asyncio
 
 from fastapi import APIRouter, Depends
 
-from src.api.dependencies import get_services
+from src.api.dependencies import ServiceRegistry, get_services
 from src.api.schemas.responses import HealthResponse
+from src.core.clock import utc_now
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
+HEALTH_CHECKED_SERVICES = ("database", "cache", "vector_store")
+HEALTH_CHECK_TIMEOUT = 1.0
+
 
 @router.get(
     "",
@@ -15,27 +19,30 @@ router = APIRouter(prefix="/health", tags=["Health"])
     description="Check the health status of the API and its components",
 )
 async def health_check(
-    services: dict = Depends(get_services),
+    services: ServiceRegistry = Depends(get_services),
 ) -> HealthResponse:
     """Check health status of all services."""
-    components = {}
-
-    if services.get("database"):
-        components["database"] = await services["database"].health_check()
-
-    if services.get("cache"):
-        components["cache"] = await services["cache"].health_check()
-
-    if services.get("vector_store"):
-        components["vector_store"] = await services["vector_store"].health_check()
+    probes = {
+        name: service
+        for name in HEALTH_CHECKED_SERVICES
+        if (service := getattr(services, name)) is not None
+    }
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(service.health_check(), timeout=HEALTH_CHECK_TIMEOUT)
+            for service in probes.values()
+        ),
+        return_exceptions=True,
+    )
+    components = {name: result is True for name, result in zip(probes, results, strict=True)}
 
-    all_healthy = all(components.values()) if components else True
+    all_healthy = all(components.values())
     status = "healthy" if all_healthy else "degraded"
 
     return HealthResponse(
         status=status,
         version="1.0.0",
-        timestamp=datetime.utcnow(),
+        timestamp=utc_now(),
         components=components,
     )
 
@@ -46,14 +53,14 @@ async def health_check(
     description="Check if the service is ready to accept requests",
 )
 async def readiness_check(
-    services: dict = Depends(get_services),
+    services: ServiceRegistry = Depends(get_services),
 ) -> dict:
     """Check if service is ready."""
     ready = True
     checks = {}
 
-    if services.get("database"):
-        checks["database"] = await services["database"].health_check()
+    if services.database:
+        checks["database"] = await services.database.health_check()
         ready = ready and checks["database"]
 
     return {
@@ -1,11 +1,77 @@
-from fastapi import APIRouter, HTTPException, Query
-
-from src.api.schemas.responses import MarketDataResponse, NewsItemResponse
+import asyncio
+from collections.abc import AsyncIterator, Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import TypeAdapter
+
+from src.api.dependencies import get_cache, get_news_tool, get_yahoo_tool
+from src.api.schemas.responses import (
+    MarketDataResponse,
+    MarketSnapshotResponse,
+    NewsItemResponse,
+)
+from src.core.singleflight import SingleFlight
+from src.infrastructure.cache import CacheService
 from src.tools.news import NewsTool
 from src.tools.yahoo_finance import YahooFinanceTool
 
 router = APIRouter(prefix="/market", tags=["Market Data"])
 
+QUOTE_CACHE_TTL = 30
+MAX_QUOTE_TICKERS = 50
+NEWS_CACHE_TTL = 300
+HISTORY_PERIODS = ("1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max")
+VALID_HISTORY_PERIODS = frozenset(HISTORY_PERIODS)
+INVALID_PERIOD_DETAIL = f"Invalid period. Valid options: {', '.join(HISTORY_PERIODS)}"
+HISTORY_STREAM_BATCH_SIZE = 1000
+
+QUOTE_ADAPTER = TypeAdapter(MarketDataResponse)
+NEWS_ITEM_ADAPTER = TypeAdapter(NewsItemResponse)
+
+_quote_flights = SingleFlight()
+
+
+def _cache_key(*parts: str) -> str:
+    return CacheService.generate_key("market", *parts)
+
+
+def _json_response(body: bytes | str) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+async def _stream_json_array(
+    items: Iterable[Any],
+    adapter: TypeAdapter[Any],
+    cache: CacheService | None,
+    cache_key: str,
+    ttl: int,
+) -> AsyncIterator[bytes]:
+    """Encode items as a JSON array one at a time, caching the full body once sent."""
+    body = bytearray(b"[")
+    yield b"["
+    for index, item in enumerate(items):
+        chunk = (b"," if index else b"") + adapter.dump_json(item)
+        body += chunk
+        yield chunk
+    body += b"]"
+    yield b"]"
+
+    if cache:
+        await cache.set(cache_key, bytes(body), ttl=ttl)
+
+
+def _ndjson_lines(rows: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    """Encode records as newline-delimited JSON, one chunk per batch of rows."""
+    iterator = iter(rows)
+    while batch := list(islice(iterator, HISTORY_STREAM_BATCH_SIZE)):
+        yield b"".join(
+            orjson.dumps(row, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n" for row in batch
+        )
+
 
 @router.get(
     "/quote/{ticker}",
@@ -13,11 +79,20 @@ router = APIRouter(prefix="/market", tags=["Market Data"])
     summary="Get Stock Quote",
     description="Get current quote for a stock ticker",
 )
-async def get_quote(ticker: str) -> MarketDataResponse:
+async def get_quote(
+    ticker: str,
+    tool: YahooFinanceTool = Depends(get_yahoo_tool),
+    cache: CacheService | None = Depends(get_cache),
+) -> MarketDataResponse:
     """Get current stock quote."""
-    tool = YahooFinanceTool()
+    cache_key = _cache_key("quote", ticker.upper())
+    if cache and (cached := await cache.get_model(cache_key, MarketDataResponse)):
+        return cached
 
-    result = await tool.execute(action="quote", ticker=ticker)
+    result = await _quote_flights.do(
+        ticker.upper(),
+        lambda: tool.execute(action="quote", ticker=ticker),
+    )
 
     if not result.success:
         raise HTTPException(
@@ -25,20 +100,12 @@ async def get_quote(ticker: str) -> MarketDataResponse:
             detail=result.error or f"No data found for ticker {ticker}",
         )
 
-    data = result.data
-
-    return MarketDataResponse(
-        ticker=data.ticker,
-        company_name=data.company_name,
-        current_price=data.current_price,
-        change_percent=data.change_percent,
-        volume=data.volume,
-        market_cap=data.market_cap,
-        pe_ratio=data.pe_ratio,
-        dividend_yield=data.dividend_yield,
-        timestamp=data.timestamp,
-        additional_data=data.additional_data,
-    )
+    response = MarketDataResponse.from_domain(result.data)
+
+    if cache:
+        await cache.set_model(cache_key, response, ttl=QUOTE_CACHE_TTL)
+
+    return response
 
 
 @router.get(
@@ -48,10 +115,19 @@ async def get_quote(ticker: str) -> MarketDataResponse:
     description="Get quotes for multiple tickers",
 )
 async def get_quotes(
-    tickers: list[str] = Query(..., description="List of tickers"),
-) -> list[MarketDataResponse]:
+    tickers: list[str] = Query(
+        ...,
+        min_length=1,
+        max_length=MAX_QUOTE_TICKERS,
+        description="List of tickers",
+    ),
+    tool: YahooFinanceTool = Depends(get_yahoo_tool),
+    cache: CacheService | None = Depends(get_cache),
+) -> Response:
     """Get quotes for multiple tickers."""
-    tool = YahooFinanceTool()
+    cache_key = _cache_key("quotes", *(ticker.upper() for ticker in tickers))
+    if cache and (cached := await cache.get(cache_key)):
+        return _json_response(cached)
 
     result = await tool.execute(action="quotes", tickers=tickers)
 
@@ -61,42 +137,52 @@ async def get_quotes(
             detail=result.error or "Failed to fetch quotes",
         )
 
-    return [
-        MarketDataResponse(
-            ticker=data.ticker,
-            company_name=data.company_name,
-            current_price=data.current_price,
-            change_percent=data.change_percent,
-            volume=data.volume,
-            market_cap=data.market_cap,
-            pe_ratio=data.pe_ratio,
-            dividend_yield=data.dividend_yield,
-            timestamp=data.timestamp,
-            additional_data=data.additional_data,
-        )
-        for data in result.data
-    ]
+    return StreamingResponse(
+        _stream_json_array(
+            (MarketDataResponse.from_domain(data) for data in result.data),
+            QUOTE_ADAPTER,
+            cache,
+            cache_key,
+            QUOTE_CACHE_TTL,
+        ),
+        media_type="application/json",
+    )
 
 
 @router.get(
     "/history/{ticker}",
+    response_class=ORJSONResponse,
     summary="Get Price History",
     description="Get historical price data for a ticker",
 )
 async def get_history(
     ticker: str,
     period: str = Query(default="1mo", description="Period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y)"),
-) -> dict:
+    stream: bool = Query(default=False, description="Stream price rows as NDJSON"),
+    tool: YahooFinanceTool = Depends(get_yahoo_tool),
+    cache: CacheService | None = Depends(get_cache),
+) -> Response:
     """Get historical price data."""
-    valid_periods = ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"]
+    if period not in VALID_HISTORY_PERIODS:
+        raise HTTPException(status_code=400, detail=INVALID_PERIOD_DETAIL)
 
-    if period not in valid_periods:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid period. Valid options: {valid_periods}",
+    if stream:
+        result = await tool.execute(action="history_rows", ticker=ticker, period=period)
+
+        if not result.success:
+            raise HTTPException(
+                status_code=404,
+                detail=result.error or f"No history found for ticker {ticker}",
+            )
+
+        return StreamingResponse(
+            _ndjson_lines(result.data),
+            media_type="application/x-ndjson",
         )
 
-    tool = YahooFinanceTool()
+    cache_key = _cache_key("history", ticker.upper(), period)
+    if cache and (cached := await cache.get_json(cache_key)):
+        return ORJSONResponse(content=cached)
 
     result = await tool.execute(action="history", ticker=ticker, period=period)
 
@@ -106,17 +192,27 @@ async def get_history(
             detail=result.error or f"No history found for ticker {ticker}",
         )
 
-    return result.data
+    if cache:
+        await cache.set_json(cache_key, result.data)
+
+    return ORJSONResponse(content=result.data)
 
 
 @router.get(
     "/info/{ticker}",
+    response_class=ORJSONResponse,
     summary="Get Company Info",
     description="Get detailed company information",
 )
-async def get_company_info(ticker: str) -> dict:
+async def get_company_info(
+    ticker: str,
+    tool: YahooFinanceTool = Depends(get_yahoo_tool),
+    cache: CacheService | None = Depends(get_cache),
+) -> ORJSONResponse:
     """Get comprehensive company information."""
-    tool = YahooFinanceTool()
+    cache_key = _cache_key("info", ticker.upper())
+    if cache and (cached := await cache.get_json(cache_key)):
+        return ORJSONResponse(content=cached)
 
     result = await tool.execute(action="info", ticker=ticker)
 
@@ -126,7 +222,50 @@ async def get_company_info(ticker: str) -> dict:
             detail=result.error or f"No info found for ticker {ticker}",
         )
 
-    return result.data
+    if cache:
+        await cache.set_json(cache_key, result.data)
+
+    return ORJSONResponse(content=result.data)
+
+
+@router.get(
+    "/snapshot/{ticker}",
+    response_model=MarketSnapshotResponse,
+    summary="Get Ticker Snapshot",
+    description="Get quote, company info and recent news for a ticker in one call",
+)
+async def get_snapshot(
+    ticker: str,
+    yahoo_tool: YahooFinanceTool = Depends(get_yahoo_tool),
+    news_tool: NewsTool = Depends(get_news_tool),
+) -> MarketSnapshotResponse:
+    """Get quote, company info and news for a ticker concurrently."""
+    quote_result, info_result, news_result = await asyncio.gather(
+        yahoo_tool.execute(action="quote", ticker=ticker),
+        yahoo_tool.execute(action="info", ticker=ticker),
+        news_tool.execute(action="search", tickers=[ticker], days_back=1),
+    )
+
+    if not quote_result.success and not info_result.success:
+        raise HTTPException(
+            status_code=404,
+            detail=quote_result.error or f"No data found for ticker {ticker}",
+        )
+
+    quote = None
+    if quote_result.success:
+        quote = MarketDataResponse.from_domain(quote_result.data)
+
+    news = []
+    if news_result.success:
+        news = [NewsItemResponse.from_domain(item) for item in news_result.data]
+
+    return MarketSnapshotResponse(
+        ticker=ticker.upper(),
+        quote=quote,
+        info=info_result.data if info_result.success else None,
+        news=news,
+    )
 
 
 @router.get(
@@ -139,9 +278,18 @@ async def get_news(
     query: str | None = Query(default=None, description="Search query"),
     tickers: list[str] | None = Query(default=None, description="Filter by tickers"),
     days_back: int = Query(default=7, ge=1, le=30, description="Days to look back"),
-) -> list[NewsItemResponse]:
+    tool: NewsTool = Depends(get_news_tool),
+    cache: CacheService | None = Depends(get_cache),
+) -> Response:
     """Get financial news."""
-    tool = NewsTool()
+    cache_key = _cache_key(
+        "news",
+        query or "",
+        ",".join(ticker.upper() for ticker in tickers or []),
+        str(days_back),
+    )
+    if cache and (cached := await cache.get(cache_key)):
+        return _json_response(cached)
 
     result = await tool.execute(
         action="search",
@@ -156,17 +304,16 @@ async def get_news(
             detail=result.error or "Failed to fetch news",
         )
 
-    return [
-        NewsItemResponse(
-            title=item.title,
-            source=item.source,
-            url=item.url,
-            published_at=item.published_at,
-            summary=item.summary,
-            tickers=item.tickers,
-        )
-        for item in result.data
-    ]
+    return StreamingResponse(
+        _stream_json_array(
+            (NewsItemResponse.from_domain(item) for item in result.data),
+            NEWS_ITEM_ADAPTER,
+            cache,
+            cache_key,
+            NEWS_CACHE_TTL,
+        ),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -175,23 +322,27 @@ async def get_news(
     summary="Get Headlines",
     description="Get top business headlines",
 )
-async def get_headlines() -> list[NewsItemResponse]:
+async def get_headlines(
+    tool: NewsTool = Depends(get_news_tool),
+    cache: CacheService | None = Depends(get_cache),
+) -> Response:
     """Get top business headlines."""
-    tool = NewsTool()
+    cache_key = _cache_key("headlines", "business")
+    if cache and (cached := await cache.get(cache_key)):
+        return _json_response(cached)
 
     result = await tool.execute(action="headlines", category="business")
 
     if not result.success:
-        return []
-
-    return [
-        NewsItemResponse(
-            title=item.title,
-            source=item.source,
-            url=item.url,
-            published_at=item.published_at,
-            summary=item.summary,
-            tickers=item.tickers,
-        )
-        for item in result.data
-    ]
+        return _json_response(b"[]")
+
+    return StreamingResponse(
+        _stream_json_array(
+            (NewsItemResponse.from_domain(item) for item in result.data),
+            NEWS_ITEM_ADAPTER,
+            cache,
+            cache_key,
+            NEWS_CACHE_TTL,
+        ),
+        media_type="application/json",
+    )
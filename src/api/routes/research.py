@@ -1,4 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+import zlib
+from collections.abc import AsyncIterator
+
+import orjson
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import Response, StreamingResponse
 
 from src.api.dependencies import get_workflow
 from src.api.schemas.requests import QueryRequest
@@ -7,6 +12,39 @@ from src.workflows.graph import FinancialResearchWorkflow
 
 router = APIRouter(prefix="/research", tags=["Research"])
 
+WORKFLOW_STRUCTURE_BODY = orjson.dumps(FinancialResearchWorkflow.GRAPH_VISUALIZATION)
+
+
+def _sse_event(payload: dict) -> bytes:
+    """Encode a payload as a server-sent event frame."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+async def _gzip_events(events: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Gzip an event stream, sync-flushing so each event reaches the client at once."""
+    compressor = zlib.compressobj(wbits=31)
+    async for event in events:
+        yield compressor.compress(event) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Check whether an Accept-Encoding header lists gzip with a non-zero q-value."""
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() not in ("gzip", "x-gzip"):
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        return quality > 0
+    return False
+
 
 @router.post(
     "/query",
@@ -19,41 +57,34 @@ async def submit_query(
     workflow: FinancialResearchWorkflow = Depends(get_workflow),
 ) -> QueryResponse:
     """Process a financial research query."""
-    try:
-        response = await workflow.run(
-            query=request.query,
-            user_id=request.user_id,
-        )
+    response = await workflow.run(
+        query=request.query,
+        user_id=request.user_id,
+    )
 
-        analysis_response = None
-        if response.analysis:
-            analysis_response = AnalysisResultResponse(
-                summary=response.analysis.summary,
-                key_findings=response.analysis.key_findings,
-                financial_metrics=response.analysis.financial_metrics,
-                risks=response.analysis.risks,
-                opportunities=response.analysis.opportunities,
-                sentiment=response.analysis.sentiment,
-                confidence_score=response.analysis.confidence_score,
-            )
-
-        return QueryResponse(
-            response_id=response.response_id,
-            query_id=response.query_id,
-            content=response.content,
-            format=response.format,
-            analysis=analysis_response,
-            sources=response.sources,
-            disclaimers=response.disclaimers,
-            processing_time_ms=response.processing_time_ms,
-            timestamp=response.timestamp,
+    analysis_response = None
+    if response.analysis:
+        analysis_response = AnalysisResultResponse(
+            summary=response.analysis.summary,
+            key_findings=response.analysis.key_findings,
+            financial_metrics=response.analysis.financial_metrics,
+            risks=response.analysis.risks,
+            opportunities=response.analysis.opportunities,
+            sentiment=response.analysis.sentiment,
+            confidence_score=response.analysis.confidence_score,
         )
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to process query: {str(e)}",
-        )
+    return QueryResponse(
+        response_id=response.response_id,
+        query_id=response.query_id,
+        content=response.content,
+        format=response.format,
+        analysis=analysis_response,
+        sources=response.sources,
+        disclaimers=response.disclaimers,
+        processing_time_ms=response.processing_time_ms,
+        timestamp=response.timestamp,
+    )
 
 
 @router.post(
@@ -64,38 +95,28 @@ async def submit_query(
 async def submit_query_stream(
     request: QueryRequest,
     workflow: FinancialResearchWorkflow = Depends(get_workflow),
+    accept_encoding: str = Header(default=""),
 ):
     """Process query with streaming response."""
-    from fastapi.responses import StreamingResponse
 
     async def generate():
         try:
-            response, state = await workflow.run_with_state(
+            async for event_type, payload in workflow.run_events(
                 query=request.query,
                 user_id=request.user_id,
-            )
-
-            import json
-
-            yield f"data: {json.dumps({'type': 'start', 'query_id': response.query_id})}\n\n"
-
-            completed_agents = state.get("completed_agents", [])
-            for agent in completed_agents:
-                yield f"data: {json.dumps({'type': 'agent_complete', 'agent': agent})}\n\n"
-
-            yield f"data: {json.dumps({'type': 'content', 'content': response.content})}\n\n"
-
-            yield f"data: {json.dumps({'type': 'done', 'processing_time_ms': response.processing_time_ms})}\n\n"
+            ):
+                yield _sse_event({"type": event_type, **payload})
 
         except Exception as e:
-            import json
+            yield _sse_event({"type": "error", "message": str(e)})
 
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+    events = generate()
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    if _accepts_gzip(accept_encoding):
+        events = _gzip_events(events)
+        headers.update({"Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
 
-    return StreamingResponse(
-        generate(),
-        media_type="text/event-stream",
-    )
+    return StreamingResponse(events, media_type="text/event-stream", headers=headers)
 
 
 @router.get(
@@ -103,8 +124,6 @@ async def submit_query_stream(
     summary="Get Workflow Structure",
     description="Get the structure of the research workflow",
 )
-async def get_workflow_structure(
-    workflow: FinancialResearchWorkflow = Depends(get_workflow),
-) -> dict:
+async def get_workflow_structure() -> Response:
     """Get workflow graph visualization data."""
-    return workflow.get_graph_visualization()
+    return Response(content=WORKFLOW_STRUCTURE_BODY, media_type="application/json")
@@ -3,13 +3,16 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from src.core.clock import utc_now
+from src.core.types import MarketData, NewsItem
+
 
 class HealthResponse(BaseModel):
     """Response schema for health check."""
 
     status: str = Field(..., description="Service status")
     version: str = Field(..., description="API version")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
     components: dict[str, bool] = Field(
         default_factory=dict,
         description="Health status of individual components",
@@ -66,7 +69,7 @@ class QueryResponse(BaseModel):
         default=0.0,
         description="Processing time in milliseconds",
     )
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
 
 
 class DocumentResponse(BaseModel):
@@ -96,6 +99,11 @@ class MarketDataResponse(BaseModel):
     timestamp: datetime
     additional_data: dict[str, Any] = Field(default_factory=dict)
 
+    @classmethod
+    def from_domain(cls, data: MarketData) -> "MarketDataResponse":
+        """Build a response from already-validated market data."""
+        return cls.model_construct(**{name: getattr(data, name) for name in cls.model_fields})
+
 
 class NewsItemResponse(BaseModel):
     """Response schema for news items."""
@@ -107,6 +115,20 @@ class NewsItemResponse(BaseModel):
     summary: str | None
     tickers: list[str]
 
+    @classmethod
+    def from_domain(cls, item: NewsItem) -> "NewsItemResponse":
+        """Build a response from an already-validated news item."""
+        return cls.model_construct(**{name: getattr(item, name) for name in cls.model_fields})
+
+
+class MarketSnapshotResponse(BaseModel):
+    """Response schema for a combined ticker snapshot."""
+
+    ticker: str
+    quote: MarketDataResponse | None = None
+    info: dict[str, Any] | None = None
+    news: list[NewsItemResponse] = Field(default_factory=list)
+
 
 class PaginatedResponse(BaseModel):
     """Generic paginated response."""
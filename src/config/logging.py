@@ -3,7 +3,7 @@ import sys
 from typing import Any
 
 import structlog
-from structlog.types import Processor
+from structlog.types import FilteringBoundLogger, Processor
 
 from src.config.settings import Settings
 
@@ -14,7 +14,6 @@ def setup_logging(settings: Settings) -> None:
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
-        structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.UnicodeDecoder(),
@@ -31,6 +30,9 @@ def setup_logging(settings: Settings) -> None:
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelNamesMapping()[settings.log_level]
+        ),
         cache_logger_on_first_use=True,
     )
 
@@ -56,7 +58,7 @@ def setup_logging(settings: Settings) -> None:
         logger.propagate = True
 
 
-def get_logger(name: str) -> structlog.stdlib.BoundLogger:
+def get_logger(name: str) -> FilteringBoundLogger:
     """Get a structured logger instance."""
     return structlog.get_logger(name)
 
@@ -65,7 +67,7 @@ class LoggerMixin:
     """Mixin class that provides a logger property."""
 
     @property
-    def logger(self) -> structlog.stdlib.BoundLogger:
+    def logger(self) -> FilteringBoundLogger:
         return get_logger(self.__class__.__name__)
 
     def log_operation(
@@ -13,6 +13,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     app_name: str = Field(default="financial-research-agent")
@@ -31,6 +32,7 @@ class Settings(BaseSettings):
 
     qdrant_host: str = Field(default="localhost")
     qdrant_port: int = Field(default=6333)
+    qdrant_grpc_port: int = Field(default=6334)
     qdrant_collection_name: str = Field(default="financial_documents")
     qdrant_vector_size: int = Field(default=1536)
 
@@ -47,12 +49,17 @@ class Settings(BaseSettings):
     embedding_model: str = Field(default="text-embedding-3-small")
 
     news_api_key: SecretStr | None = Field(default=None)
+    max_concurrent_requests: int = Field(default=10)
 
     rag_chunk_size: int = Field(default=512)
     rag_chunk_overlap: int = Field(default=50)
     rag_top_k: int = Field(default=10)
     rag_rerank_top_k: int = Field(default=5)
 
+    semantic_cache_enabled: bool = Field(default=True)
+    semantic_cache_threshold: float = Field(default=0.95)
+    semantic_cache_ttl: int = Field(default=900)
+
     rate_limit_requests: int = Field(default=100)
     rate_limit_window: int = Field(default=60)
 
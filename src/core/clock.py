@@ -0,0 +1,6 @@
+from datetime import UTC, datetime
+
+
+def utc_now() -> datetime:
+    """Get the current timezone-aware UTC time."""
+    return datetime.now(UTC)
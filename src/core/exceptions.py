@@ -4,6 +4,8 @@ from typing import Any
 class BaseApplicationError(Exception):
     """Base exception for all application errors."""
 
+    __slots__ = ("message", "code", "details")
+
     def __init__(
         self,
         message: str,
@@ -26,12 +28,14 @@ class BaseApplicationError(Exception):
 class ValidationError(BaseApplicationError):
     """Raised when input validation fails."""
 
-    pass
+    __slots__ = ()
 
 
 class ExternalAPIError(BaseApplicationError):
     """Raised when an external API call fails."""
 
+    __slots__ = ("service", "status_code")
+
     def __init__(
         self,
         message: str,
@@ -50,6 +54,8 @@ class ExternalAPIError(BaseApplicationError):
 class DataCollectionError(BaseApplicationError):
     """Raised when data collection fails."""
 
+    __slots__ = ("source",)
+
     def __init__(
         self,
         message: str,
@@ -64,6 +70,8 @@ class DataCollectionError(BaseApplicationError):
 class DocumentProcessingError(BaseApplicationError):
     """Raised when document processing fails."""
 
+    __slots__ = ("document_id",)
+
     def __init__(
         self,
         message: str,
@@ -79,12 +87,14 @@ class DocumentProcessingError(BaseApplicationError):
 class RAGError(BaseApplicationError):
     """Raised when RAG operations fail."""
 
-    pass
+    __slots__ = ()
 
 
 class AgentError(BaseApplicationError):
     """Raised when an agent encounters an error."""
 
+    __slots__ = ("agent_name",)
+
     def __init__(
         self,
         message: str,
@@ -99,18 +109,20 @@ class AgentError(BaseApplicationError):
 class DatabaseError(BaseApplicationError):
     """Raised when database operations fail."""
 
-    pass
+    __slots__ = ()
 
 
 class CacheError(BaseApplicationError):
     """Raised when cache operations fail."""
 
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(BaseApplicationError):
     """Raised when rate limit is exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
@@ -1,8 +1,11 @@
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any, TypedDict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.core.clock import utc_now
 
 
 class DocumentType(str, Enum):
@@ -42,7 +45,7 @@ class MarketData(BaseModel):
     beta: float | None = None
     sector: str | None = None
     industry: str | None = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
     additional_data: dict[str, Any] = Field(default_factory=dict)
 
 
@@ -67,7 +70,7 @@ class DocumentMetadata(BaseModel):
     ticker: str
     document_type: DocumentType
     reference_date: datetime
-    upload_date: datetime = Field(default_factory=datetime.utcnow)
+    upload_date: datetime = Field(default_factory=utc_now)
     source_url: str | None = None
     file_hash: str | None = None
     page_count: int | None = None
@@ -85,10 +88,17 @@ class DocumentChunk(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
     embedding: list[float] | None = None
 
+    @cached_property
+    def preview(self) -> str:
+        """Leading excerpt of the content, computed once per chunk."""
+        return self.content[:500]
+
 
 class QueryIntent(BaseModel):
     """Analyzed intent from user query."""
 
+    model_config = ConfigDict(frozen=True)
+
     intent_type: QueryIntentType
     entities: dict[str, Any] = Field(default_factory=dict)
     tickers: list[str] = Field(default_factory=list)
@@ -106,7 +116,7 @@ class ResearchQuery(BaseModel):
     raw_query: str
     intent: QueryIntent | None = None
     user_id: str | None = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
 
 
 class CollectedData(BaseModel):
@@ -116,7 +126,7 @@ class CollectedData(BaseModel):
     news_items: list[NewsItem] = Field(default_factory=list)
     raw_data: dict[str, Any] = Field(default_factory=dict)
     sources: list[str] = Field(default_factory=list)
-    collection_timestamp: datetime = Field(default_factory=datetime.utcnow)
+    collection_timestamp: datetime = Field(default_factory=utc_now)
 
 
 class RAGContext(BaseModel):
@@ -153,7 +163,7 @@ class ResearchResponse(BaseModel):
     disclaimers: list[str] = Field(default_factory=list)
     tokens_used: int = 0
     processing_time_ms: float = 0.0
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
 
 
 class AgentState(TypedDict, total=False):
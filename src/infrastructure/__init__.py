@@ -1,10 +1,12 @@
 from src.infrastructure.cache import CacheService, get_cache_service
 from src.infrastructure.database import DatabaseService, get_database_service
+from src.infrastructure.semantic_cache import SemanticCache
 from src.infrastructure.vector_store import VectorStoreService, get_vector_store_service
 
 __all__ = [
     "CacheService",
     "DatabaseService",
+    "SemanticCache",
     "VectorStoreService",
     "get_cache_service",
     "get_database_service",
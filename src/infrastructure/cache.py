@@ -1,9 +1,16 @@
-import hashlib
-import json
+import asyncio
+import builtins
+import time
+from functools import lru_cache
 from typing import Any, TypeVar
+from uuid import uuid4
 
+import msgspec
+import numpy as np
 import redis.asyncio as redis
+import xxhash
 from pydantic import BaseModel
+from redis.commands.core import AsyncScript
 
 from src.config.logging import LoggerMixin
 from src.config.settings import Settings
@@ -11,21 +18,70 @@ from src.config.settings import Settings
 T = TypeVar("T", bound=BaseModel)
 
 
+def _encode_fallback(value: Any) -> Any:
+    """Encode values MessagePack has no native type for, such as numpy scalars."""
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+@lru_cache
+def _msgpack_decoder(value_type: Any = Any) -> msgspec.msgpack.Decoder:
+    """Get the MessagePack decoder for a type, built once per type."""
+    return msgspec.msgpack.Decoder(value_type)
+
+
+MSGPACK_ENCODER = msgspec.msgpack.Encoder(enc_hook=_encode_fallback)
+MSGPACK_DECODER = _msgpack_decoder()
+
+DELETE_BATCH_SIZE = 500
+
+RATE_LIMIT_SCRIPT = """
+local current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[1])
+end
+local limit = tonumber(ARGV[2])
+if current > limit then
+    return {0, 0, redis.call('PTTL', KEYS[1])}
+end
+return {1, limit - current, 0}
+"""
+
+SLIDING_RATE_LIMIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count >= limit then
+    return {0, 0}
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], window)
+return {1, limit - count - 1}
+"""
+
+
 class CacheService(LoggerMixin):
     """Redis cache service for caching API responses and computed data."""
 
+    # Expired local rate-limit blocks are swept once this many identifiers are tracked.
+    BLOCKED_PRUNE_THRESHOLD = 1024
+
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
         self._client: redis.Redis | None = None
         self._default_ttl = settings.redis_cache_ttl
+        self._rate_limit_script: AsyncScript | None = None
+        self._sliding_rate_limit_script: AsyncScript | None = None
+        self._blocked_until: dict[str, float] = {}
 
     async def connect(self) -> None:
         """Connect to Redis."""
-        self._client = redis.from_url(
-            self._settings.redis_url,
-            encoding="utf-8",
-            decode_responses=True,
-        )
+        self._client = redis.from_url(self._settings.redis_url)
+        self._rate_limit_script = self._client.register_script(RATE_LIMIT_SCRIPT)
+        self._sliding_rate_limit_script = self._client.register_script(SLIDING_RATE_LIMIT_SCRIPT)
         self.logger.info("cache_connected")
 
     async def close(self) -> None:
@@ -40,13 +96,29 @@ class CacheService(LoggerMixin):
             raise RuntimeError("Cache not connected. Call connect() first.")
         return self._client
 
+    @property
+    def rate_limit_script(self) -> AsyncScript:
+        if self._rate_limit_script is None:
+            raise RuntimeError("Cache not connected. Call connect() first.")
+        return self._rate_limit_script
+
+    @property
+    def sliding_rate_limit_script(self) -> AsyncScript:
+        if self._sliding_rate_limit_script is None:
+            raise RuntimeError("Cache not connected. Call connect() first.")
+        return self._sliding_rate_limit_script
+
     @staticmethod
     def generate_key(*parts: str) -> str:
         """Generate a cache key from parts."""
-        key_string = ":".join(str(p) for p in parts)
-        return f"fra:{hashlib.md5(key_string.encode()).hexdigest()}"
+        # Most keys are a (namespace, id) pair of plain strings; skip the generic join.
+        if len(parts) == 2 and type(parts[0]) is str and type(parts[1]) is str:
+            key_string = parts[0] + ":" + parts[1]
+        else:
+            key_string = ":".join(str(p) for p in parts)
+        return f"fra:{xxhash.xxh3_64_hexdigest(key_string.encode())}"
 
-    async def get(self, key: str) -> str | None:
+    async def get(self, key: str) -> bytes | None:
         """Get a value from cache."""
         try:
             return await self.client.get(key)
@@ -55,29 +127,60 @@ class CacheService(LoggerMixin):
             return None
 
     async def get_json(self, key: str) -> dict[str, Any] | None:
-        """Get a JSON value from cache."""
+        """Get a structured value from cache."""
         value = await self.get(key)
         if value:
             try:
-                return json.loads(value)
-            except json.JSONDecodeError:
+                return MSGPACK_DECODER.decode(value)
+            except msgspec.DecodeError:
                 return None
         return None
 
     async def get_model(self, key: str, model_class: type[T]) -> T | None:
         """Get a Pydantic model from cache."""
-        data = await self.get_json(key)
-        if data:
+        value = await self.get(key)
+        if value:
             try:
-                return model_class.model_validate(data)
+                return model_class.model_validate_json(value)
             except Exception:
                 return None
         return None
 
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        """Get several values from cache in a single round trip."""
+        if not keys:
+            return []
+        try:
+            return await self.client.mget(keys)
+        except Exception as e:
+            self.logger.warning("cache_get_many_error", count=len(keys), error=str(e))
+            return [None] * len(keys)
+
+    async def get_json_many(self, keys: list[str], value_type: Any = Any) -> list[Any | None]:
+        """Get several structured values in one round trip, decoded as value_type."""
+        decoder = _msgpack_decoder(value_type)
+        values: list[Any | None] = []
+        for raw in await self.get_many(keys):
+            try:
+                values.append(decoder.decode(raw) if raw else None)
+            except msgspec.DecodeError:
+                values.append(None)
+        return values
+
+    async def get_models_many(self, keys: list[str], model_class: type[T]) -> list[T | None]:
+        """Get several Pydantic models from cache in a single round trip."""
+        models: list[T | None] = []
+        for value in await self.get_many(keys):
+            try:
+                models.append(model_class.model_validate_json(value) if value else None)
+            except Exception:
+                models.append(None)
+        return models
+
     async def set(
         self,
         key: str,
-        value: str,
+        value: str | bytes,
         ttl: int | None = None,
     ) -> bool:
         """Set a value in cache."""
@@ -88,14 +191,32 @@ class CacheService(LoggerMixin):
             self.logger.warning("cache_set_error", key=key, error=str(e))
             return False
 
+    async def set_many(
+        self,
+        mapping: dict[str, str | bytes],
+        ttl: int | None = None,
+    ) -> bool:
+        """Set several values with a shared TTL in a single pipelined round trip."""
+        if not mapping:
+            return True
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.setex(key, ttl or self._default_ttl, value)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            self.logger.warning("cache_set_many_error", count=len(mapping), error=str(e))
+            return False
+
     async def set_json(
         self,
         key: str,
         value: dict[str, Any] | list[Any],
         ttl: int | None = None,
     ) -> bool:
-        """Set a JSON value in cache."""
-        return await self.set(key, json.dumps(value, default=str), ttl)
+        """Set a structured value in cache, stored as MessagePack."""
+        return await self.set(key, MSGPACK_ENCODER.encode(value), ttl)
 
     async def set_model(
         self,
@@ -104,7 +225,7 @@ class CacheService(LoggerMixin):
         ttl: int | None = None,
     ) -> bool:
         """Set a Pydantic model in cache."""
-        return await self.set_json(key, model.model_dump(mode="json"), ttl)
+        return await self.set(key, model.model_dump_json(), ttl)
 
     async def delete(self, key: str) -> bool:
         """Delete a key from cache."""
@@ -118,16 +239,60 @@ class CacheService(LoggerMixin):
     async def delete_pattern(self, pattern: str) -> int:
         """Delete all keys matching a pattern."""
         try:
-            keys = []
-            async for key in self.client.scan_iter(f"fra:{pattern}*"):
-                keys.append(key)
-            if keys:
-                return await self.client.delete(*keys)
-            return 0
+            deleted = 0
+            batch: list[bytes] = []
+            async for key in self.client.scan_iter(f"fra:{pattern}*", count=DELETE_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= DELETE_BATCH_SIZE:
+                    deleted += await self.client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                deleted += await self.client.unlink(*batch)
+            return deleted
         except Exception as e:
             self.logger.warning("cache_delete_pattern_error", pattern=pattern, error=str(e))
             return 0
 
+    async def add_to_sets(
+        self,
+        keys: list[str],
+        *members: str,
+        ttl: int | None = None,
+    ) -> bool:
+        """Add members to several sets and refresh their expiry in one round trip."""
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.sadd(key, *members)
+                    pipe.expire(key, ttl or self._default_ttl)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            self.logger.warning("cache_add_to_sets_error", count=len(keys), error=str(e))
+            return False
+
+    async def get_set_union(self, keys: list[str]) -> builtins.set[str]:
+        """Get the members of the union of several sets."""
+        if not keys:
+            return set()
+        try:
+            return {member.decode() for member in await self.client.sunion(keys)}
+        except Exception as e:
+            self.logger.warning("cache_get_set_union_error", count=len(keys), error=str(e))
+            return set()
+
+    async def remove_from_sets(self, keys: list[str], *members: str) -> bool:
+        """Remove members from several sets in one round trip."""
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.srem(key, *members)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            self.logger.warning("cache_remove_from_sets_error", count=len(keys), error=str(e))
+            return False
+
     async def increment(self, key: str, amount: int = 1) -> int:
         """Increment a counter."""
         try:
@@ -143,17 +308,56 @@ class CacheService(LoggerMixin):
         window: int,
     ) -> tuple[bool, int]:
         """Check if rate limit is exceeded."""
+        blocked_until = self._blocked_until.get(identifier)
+        if blocked_until is not None:
+            if time.monotonic() < blocked_until:
+                return False, 0
+            del self._blocked_until[identifier]
+
         key = f"fra:ratelimit:{identifier}"
+        # Resolved outside the try so an unconnected cache is not logged as a Redis error.
+        script = self.rate_limit_script
         try:
-            current = await self.client.get(key)
-            if current is None:
-                await self.client.setex(key, window, 1)
-                return True, limit - 1
-            current_int = int(current)
-            if current_int >= limit:
+            allowed, remaining, ttl_ms = await script(
+                keys=[key],
+                args=[window * 1000, limit],
+            )
+            if not allowed:
+                self._block_locally(identifier, max(ttl_ms, 0) / 1000)
                 return False, 0
-            await self.client.incr(key)
-            return True, limit - current_int - 1
+            return True, remaining
+        except Exception as e:
+            self.logger.warning("rate_limit_check_error", error=str(e))
+            return True, limit
+
+    def _block_locally(self, identifier: str, seconds: float) -> None:
+        """Remember a blocked identifier, sweeping expired blocks as the map grows."""
+        now = time.monotonic()
+        if len(self._blocked_until) >= self.BLOCKED_PRUNE_THRESHOLD:
+            self._blocked_until = {
+                key: until for key, until in self._blocked_until.items() if until > now
+            }
+        self._blocked_until[identifier] = now + seconds
+
+    async def check_rate_limit_sliding(
+        self,
+        identifier: str,
+        limit: int,
+        window: int,
+    ) -> tuple[bool, int]:
+        """Check a rolling-window rate limit.
+
+        Exact at window boundaries, unlike check_rate_limit, but each caller keeps up
+        to `limit` entries in a sorted set, so prefer the fixed window for large limits.
+        """
+        key = f"fra:ratelimit:sliding:{identifier}"
+        script = self.sliding_rate_limit_script
+        try:
+            allowed, remaining = await script(
+                keys=[key],
+                args=[int(time.time() * 1000), window * 1000, limit, uuid4().hex],
+            )
+            return bool(allowed), remaining
         except Exception as e:
             self.logger.warning("rate_limit_check_error", error=str(e))
             return True, limit
@@ -169,16 +373,20 @@ class CacheService(LoggerMixin):
 
 
 _cache_service: CacheService | None = None
+_cache_service_lock = asyncio.Lock()
 
 
 async def get_cache_service(settings: Settings | None = None) -> CacheService:
     """Get or create the cache service singleton."""
     global _cache_service
     if _cache_service is None:
-        if settings is None:
-            from src.config.settings import get_settings
+        async with _cache_service_lock:
+            if _cache_service is None:
+                if settings is None:
+                    from src.config.settings import get_settings
 
-            settings = get_settings()
-        _cache_service = CacheService(settings)
-        await _cache_service.connect()
+                    settings = get_settings()
+                service = CacheService(settings)
+                await service.connect()
+                _cache_service = service
     return _cache_service
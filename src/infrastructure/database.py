@@ -1,18 +1,61 @@
-import json
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
 from collections.abc import AsyncGenerator
 
 import asyncpg
+import orjson
 
 from src.config.logging import LoggerMixin
 from src.config.settings import Settings
 
+# Binary jsonb values carry a one-byte format version ahead of the JSON text.
+JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    """Serialize a value to the binary jsonb wire format."""
+    return JSONB_VERSION + orjson.dumps(value)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    """Deserialize a value from the binary jsonb wire format."""
+    return orjson.loads(data[1:])
+
 
 class DatabaseService(LoggerMixin):
     """PostgreSQL database service using asyncpg directly."""
 
+    # asyncpg prepares every parameterized query on first use and reuses it per connection.
+    STATEMENT_CACHE_SIZE = 1024
+
+    DOCUMENT_COLUMNS = (
+        "id, company, ticker, document_type, reference_date, "
+        "source_url, file_hash, page_count, language, created_at"
+    )
+    DOCUMENT_COLUMNS_FULL = f"{DOCUMENT_COLUMNS}, metadata, updated_at"
+    QUERY_HISTORY_COLUMNS = (
+        "id, query_text, intent_type, tickers, tokens_used, "
+        "processing_time_ms, user_id, metadata, created_at"
+    )
+    QUERY_HISTORY_COLUMNS_FULL = f"{QUERY_HISTORY_COLUMNS}, response_summary"
+
+    INSERT_DOCUMENT_SQL = """
+        INSERT INTO documents (
+            id, company, ticker, document_type, reference_date,
+            source_url, file_hash, page_count, metadata
+        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+        ON CONFLICT (file_hash) DO NOTHING
+    """
+
+    INSERT_QUERY_HISTORY_SQL = """
+        INSERT INTO query_history (
+            id, query_text, intent_type, tickers, response_summary,
+            tokens_used, processing_time_ms, user_id, metadata
+        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+    """
+
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
         self._pool: asyncpg.Pool | None = None
@@ -28,6 +71,8 @@ class DatabaseService(LoggerMixin):
             self._dsn,
             min_size=5,
             max_size=self._settings.database_pool_size,
+            statement_cache_size=self.STATEMENT_CACHE_SIZE,
+            init=self._init_connection,
         )
         await self._create_tables()
         self.logger.info("database_connected")
@@ -38,6 +83,24 @@ class DatabaseService(LoggerMixin):
             await self._pool.close()
             self.logger.info("database_closed")
 
+    @staticmethod
+    async def _init_connection(conn: asyncpg.Connection) -> None:
+        """Encode and decode JSON columns with orjson instead of the stdlib."""
+        await conn.set_type_codec(
+            "jsonb",
+            encoder=_encode_jsonb,
+            decoder=_decode_jsonb,
+            schema="pg_catalog",
+            format="binary",
+        )
+        await conn.set_type_codec(
+            "json",
+            encoder=orjson.dumps,
+            decoder=orjson.loads,
+            schema="pg_catalog",
+            format="binary",
+        )
+
     @property
     def pool(self) -> asyncpg.Pool:
         if self._pool is None:
@@ -47,6 +110,8 @@ class DatabaseService(LoggerMixin):
     async def _create_tables(self) -> None:
         """Create database tables if they don't exist."""
         async with self.pool.acquire() as conn:
+            await conn.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
             await conn.execute("""
                 CREATE TABLE IF NOT EXISTS documents (
                     id VARCHAR(36) PRIMARY KEY,
@@ -63,8 +128,11 @@ class DatabaseService(LoggerMixin):
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
 
-                CREATE INDEX IF NOT EXISTS idx_documents_ticker ON documents(ticker);
+                CREATE INDEX IF NOT EXISTS idx_documents_ticker_reference_date
+                    ON documents(ticker, reference_date DESC);
                 CREATE INDEX IF NOT EXISTS idx_documents_company ON documents(company);
+                CREATE INDEX IF NOT EXISTS idx_documents_company_trgm
+                    ON documents USING GIN (company gin_trgm_ops);
                 CREATE INDEX IF NOT EXISTS idx_documents_type ON documents(document_type);
                 CREATE INDEX IF NOT EXISTS idx_documents_reference_date ON documents(reference_date);
             """)
@@ -83,7 +151,9 @@ class DatabaseService(LoggerMixin):
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
 
-                CREATE INDEX IF NOT EXISTS idx_query_history_user ON query_history(user_id);
+                CREATE INDEX IF NOT EXISTS idx_query_history_user_created
+                    ON query_history(user_id, created_at DESC)
+                    WHERE user_id IS NOT NULL;
                 CREATE INDEX IF NOT EXISTS idx_query_history_created ON query_history(created_at);
             """)
 
@@ -102,6 +172,31 @@ class DatabaseService(LoggerMixin):
             async with conn.transaction():
                 yield conn
 
+    @staticmethod
+    def _document_row(
+        document_id: str,
+        company: str,
+        ticker: str,
+        document_type: str,
+        reference_date: datetime,
+        source_url: str | None = None,
+        file_hash: str | None = None,
+        page_count: int | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> tuple[Any, ...]:
+        """Build the INSERT_DOCUMENT_SQL arguments for one document."""
+        return (
+            document_id,
+            company,
+            ticker.upper(),
+            document_type,
+            reference_date,
+            source_url,
+            file_hash,
+            page_count,
+            metadata or {},
+        )
+
     async def insert_document(
         self,
         document_id: str,
@@ -117,30 +212,44 @@ class DatabaseService(LoggerMixin):
         """Insert a new document record."""
         async with self.connection() as conn:
             await conn.execute(
-                """
-                INSERT INTO documents (
-                    id, company, ticker, document_type, reference_date,
-                    source_url, file_hash, page_count, metadata
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                ON CONFLICT (file_hash) DO NOTHING
-                """,
-                document_id,
-                company,
-                ticker.upper(),
-                document_type,
-                reference_date,
-                source_url,
-                file_hash,
-                page_count,
-                json.dumps(metadata or {}),
+                self.INSERT_DOCUMENT_SQL,
+                *self._document_row(
+                    document_id,
+                    company,
+                    ticker,
+                    document_type,
+                    reference_date,
+                    source_url,
+                    file_hash,
+                    page_count,
+                    metadata,
+                ),
             )
         return document_id
 
+    async def insert_documents(self, documents: list[dict[str, Any]]) -> int:
+        """Insert many document records in one round trip.
+
+        Each item takes the same keyword arguments as insert_document. Returns the
+        number of rows submitted; documents whose file_hash already exists are
+        skipped by the insert and still counted.
+        """
+        if not documents:
+            return 0
+
+        async with self.connection() as conn:
+            await conn.executemany(
+                self.INSERT_DOCUMENT_SQL,
+                [self._document_row(**document) for document in documents],
+            )
+        self.logger.info("documents_submitted", count=len(documents))
+        return len(documents)
+
     async def get_document(self, document_id: str) -> dict[str, Any] | None:
         """Get a document by ID."""
         async with self.connection() as conn:
             row = await conn.fetchrow(
-                "SELECT * FROM documents WHERE id = $1",
+                f"SELECT {self.DOCUMENT_COLUMNS_FULL} FROM documents WHERE id = $1",
                 document_id,
             )
             return dict(row) if row else None
@@ -149,12 +258,14 @@ class DatabaseService(LoggerMixin):
         self,
         ticker: str,
         limit: int = 10,
+        include_metadata: bool = False,
     ) -> list[dict[str, Any]]:
         """Get documents by ticker."""
+        columns = self.DOCUMENT_COLUMNS_FULL if include_metadata else self.DOCUMENT_COLUMNS
         async with self.connection() as conn:
             rows = await conn.fetch(
-                """
-                SELECT * FROM documents
+                f"""
+                SELECT {columns} FROM documents
                 WHERE ticker = $1
                 ORDER BY reference_date DESC
                 LIMIT $2
@@ -168,12 +279,14 @@ class DatabaseService(LoggerMixin):
         self,
         company: str,
         limit: int = 10,
+        include_metadata: bool = False,
     ) -> list[dict[str, Any]]:
         """Get documents by company name."""
+        columns = self.DOCUMENT_COLUMNS_FULL if include_metadata else self.DOCUMENT_COLUMNS
         async with self.connection() as conn:
             rows = await conn.fetch(
-                """
-                SELECT * FROM documents
+                f"""
+                SELECT {columns} FROM documents
                 WHERE company ILIKE $1
                 ORDER BY reference_date DESC
                 LIMIT $2
@@ -192,6 +305,31 @@ class DatabaseService(LoggerMixin):
             )
             return result == "DELETE 1"
 
+    @staticmethod
+    def _query_history_row(
+        query_id: str,
+        query_text: str,
+        intent_type: str | None = None,
+        tickers: list[str] | None = None,
+        response_summary: str | None = None,
+        tokens_used: int = 0,
+        processing_time_ms: float = 0,
+        user_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> tuple[Any, ...]:
+        """Build the INSERT_QUERY_HISTORY_SQL arguments for one query."""
+        return (
+            query_id,
+            query_text,
+            intent_type,
+            tickers or [],
+            response_summary,
+            tokens_used,
+            processing_time_ms,
+            user_id,
+            metadata or {},
+        )
+
     async def insert_query_history(
         self,
         query_id: str,
@@ -207,35 +345,51 @@ class DatabaseService(LoggerMixin):
         """Insert a query history record."""
         async with self.connection() as conn:
             await conn.execute(
-                """
-                INSERT INTO query_history (
-                    id, query_text, intent_type, tickers, response_summary,
-                    tokens_used, processing_time_ms, user_id, metadata
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                """,
-                query_id,
-                query_text,
-                intent_type,
-                json.dumps(tickers or []),
-                response_summary,
-                tokens_used,
-                processing_time_ms,
-                user_id,
-                json.dumps(metadata or {}),
+                self.INSERT_QUERY_HISTORY_SQL,
+                *self._query_history_row(
+                    query_id,
+                    query_text,
+                    intent_type,
+                    tickers,
+                    response_summary,
+                    tokens_used,
+                    processing_time_ms,
+                    user_id,
+                    metadata,
+                ),
             )
         return query_id
 
+    async def insert_query_history_many(self, queries: list[dict[str, Any]]) -> int:
+        """Insert many query history records in one round trip.
+
+        Each item takes the same keyword arguments as insert_query_history. The batch
+        is applied atomically, so the returned count is the number of rows inserted.
+        """
+        if not queries:
+            return 0
+
+        async with self.connection() as conn:
+            await conn.executemany(
+                self.INSERT_QUERY_HISTORY_SQL,
+                [self._query_history_row(**query) for query in queries],
+            )
+        self.logger.info("query_history_inserted", count=len(queries))
+        return len(queries)
+
     async def get_recent_queries(
         self,
         user_id: str | None = None,
         limit: int = 10,
+        include_summary: bool = False,
     ) -> list[dict[str, Any]]:
         """Get recent queries."""
+        columns = self.QUERY_HISTORY_COLUMNS_FULL if include_summary else self.QUERY_HISTORY_COLUMNS
         async with self.connection() as conn:
             if user_id:
                 rows = await conn.fetch(
-                    """
-                    SELECT * FROM query_history
+                    f"""
+                    SELECT {columns} FROM query_history
                     WHERE user_id = $1
                     ORDER BY created_at DESC
                     LIMIT $2
@@ -245,8 +399,8 @@ class DatabaseService(LoggerMixin):
                 )
             else:
                 rows = await conn.fetch(
-                    """
-                    SELECT * FROM query_history
+                    f"""
+                    SELECT {columns} FROM query_history
                     ORDER BY created_at DESC
                     LIMIT $1
                     """,
@@ -266,15 +420,20 @@ class DatabaseService(LoggerMixin):
 
 
 _database_service: DatabaseService | None = None
+_database_service_lock = asyncio.Lock()
 
 
 async def get_database_service(settings: Settings | None = None) -> DatabaseService:
     """Get or create the database service singleton."""
     global _database_service
     if _database_service is None:
-        if settings is None:
-            from src.config.settings import get_settings
-            settings = get_settings()
-        _database_service = DatabaseService(settings)
-        await _database_service.connect()
+        async with _database_service_lock:
+            if _database_service is None:
+                if settings is None:
+                    from src.config.settings import get_settings
+
+                    settings = get_settings()
+                service = DatabaseService(settings)
+                await service.connect()
+                _database_service = service
     return _database_service
@@ -0,0 +1,150 @@
+from typing import Any
+from uuid import uuid4
+
+import msgspec
+import numpy as np
+
+from src.config.logging import LoggerMixin
+from src.config.settings import Settings
+from src.infrastructure.cache import CacheService
+
+
+class _Entry(msgspec.Struct):
+    """Stored cache entry: int8-quantized key vector, its scale and the cached value."""
+
+    vector: bytes
+    scale: float
+    value: dict[str, Any]
+
+
+class SemanticCache(LoggerMixin):
+    """Embedding-keyed cache using random-projection LSH buckets stored in Redis."""
+
+    def __init__(
+        self,
+        settings: Settings,
+        cache_service: CacheService,
+        num_tables: int = 4,
+        num_bits: int = 16,
+        seed: int = 42,
+    ) -> None:
+        self._cache = cache_service
+        self._threshold = settings.semantic_cache_threshold
+        self._ttl = settings.semantic_cache_ttl
+
+        # A fixed seed keeps the hyperplanes identical across workers sharing Redis.
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal(
+            (num_tables, num_bits, settings.qdrant_vector_size)
+        ).astype(np.float32)
+        self._bit_weights = np.left_shift(
+            np.uint64(1),
+            np.arange(num_bits, dtype=np.uint64),
+        )
+
+    @staticmethod
+    def _normalize(vector: list[float] | np.ndarray) -> np.ndarray:
+        """Return the vector scaled to unit length."""
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    @staticmethod
+    def _quantize(vector: np.ndarray) -> tuple[np.ndarray, float]:
+        """Scalar-quantize a vector to int8 with a per-vector scale."""
+        scale = float(np.abs(vector).max()) / 127 or 1.0
+        return np.round(vector / scale).astype(np.int8), scale
+
+    def _buckets(self, vector: np.ndarray) -> list[int]:
+        """Hash a unit vector into one bucket id per LSH table."""
+        bits = (self._planes @ vector) > 0
+        return [int(bucket) for bucket in bits.astype(np.uint64) @ self._bit_weights]
+
+    @staticmethod
+    def _bucket_key(scope: str, table: int, bucket: int) -> str:
+        return CacheService.generate_key("semantic", scope, str(table), str(bucket))
+
+    def _bucket_keys(self, scope: str, vector: np.ndarray) -> list[str]:
+        """Bucket keys for a unit vector, one per LSH table."""
+        return [
+            self._bucket_key(scope, table, bucket)
+            for table, bucket in enumerate(self._buckets(vector))
+        ]
+
+    @staticmethod
+    def _entry_key(entry_id: str) -> str:
+        return CacheService.generate_key("semantic_entry", entry_id)
+
+    async def get(
+        self,
+        vector: list[float],
+        threshold: float | None = None,
+        scope: str = "",
+    ) -> dict[str, Any] | None:
+        """Get the cached value whose key is most similar to the given vector."""
+        query = self._normalize(vector)
+        query_codes, query_scale = self._quantize(query)
+        query_codes = query_codes.astype(np.int32)
+        min_score = self._threshold if threshold is None else threshold
+
+        bucket_keys = self._bucket_keys(scope, query)
+        entry_ids = list(await self._cache.get_set_union(bucket_keys))
+
+        stored = await self._cache.get_json_many(
+            [self._entry_key(entry_id) for entry_id in entry_ids],
+            _Entry,
+        )
+        entries = [entry for entry in stored if entry is not None]
+
+        # Buckets outlive the entries they index; drop ids whose entry has expired.
+        expired_ids = [
+            entry_id for entry_id, entry in zip(entry_ids, stored, strict=True) if entry is None
+        ]
+        if expired_ids:
+            await self._cache.remove_from_sets(bucket_keys, *expired_ids)
+
+        if not entries:
+            return None
+
+        codes = np.stack(
+            [np.frombuffer(entry.vector, dtype=np.int8) for entry in entries]
+        ).astype(np.int32)
+        scales = np.array([entry.scale for entry in entries], dtype=np.float32)
+        scores = (codes @ query_codes) * scales * query_scale
+
+        best = int(np.argmax(scores))
+        best_score = float(scores[best])
+        if best_score < min_score:
+            return None
+
+        self.logger.info("semantic_cache_hit", scope=scope, score=best_score)
+        return entries[best].value
+
+    async def put(
+        self,
+        vector: list[float],
+        value: dict[str, Any],
+        scope: str = "",
+    ) -> None:
+        """Store a value under the given vector."""
+        key_vector = self._normalize(vector)
+        codes, scale = self._quantize(key_vector)
+        entry_id = uuid4().hex
+
+        stored = await self._cache.set_json(
+            self._entry_key(entry_id),
+            {
+                "vector": codes.tobytes(),
+                "scale": scale,
+                "value": value,
+            },
+            ttl=self._ttl,
+        )
+        if not stored:
+            return
+
+        await self._cache.add_to_sets(
+            self._bucket_keys(scope, key_vector),
+            entry_id,
+            ttl=self._ttl,
+        )
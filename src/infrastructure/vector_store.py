@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 from uuid import uuid4
 
@@ -6,9 +7,16 @@ from qdrant_client.models import (
     Distance,
     FieldCondition,
     Filter,
+    HnswConfigDiff,
     MatchValue,
+    PayloadSchemaType,
     PointStruct,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
     ScoredPoint,
+    SearchParams,
     VectorParams,
 )
 
@@ -16,10 +24,29 @@ from src.config.logging import LoggerMixin
 from src.config.settings import Settings
 from src.core.types import DocumentChunk
 
+# Chunk fields are stored under short keys since every point repeats them.
+PAYLOAD_KEY_MAP = {
+    "document_id": "d",
+    "content": "c",
+    "page_number": "p",
+    "chunk_index": "i",
+}
+
 
 class VectorStoreService(LoggerMixin):
     """Qdrant vector store service for semantic search."""
 
+    UPSERT_BATCH_SIZE = 256
+    # int8 candidates are over-fetched and rescored against the original vectors.
+    QUANTIZATION_OVERSAMPLING = 2.0
+    HNSW_M = 16
+    HNSW_EF_CONSTRUCT = 128
+    # Beam width for the usual small top_k; larger requests fall back to Qdrant's default.
+    SEARCH_HNSW_EF = 64
+    SEARCH_HNSW_EF_MAX_TOP_K = 10
+    # Payload fields searches and deletes filter on.
+    KEYWORD_INDEX_FIELDS = (PAYLOAD_KEY_MAP["document_id"], "ticker", "company", "document_type")
+
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
         self._client: AsyncQdrantClient | None = None
@@ -31,6 +58,8 @@ class VectorStoreService(LoggerMixin):
         self._client = AsyncQdrantClient(
             host=self._settings.qdrant_host,
             port=self._settings.qdrant_port,
+            grpc_port=self._settings.qdrant_grpc_port,
+            prefer_grpc=True,
         )
         await self._ensure_collection()
         self.logger.info("vector_store_connected")
@@ -59,11 +88,31 @@ class VectorStoreService(LoggerMixin):
                     size=self._vector_size,
                     distance=Distance.COSINE,
                 ),
+                hnsw_config=HnswConfigDiff(m=self.HNSW_M, ef_construct=self.HNSW_EF_CONSTRUCT),
+                quantization_config=ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(
+                        type=ScalarType.INT8,
+                        quantile=0.99,
+                        always_ram=True,
+                    ),
+                ),
             )
             self.logger.info("collection_created", collection=self._collection_name)
 
-    async def upsert_chunks(self, chunks: list[DocumentChunk]) -> int:
-        """Insert or update document chunks with their embeddings."""
+        for field_name in self.KEYWORD_INDEX_FIELDS:
+            await self.client.create_payload_index(
+                collection_name=self._collection_name,
+                field_name=field_name,
+                field_schema=PayloadSchemaType.KEYWORD,
+            )
+
+    async def upsert_chunks(self, chunks: list[DocumentChunk], wait: bool = True) -> int:
+        """Insert or update document chunks with their embeddings.
+
+        Points are sent in concurrent batches. By default each request returns once
+        Qdrant has applied the batch, so the chunks are searchable on return; bulk
+        backfills can pass wait=False to return as soon as batches are accepted.
+        """
         if not chunks:
             return 0
 
@@ -72,11 +121,11 @@ class VectorStoreService(LoggerMixin):
                 id=chunk.chunk_id or str(uuid4()),
                 vector=chunk.embedding or [],
                 payload={
-                    "document_id": chunk.document_id,
-                    "content": chunk.content,
-                    "page_number": chunk.page_number,
-                    "chunk_index": chunk.chunk_index,
                     **chunk.metadata,
+                    PAYLOAD_KEY_MAP["document_id"]: chunk.document_id,
+                    PAYLOAD_KEY_MAP["content"]: chunk.content,
+                    PAYLOAD_KEY_MAP["page_number"]: chunk.page_number,
+                    PAYLOAD_KEY_MAP["chunk_index"]: chunk.chunk_index,
                 },
             )
             for chunk in chunks
@@ -86,9 +135,15 @@ class VectorStoreService(LoggerMixin):
         if not points:
             return 0
 
-        await self.client.upsert(
-            collection_name=self._collection_name,
-            points=points,
+        await asyncio.gather(
+            *(
+                self.client.upsert(
+                    collection_name=self._collection_name,
+                    points=points[start : start + self.UPSERT_BATCH_SIZE],
+                    wait=wait,
+                )
+                for start in range(0, len(points), self.UPSERT_BATCH_SIZE)
+            )
         )
         self.logger.info("chunks_upserted", count=len(points))
         return len(points)
@@ -104,7 +159,7 @@ class VectorStoreService(LoggerMixin):
         qdrant_filter = None
         if filters:
             conditions = [
-                FieldCondition(key=key, match=MatchValue(value=value))
+                FieldCondition(key=PAYLOAD_KEY_MAP.get(key, key), match=MatchValue(value=value))
                 for key, value in filters.items()
             ]
             qdrant_filter = Filter(must=conditions)
@@ -115,22 +170,26 @@ class VectorStoreService(LoggerMixin):
             limit=top_k,
             query_filter=qdrant_filter,
             score_threshold=score_threshold,
+            search_params=SearchParams(
+                hnsw_ef=self.SEARCH_HNSW_EF if top_k <= self.SEARCH_HNSW_EF_MAX_TOP_K else None,
+                quantization=QuantizationSearchParams(
+                    rescore=True,
+                    oversampling=self.QUANTIZATION_OVERSAMPLING,
+                ),
+            ),
         )
 
         chunks_with_scores: list[tuple[DocumentChunk, float]] = []
         for result in results:
+            # Each result owns its payload, so popping the chunk fields leaves the metadata.
             payload = result.payload or {}
             chunk = DocumentChunk(
                 chunk_id=str(result.id),
-                document_id=payload.get("document_id", ""),
-                content=payload.get("content", ""),
-                page_number=payload.get("page_number"),
-                chunk_index=payload.get("chunk_index", 0),
-                metadata={
-                    k: v
-                    for k, v in payload.items()
-                    if k not in ("document_id", "content", "page_number", "chunk_index")
-                },
+                document_id=payload.pop(PAYLOAD_KEY_MAP["document_id"], ""),
+                content=payload.pop(PAYLOAD_KEY_MAP["content"], ""),
+                page_number=payload.pop(PAYLOAD_KEY_MAP["page_number"], None),
+                chunk_index=payload.pop(PAYLOAD_KEY_MAP["chunk_index"], 0),
+                metadata=payload,
             )
             chunks_with_scores.append((chunk, result.score))
 
@@ -142,7 +201,12 @@ class VectorStoreService(LoggerMixin):
             await self.client.delete(
                 collection_name=self._collection_name,
                 points_selector=Filter(
-                    must=[FieldCondition(key="document_id", match=MatchValue(value=document_id))]
+                    must=[
+                        FieldCondition(
+                            key=PAYLOAD_KEY_MAP["document_id"],
+                            match=MatchValue(value=document_id),
+                        )
+                    ]
                 ),
             )
             self.logger.info("chunks_deleted", document_id=document_id)
@@ -171,16 +235,20 @@ class VectorStoreService(LoggerMixin):
 
 
 _vector_store_service: VectorStoreService | None = None
+_vector_store_service_lock = asyncio.Lock()
 
 
 async def get_vector_store_service(settings: Settings | None = None) -> VectorStoreService:
     """Get or create the vector store service singleton."""
     global _vector_store_service
     if _vector_store_service is None:
-        if settings is None:
-            from src.config.settings import get_settings
-
-            settings = get_settings()
-        _vector_store_service = VectorStoreService(settings)
-        await _vector_store_service.connect()
+        async with _vector_store_service_lock:
+            if _vector_store_service is None:
+                if settings is None:
+                    from src.config.settings import get_settings
+
+                    settings = get_settings()
+                service = VectorStoreService(settings)
+                await service.connect()
+                _vector_store_service = service
     return _vector_store_service
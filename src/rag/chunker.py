@@ -1,4 +1,6 @@
 import re
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from typing import Any
 from uuid import uuid4
 
@@ -12,8 +14,26 @@ class DocumentChunker(LoggerMixin):
 
     SENTENCE_ENDINGS = re.compile(r"(?<=[.!?])\s+")
     PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
-    TABLE_PATTERN = re.compile(r"(\|[^\n]+\|[\n\r]+)+")
+    # Only searched for presence, so one table row is enough to match.
+    TABLE_PATTERN = re.compile(r"\|[^\n]+\|[\n\r]")
     NUMBER_PATTERN = re.compile(r"R\$\s*[\d.,]+|[\d.,]+\s*%|\d{1,3}(?:\.\d{3})*(?:,\d+)?")
+    # Literal prefixes let re jump between candidates instead of testing every character.
+    SPACE_RUN = re.compile(r"  +")
+    EXCESS_NEWLINES = re.compile(r"\n\n\n+")
+    PAGE_MARKER = re.compile(r"(?:^|\n)(?:Página|Page|Pág\.?)\s*(\d+)", re.IGNORECASE)
+    FINANCIAL_KEYWORDS = (
+        "ativo",
+        "passivo",
+        "patrimônio",
+        "receita",
+        "despesa",
+        "lucro",
+        "prejuízo",
+        "ebitda",
+        "dívida",
+        "caixa",
+        "fluxo",
+    )
 
     def __init__(self, settings: Settings) -> None:
         self._chunk_size = settings.rag_chunk_size
@@ -71,17 +91,16 @@ class DocumentChunker(LoggerMixin):
 
     def _normalize_text(self, text: str) -> str:
         """Normalize text for consistent processing."""
-        text = text.replace("\r\n", "\n").replace("\r", "\n")
-        text = re.sub(r"[ \t]+", " ", text)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = text.replace("\r\n", "\n").replace("\r", "\n").replace("\t", " ")
+        text = self.SPACE_RUN.sub(" ", text)
+        text = self.EXCESS_NEWLINES.sub("\n\n", text)
         return text.strip()
 
     def _split_into_sections(self, text: str) -> list[dict[str, Any]]:
         """Split text into logical sections."""
         sections: list[dict[str, Any]] = []
 
-        page_pattern = re.compile(r"(?:^|\n)(?:Página|Page|Pág\.?)\s*(\d+)", re.IGNORECASE)
-        pages = page_pattern.split(text)
+        pages = self.PAGE_MARKER.split(text)
 
         if len(pages) > 1:
             current_page = 1
@@ -122,24 +141,12 @@ class DocumentChunker(LoggerMixin):
         if self.TABLE_PATTERN.search(text):
             return "table"
 
-        financial_keywords = [
-            "ativo",
-            "passivo",
-            "patrimônio",
-            "receita",
-            "despesa",
-            "lucro",
-            "prejuízo",
-            "ebitda",
-            "dívida",
-            "caixa",
-            "fluxo",
-        ]
         text_lower = text.lower()
-        if any(kw in text_lower for kw in financial_keywords):
+        if any(kw in text_lower for kw in self.FINANCIAL_KEYWORDS):
             return "financial"
 
-        if text.strip().isupper() and len(text.strip()) < 100:
+        stripped = text.strip()
+        if stripped.isupper() and len(stripped) < 100:
             return "header"
 
         return "text"
@@ -153,43 +160,38 @@ class DocumentChunker(LoggerMixin):
         if len(text) <= self._chunk_size:
             return [text]
 
-        sentences = self.SENTENCE_ENDINGS.split(text)
+        sentences = [
+            sentence
+            for sentence in (part.strip() for part in self.SENTENCE_ENDINGS.split(text))
+            if sentence
+        ]
+        count = len(sentences)
+        # offsets[i] is the total length of the first i sentences, so any run's length
+        # is a subtraction and chunk boundaries are binary searches.
+        offsets = [0, *accumulate(map(len, sentences))]
         chunks: list[str] = []
-        current_chunk: list[str] = []
-        current_length = 0
-
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-
-            sentence_length = len(sentence)
-
-            if current_length + sentence_length > self._chunk_size and current_chunk:
-                chunks.append(" ".join(current_chunk))
-
-                overlap_text = " ".join(current_chunk)
-                if len(overlap_text) > self._chunk_overlap:
-                    overlap_sentences: list[str] = []
-                    overlap_length = 0
-                    for s in reversed(current_chunk):
-                        if overlap_length + len(s) > self._chunk_overlap:
-                            break
-                        overlap_sentences.insert(0, s)
-                        overlap_length += len(s)
-                    current_chunk = overlap_sentences
-                    current_length = overlap_length
-                else:
-                    current_chunk = []
-                    current_length = 0
-
-            current_chunk.append(sentence)
-            current_length += sentence_length
-
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
-
-        return chunks
+        start = 0
+        first_new = 0
+
+        while True:
+            # Every chunk takes at least one sentence past the carried-over overlap.
+            end = max(
+                bisect_right(offsets, offsets[start] + self._chunk_size) - 1,
+                first_new + 1,
+            )
+            if end >= count:
+                if start < count:
+                    chunks.append(" ".join(sentences[start:]))
+                return chunks
+
+            chunks.append(" ".join(sentences[start:end]))
+
+            joined_length = offsets[end] - offsets[start] + end - start - 1
+            if joined_length > self._chunk_overlap:
+                start = bisect_left(offsets, offsets[end] - self._chunk_overlap, start, end + 1)
+            else:
+                start = end
+            first_new = end
 
     def chunk_with_tables(
         self,
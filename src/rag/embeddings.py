@@ -1,4 +1,5 @@
-from typing import Literal
+import asyncio
+from collections.abc import Awaitable, Callable
 
 import cohere
 from openai import AsyncOpenAI
@@ -10,6 +11,10 @@ from src.config.settings import Settings
 class EmbeddingService(LoggerMixin):
     """Service for generating text embeddings using OpenAI or Cohere."""
 
+    OPENAI_BATCH_SIZE = 100
+    COHERE_BATCH_SIZE = 96
+    MAX_CONCURRENT_BATCHES = 8
+
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
         self._provider = settings.embedding_provider
@@ -45,60 +50,71 @@ class EmbeddingService(LoggerMixin):
         else:
             return await self._embed_cohere(texts)
 
+    async def _embed_in_batches(
+        self,
+        texts: list[str],
+        batch_size: int,
+        embed_batch: Callable[[list[str]], Awaitable[list[list[float]]]],
+    ) -> list[list[float]]:
+        """Embed texts in concurrent batches, preserving input order."""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_BATCHES)
+
+        async def run(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await embed_batch(batch)
+
+        results = await asyncio.gather(
+            *(run(texts[i : i + batch_size]) for i in range(0, len(texts), batch_size))
+        )
+        return [embedding for batch_embeddings in results for embedding in batch_embeddings]
+
     async def _embed_openai(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings using OpenAI."""
         if not self._openai_client:
             raise RuntimeError("OpenAI client not initialized")
 
-        batch_size = 100
-        all_embeddings: list[list[float]] = []
-
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
+        return await self._embed_in_batches(texts, self.OPENAI_BATCH_SIZE, self._embed_openai_batch)
 
-            response = await self._openai_client.embeddings.create(
-                model=self._model,
-                input=batch,
-            )
-
-            batch_embeddings = [item.embedding for item in response.data]
-            all_embeddings.extend(batch_embeddings)
+    async def _embed_openai_batch(self, batch: list[str]) -> list[list[float]]:
+        """Generate embeddings for one OpenAI request."""
+        response = await self._openai_client.embeddings.create(
+            model=self._model,
+            input=batch,
+        )
 
-            self.logger.debug(
-                "embeddings_generated",
-                provider="openai",
-                batch_size=len(batch),
-                total_tokens=response.usage.total_tokens,
-            )
+        self.logger.debug(
+            "embeddings_generated",
+            provider="openai",
+            batch_size=len(batch),
+            total_tokens=response.usage.total_tokens,
+        )
 
-        return all_embeddings
+        return [item.embedding for item in response.data]
 
     async def _embed_cohere(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings using Cohere."""
         if not self._cohere_client:
             raise RuntimeError("Cohere client not initialized")
 
-        batch_size = 96
-        all_embeddings: list[list[float]] = []
-
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-
-            response = self._cohere_client.embed(
-                texts=batch,
-                model=self._model,
-                input_type="search_document",
-            )
+        return await self._embed_in_batches(texts, self.COHERE_BATCH_SIZE, self._embed_cohere_batch)
 
-            all_embeddings.extend(response.embeddings)
+    async def _embed_cohere_batch(self, batch: list[str]) -> list[list[float]]:
+        """Generate embeddings for one Cohere request."""
+        # The Cohere client is synchronous, so each request runs in a worker thread.
+        response = await asyncio.to_thread(
+            self._cohere_client.embed,
+            texts=batch,
+            model=self._model,
+            input_type="search_document",
+        )
 
-            self.logger.debug(
-                "embeddings_generated",
-                provider="cohere",
-                batch_size=len(batch),
-            )
+        self.logger.debug(
+            "embeddings_generated",
+            provider="cohere",
+            batch_size=len(batch),
+        )
 
-        return all_embeddings
+        return response.embeddings
 
     async def embed_query(self, query: str) -> list[float]:
         """Generate embedding for a search query."""
@@ -126,7 +142,8 @@ class EmbeddingService(LoggerMixin):
         if not self._cohere_client:
             raise RuntimeError("Cohere client not initialized")
 
-        response = self._cohere_client.embed(
+        response = await asyncio.to_thread(
+            self._cohere_client.embed,
             texts=[query],
             model=self._model,
             input_type="search_query",
@@ -1,9 +1,11 @@
+import asyncio
 import hashlib
 import io
 import re
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, cast
 
 import pdfplumber
 
@@ -19,6 +21,26 @@ from src.rag.embeddings import EmbeddingService
 class DocumentProcessor(LoggerMixin):
     """Service for processing and indexing financial documents."""
 
+    # Tried in order: year-first dates take precedence over day-first ones.
+    FULL_DATE_PATTERNS = (
+        re.compile(r"(\d{4})[-_]?(\d{2})[-_]?(\d{2})"),
+        re.compile(r"(\d{2})[-_]?(\d{2})[-_]?(\d{4})"),
+    )
+    QUARTER_PATTERN = re.compile(r"([1-4])[tT](\d{4})")
+    # Recently embedded chunk texts, so boilerplate repeated across documents is embedded once.
+    EMBEDDING_MEMO_SIZE = 256
+
+    DOCUMENT_TYPE_KEYWORDS = {
+        DocumentType.BALANCE_SHEET: ("balanço", "balanco", "balance", "bp_"),
+        DocumentType.INCOME_STATEMENT: ("dre", "resultado", "income", "demonstração"),
+        DocumentType.CASH_FLOW: ("fluxo", "caixa", "cash_flow", "dfc"),
+        DocumentType.QUARTERLY_REPORT: ("itr", "trimestral", "quarterly", "3t", "2t", "1t", "4t"),
+        DocumentType.ANNUAL_REPORT: ("dfp", "anual", "annual", "12m"),
+        DocumentType.EARNINGS_RELEASE: ("release", "earnings", "resultado"),
+        DocumentType.RELEVANT_FACT: ("fato_relevante", "fr_", "relevant"),
+        DocumentType.PRESENTATION: ("apresenta", "presentation", "investor"),
+    }
+
     def __init__(
         self,
         settings: Settings,
@@ -30,17 +52,20 @@ class DocumentProcessor(LoggerMixin):
         self._embedding_service = embedding_service
         self._vector_store = vector_store
         self._chunker = chunker
+        self._embedding_memo: OrderedDict[bytes, list[float]] = OrderedDict()
 
     async def process_pdf(
         self,
-        pdf_content: bytes,
+        pdf_content: bytes | IO[bytes],
         metadata: DocumentMetadata,
     ) -> tuple[str, int]:
-        """Process a PDF document and index its chunks."""
-        file_hash = hashlib.sha256(pdf_content).hexdigest()
+        """Process a PDF document, given as bytes or a seekable file, and index its chunks."""
+        pdf_file = io.BytesIO(pdf_content) if isinstance(pdf_content, bytes) else pdf_content
+        # Large uploads are spooled to disk, so hashing stays off the event loop too.
+        file_hash = await asyncio.to_thread(self._hash_file, pdf_file)
 
         try:
-            text, tables = self._extract_pdf_content(pdf_content)
+            text, tables = await asyncio.to_thread(self._extract_pdf_content, pdf_file)
 
             if not text.strip():
                 raise DocumentProcessingError(
@@ -101,15 +126,23 @@ class DocumentProcessor(LoggerMixin):
                 document_id=metadata.document_id,
             )
 
+    @staticmethod
+    def _hash_file(pdf_file: IO[bytes]) -> str:
+        """Hash a file in place and rewind it."""
+        pdf_file.seek(0)
+        file_hash = hashlib.file_digest(cast(io.BufferedReader, pdf_file), "sha256").hexdigest()
+        pdf_file.seek(0)
+        return file_hash
+
     def _extract_pdf_content(
         self,
-        pdf_content: bytes,
+        pdf_file: IO[bytes],
     ) -> tuple[str, list[dict[str, Any]]]:
         """Extract text and tables from PDF."""
         text_parts: list[str] = []
         tables: list[dict[str, Any]] = []
 
-        with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
+        with pdfplumber.open(cast(io.BufferedReader, pdf_file)) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 page_text = page.extract_text() or ""
                 if page_text:
@@ -127,6 +160,9 @@ class DocumentProcessor(LoggerMixin):
                             }
                         )
 
+                # Drop the page's parsed layout so memory stays flat across long reports.
+                page.close()
+
         return "\n".join(text_parts), tables
 
     def _table_to_markdown(self, table: list[list[Any]]) -> str:
@@ -152,12 +188,39 @@ class DocumentProcessor(LoggerMixin):
         self,
         chunks: list[DocumentChunk],
     ) -> list[DocumentChunk]:
-        """Generate embeddings for chunks."""
-        texts = [chunk.content for chunk in chunks]
-        embeddings = await self._embedding_service.embed_texts(texts)
+        """Generate embeddings for chunks, embedding each distinct text once."""
+        digests = [
+            hashlib.blake2b(chunk.content.encode(), digest_size=16).digest() for chunk in chunks
+        ]
+        embeddings: dict[bytes, list[float]] = {}
+        pending: dict[bytes, str] = {}
+
+        for digest, chunk in zip(digests, chunks, strict=True):
+            if digest in embeddings or digest in pending:
+                continue
+            memoized = self._embedding_memo.get(digest)
+            if memoized is not None:
+                self._embedding_memo.move_to_end(digest)
+                embeddings[digest] = memoized
+            else:
+                pending[digest] = chunk.content
 
-        for chunk, embedding in zip(chunks, embeddings, strict=True):
-            chunk.embedding = embedding
+        if pending:
+            new_embeddings = await self._embedding_service.embed_texts(list(pending.values()))
+            for digest, embedding in zip(pending, new_embeddings, strict=True):
+                embeddings[digest] = embedding
+                self._embedding_memo[digest] = embedding
+                if len(self._embedding_memo) > self.EMBEDDING_MEMO_SIZE:
+                    self._embedding_memo.popitem(last=False)
+
+        for chunk, digest in zip(chunks, digests, strict=True):
+            chunk.embedding = embeddings[digest]
+
+        self.logger.debug(
+            "chunk_embeddings_resolved",
+            chunks=len(chunks),
+            embedded=len(pending),
+        )
 
         return chunks
 
@@ -210,24 +273,13 @@ class DocumentProcessor(LoggerMixin):
         """Detect document type from filename and content."""
         filename_lower = filename.lower()
 
-        type_patterns = {
-            DocumentType.BALANCE_SHEET: ["balanço", "balanco", "balance", "bp_"],
-            DocumentType.INCOME_STATEMENT: ["dre", "resultado", "income", "demonstração"],
-            DocumentType.CASH_FLOW: ["fluxo", "caixa", "cash_flow", "dfc"],
-            DocumentType.QUARTERLY_REPORT: ["itr", "trimestral", "quarterly", "3t", "2t", "1t", "4t"],
-            DocumentType.ANNUAL_REPORT: ["dfp", "anual", "annual", "12m"],
-            DocumentType.EARNINGS_RELEASE: ["release", "earnings", "resultado"],
-            DocumentType.RELEVANT_FACT: ["fato_relevante", "fr_", "relevant"],
-            DocumentType.PRESENTATION: ["apresenta", "presentation", "investor"],
-        }
-
-        for doc_type, patterns in type_patterns.items():
+        for doc_type, patterns in self.DOCUMENT_TYPE_KEYWORDS.items():
             if any(p in filename_lower for p in patterns):
                 return doc_type
 
         if text:
             text_lower = text[:2000].lower()
-            for doc_type, patterns in type_patterns.items():
+            for doc_type, patterns in self.DOCUMENT_TYPE_KEYWORDS.items():
                 if any(p in text_lower for p in patterns):
                     return doc_type
 
@@ -239,15 +291,8 @@ class DocumentProcessor(LoggerMixin):
         text: str | None = None,
     ) -> datetime:
         """Extract reference date from filename or content."""
-        date_patterns = [
-            r"(\d{4})[-_]?(\d{2})[-_]?(\d{2})",
-            r"(\d{2})[-_]?(\d{2})[-_]?(\d{4})",
-            r"([1-4])[tT](\d{4})",
-            r"(\d{4})[tT]([1-4])",
-        ]
-
-        for pattern in date_patterns[:2]:
-            match = re.search(pattern, filename)
+        for pattern in self.FULL_DATE_PATTERNS:
+            match = pattern.search(filename)
             if match:
                 try:
                     groups = match.groups()
@@ -258,7 +303,7 @@ class DocumentProcessor(LoggerMixin):
                 except (ValueError, IndexError):
                     continue
 
-        quarter_match = re.search(r"([1-4])[tT](\d{4})", filename)
+        quarter_match = self.QUARTER_PATTERN.search(filename)
         if quarter_match:
             quarter = int(quarter_match.group(1))
             year = int(quarter_match.group(2))
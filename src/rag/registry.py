@@ -0,0 +1,30 @@
+from src.config.settings import Settings
+from src.infrastructure.vector_store import VectorStoreService
+from src.rag.embeddings import EmbeddingService
+from src.rag.retriever import RAGRetriever
+
+_embedding_service: EmbeddingService | None = None
+_retriever: RAGRetriever | None = None
+
+
+def get_embedding_service(settings: Settings) -> EmbeddingService:
+    """Get or create the process-wide embedding service."""
+    global _embedding_service
+    if _embedding_service is None:
+        _embedding_service = EmbeddingService(settings)
+    return _embedding_service
+
+
+def get_retriever(settings: Settings, vector_store: VectorStoreService) -> RAGRetriever:
+    """Get or create the process-wide RAG retriever."""
+    global _retriever
+    if _retriever is None:
+        _retriever = RAGRetriever(settings, get_embedding_service(settings), vector_store)
+    return _retriever
+
+
+def clear_registry() -> None:
+    """Drop the shared instances so they are rebuilt on next use."""
+    global _embedding_service, _retriever
+    _embedding_service = None
+    _retriever = None
@@ -28,17 +28,23 @@ class RAGRetriever(LoggerMixin):
         if settings.cohere_api_key:
             self._cohere_client = cohere.Client(settings.cohere_api_key.get_secret_value())
 
+    async def embed_query(self, query: str) -> list[float]:
+        """Generate the embedding used for searching a query."""
+        return await self._embedding_service.embed_query(query)
+
     async def retrieve(
         self,
         query: str,
         filters: dict[str, Any] | None = None,
         top_k: int | None = None,
         rerank: bool = True,
+        query_embedding: list[float] | None = None,
     ) -> RAGContext:
         """Retrieve relevant chunks for a query."""
         top_k = top_k or self._top_k
 
-        query_embedding = await self._embedding_service.embed_query(query)
+        if query_embedding is None:
+            query_embedding = await self.embed_query(query)
 
         results = await self._vector_store.search(
             query_vector=query_embedding,
@@ -144,6 +150,7 @@ class RAGRetriever(LoggerMixin):
         keywords: list[str] | None = None,
         filters: dict[str, Any] | None = None,
         top_k: int | None = None,
+        query_embedding: list[float] | None = None,
     ) -> RAGContext:
         """Perform hybrid search combining semantic and keyword matching."""
         semantic_results = await self.retrieve(
@@ -151,6 +158,7 @@ class RAGRetriever(LoggerMixin):
             filters=filters,
             top_k=top_k or self._top_k,
             rerank=False,
+            query_embedding=query_embedding,
         )
 
         if keywords:
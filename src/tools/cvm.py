@@ -8,6 +8,7 @@ from bs4 import BeautifulSoup
 
 from src.core.exceptions import ExternalAPIError
 from src.core.types import DocumentMetadata, DocumentType
+from src.infrastructure.http import get_http_client
 from src.tools.base import BaseTool
 
 
@@ -30,6 +31,16 @@ class CVMTool(BaseTool):
         "IPE": DocumentType.EARNINGS_RELEASE,
     }
 
+    DOWNLOAD_TIMEOUT = 60
+
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+        super().__init__()
+        self._client = http_client
+
+    @property
+    def _http_client(self) -> httpx.AsyncClient:
+        return self._client or get_http_client()
+
     async def _execute(self, **kwargs: Any) -> list[dict[str, Any]] | dict[str, Any] | bytes:
         """Execute CVM data retrieval."""
         action = kwargs.get("action", "search")
@@ -65,32 +76,32 @@ class CVMTool(BaseTool):
         year: int | None = None,
     ) -> list[dict[str, Any]]:
         """Search for documents in CVM database."""
-        async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-            try:
-                results: list[dict[str, Any]] = []
+        client = self._http_client
+        try:
+            results: list[dict[str, Any]] = []
 
-                if ticker:
-                    rad_results = await self._search_rad(client, ticker, document_type, year)
-                    results.extend(rad_results)
+            if ticker:
+                rad_results = await self._search_rad(client, ticker, document_type, year)
+                results.extend(rad_results)
 
-                if company_name or (not ticker and not results):
-                    open_data_results = await self._search_open_data(
-                        client, company_name, document_type, year
-                    )
-                    results.extend(open_data_results)
+            if company_name or (not ticker and not results):
+                open_data_results = await self._search_open_data(
+                    client, company_name, document_type, year
+                )
+                results.extend(open_data_results)
 
-                return results
+            return results
 
-            except httpx.TimeoutException:
-                raise ExternalAPIError(
-                    message="CVM request timed out",
-                    service=self.name,
-                )
-            except Exception as e:
-                raise ExternalAPIError(
-                    message=f"Failed to search CVM: {str(e)}",
-                    service=self.name,
-                )
+        except httpx.TimeoutException:
+            raise ExternalAPIError(
+                message="CVM request timed out",
+                service=self.name,
+            )
+        except Exception as e:
+            raise ExternalAPIError(
+                message=f"Failed to search CVM: {str(e)}",
+                service=self.name,
+            )
 
     async def _search_rad(
         self,
@@ -207,61 +218,60 @@ class CVMTool(BaseTool):
         company_name: str | None = None,
     ) -> dict[str, Any]:
         """Get company information from CVM."""
-        async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-            try:
-                url = f"{self.BASE_URL}/api/3/action/package_show?id=cia_aberta-cad"
-                response = await client.get(url)
+        try:
+            url = f"{self.BASE_URL}/api/3/action/package_show?id=cia_aberta-cad"
+            response = await self._http_client.get(url)
 
-                if response.status_code != 200:
-                    raise ExternalAPIError(
-                        message="Failed to fetch company registry",
-                        service=self.name,
-                    )
+            if response.status_code != 200:
+                raise ExternalAPIError(
+                    message="Failed to fetch company registry",
+                    service=self.name,
+                )
 
-                data = response.json()
-                if not data.get("success"):
-                    raise ExternalAPIError(
-                        message="Invalid response from CVM",
-                        service=self.name,
-                    )
-
-                result = data.get("result", {})
-                resources = result.get("resources", [])
-
-                csv_resource = next(
-                    (r for r in resources if r.get("format", "").upper() == "CSV"),
-                    None,
+            data = response.json()
+            if not data.get("success"):
+                raise ExternalAPIError(
+                    message="Invalid response from CVM",
+                    service=self.name,
                 )
 
-                if csv_resource:
-                    return {
-                        "source": "CVM Registry",
-                        "data_url": csv_resource.get("url"),
-                        "format": "CSV",
-                        "last_modified": csv_resource.get("last_modified"),
-                        "search_params": {
-                            "ticker": ticker,
-                            "company_name": company_name,
-                        },
-                        "note": "Download CSV and filter by CODIGO_CVM or DENOM_SOCIAL",
-                    }
+            result = data.get("result", {})
+            resources = result.get("resources", [])
 
+            csv_resource = next(
+                (r for r in resources if r.get("format", "").upper() == "CSV"),
+                None,
+            )
+
+            if csv_resource:
                 return {
                     "source": "CVM Registry",
-                    "resources": resources,
+                    "data_url": csv_resource.get("url"),
+                    "format": "CSV",
+                    "last_modified": csv_resource.get("last_modified"),
                     "search_params": {
                         "ticker": ticker,
                         "company_name": company_name,
                     },
+                    "note": "Download CSV and filter by CODIGO_CVM or DENOM_SOCIAL",
                 }
 
-            except ExternalAPIError:
-                raise
-            except Exception as e:
-                raise ExternalAPIError(
-                    message=f"Failed to get company info: {str(e)}",
-                    service=self.name,
-                )
+            return {
+                "source": "CVM Registry",
+                "resources": resources,
+                "search_params": {
+                    "ticker": ticker,
+                    "company_name": company_name,
+                },
+            }
+
+        except ExternalAPIError:
+            raise
+        except Exception as e:
+            raise ExternalAPIError(
+                message=f"Failed to get company info: {str(e)}",
+                service=self.name,
+            )
 
     async def _list_filings(
         self,
@@ -269,69 +279,71 @@ class CVMTool(BaseTool):
         year: int | None = None,
     ) -> list[dict[str, Any]]:
         """List recent filings for a company."""
-        async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-            try:
-                current_year = year or datetime.now().year
-                filings: list[dict[str, Any]] = []
-
-                for doc_type in ["DFP", "ITR", "FR"]:
-                    dataset = f"cia_aberta-doc-{doc_type.lower()}_con"
-                    url = f"{self.BASE_URL}/api/3/action/package_show?id={dataset}"
-
-                    try:
-                        response = await client.get(url)
-                        if response.status_code == 200:
-                            data = response.json()
-                            if data.get("success"):
-                                resources = data.get("result", {}).get("resources", [])
-                                for resource in resources:
-                                    if str(current_year) in resource.get("name", ""):
-                                        filings.append(
-                                            {
-                                                "ticker": ticker.upper(),
-                                                "document_type": doc_type,
-                                                "year": current_year,
-                                                "resource_name": resource.get("name"),
-                                                "url": resource.get("url"),
-                                                "format": resource.get("format"),
-                                            }
-                                        )
-                    except Exception:
-                        continue
-
-                return filings
+        try:
+            current_year = year or datetime.now().year
+            filings: list[dict[str, Any]] = []
 
-            except Exception as e:
-                raise ExternalAPIError(
-                    message=f"Failed to list filings: {str(e)}",
-                    service=self.name,
-                )
+            for doc_type in ["DFP", "ITR", "FR"]:
+                dataset = f"cia_aberta-doc-{doc_type.lower()}_con"
+                url = f"{self.BASE_URL}/api/3/action/package_show?id={dataset}"
 
-    async def _download_document(self, url: str) -> bytes:
-        """Download a document from CVM."""
-        async with httpx.AsyncClient(timeout=60) as client:
-            try:
-                response = await client.get(url, follow_redirects=True)
+                try:
+                    response = await self._http_client.get(url)
+                    if response.status_code == 200:
+                        data = response.json()
+                        if data.get("success"):
+                            resources = data.get("result", {}).get("resources", [])
+                            for resource in resources:
+                                if str(current_year) in resource.get("name", ""):
+                                    filings.append(
+                                        {
+                                            "ticker": ticker.upper(),
+                                            "document_type": doc_type,
+                                            "year": current_year,
+                                            "resource_name": resource.get("name"),
+                                            "url": resource.get("url"),
+                                            "format": resource.get("format"),
+                                        }
+                                    )
+                except Exception:
+                    continue
 
-                if response.status_code != 200:
-                    raise ExternalAPIError(
-                        message=f"Failed to download document: HTTP {response.status_code}",
-                        service=self.name,
-                    )
+            return filings
+
+        except Exception as e:
+            raise ExternalAPIError(
+                message=f"Failed to list filings: {str(e)}",
+                service=self.name,
+            )
 
-                return response.content
+    async def _download_document(self, url: str) -> bytes:
+        """Download a document from CVM."""
+        try:
+            response = await self._http_client.get(
+                url,
+                follow_redirects=True,
+                timeout=self.DOWNLOAD_TIMEOUT,
+            )
 
-            except httpx.TimeoutException:
-                raise ExternalAPIError(
-                    message="Document download timed out",
-                    service=self.name,
-                )
-            except Exception as e:
+            if response.status_code != 200:
                 raise ExternalAPIError(
-                    message=f"Failed to download document: {str(e)}",
+                    message=f"Failed to download document: HTTP {response.status_code}",
                     service=self.name,
                 )
 
+            return response.content
+
+        except httpx.TimeoutException:
+            raise ExternalAPIError(
+                message="Document download timed out",
+                service=self.name,
+            )
+        except Exception as e:
+            raise ExternalAPIError(
+                message=f"Failed to download document: {str(e)}",
+                service=self.name,
+            )
+
     def map_document_type(self, cvm_type: str) -> DocumentType:
         """Map CVM document type to internal document type."""
         return self.DOCUMENT_TYPE_MAPPING.get(cvm_type.upper(), DocumentType.OTHER)
@@ -8,6 +8,7 @@ from bs4 import BeautifulSoup
 from src.config.settings import Settings
 from src.core.exceptions import ExternalAPIError
 from src.core.types import NewsItem
+from src.infrastructure.http import get_http_client
 from src.tools.base import BaseTool
 
 
@@ -20,13 +21,22 @@ class NewsTool(BaseTool):
     NEWS_API_URL = "https://newsapi.org/v2"
     GOOGLE_NEWS_URL = "https://news.google.com"
 
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         super().__init__()
         self._settings = settings
+        self._client = http_client
         self._news_api_key: str | None = None
         if settings and settings.news_api_key:
             self._news_api_key = settings.news_api_key.get_secret_value()
 
+    @property
+    def _http_client(self) -> httpx.AsyncClient:
+        return self._client or get_http_client()
+
     async def _execute(self, **kwargs: Any) -> list[NewsItem] | dict[str, Any]:
         """Execute news retrieval."""
         action = kwargs.get("action", "search")
@@ -100,60 +110,59 @@ class NewsTool(BaseTool):
         results: list[NewsItem] = []
         from_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
 
-        async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-            for term in search_terms[:3]:
-                try:
-                    url = f"{self.NEWS_API_URL}/everything"
-                    params = {
-                        "q": f"{term} (bolsa OR ações OR mercado OR financeiro)",
-                        "from": from_date,
-                        "language": "pt",
-                        "sortBy": "relevancy",
-                        "pageSize": 10,
-                        "apiKey": self._news_api_key,
-                    }
-
-                    response = await client.get(url, params=params)
-
-                    if response.status_code != 200:
-                        self.logger.warning(
-                            "news_api_error",
-                            status_code=response.status_code,
-                            term=term,
-                        )
-                        continue
+        for term in search_terms[:3]:
+            try:
+                url = f"{self.NEWS_API_URL}/everything"
+                params = {
+                    "q": f"{term} (bolsa OR ações OR mercado OR financeiro)",
+                    "from": from_date,
+                    "language": "pt",
+                    "sortBy": "relevancy",
+                    "pageSize": 10,
+                    "apiKey": self._news_api_key,
+                }
+
+                response = await self._http_client.get(url, params=params)
+
+                if response.status_code != 200:
+                    self.logger.warning(
+                        "news_api_error",
+                        status_code=response.status_code,
+                        term=term,
+                    )
+                    continue
 
-                    data = response.json()
+                data = response.json()
 
-                    for article in data.get("articles", []):
-                        try:
-                            published = article.get("publishedAt", "")
-                            if published:
-                                published_dt = datetime.fromisoformat(
-                                    published.replace("Z", "+00:00")
-                                )
-                            else:
-                                published_dt = datetime.now()
-
-                            results.append(
-                                NewsItem(
-                                    title=article.get("title", ""),
-                                    source=article.get("source", {}).get("name", "Unknown"),
-                                    url=article.get("url", ""),
-                                    published_at=published_dt,
-                                    summary=article.get("description"),
-                                    tickers=[
-                                        t for t in search_terms if t.upper() in term.upper()
-                                    ],
-                                )
+                for article in data.get("articles", []):
+                    try:
+                        published = article.get("publishedAt", "")
+                        if published:
+                            published_dt = datetime.fromisoformat(
+                                published.replace("Z", "+00:00")
                             )
-                        except Exception as e:
-                            self.logger.warning("article_parse_error", error=str(e))
-                            continue
+                        else:
+                            published_dt = datetime.now()
+
+                        results.append(
+                            NewsItem(
+                                title=article.get("title", ""),
+                                source=article.get("source", {}).get("name", "Unknown"),
+                                url=article.get("url", ""),
+                                published_at=published_dt,
+                                summary=article.get("description"),
+                                tickers=[
+                                    t for t in search_terms if t.upper() in term.upper()
+                                ],
+                            )
+                        )
+                    except Exception as e:
+                        self.logger.warning("article_parse_error", error=str(e))
+                        continue
 
-                except Exception as e:
-                    self.logger.warning("news_api_search_error", term=term, error=str(e))
-                    continue
+            except Exception as e:
+                self.logger.warning("news_api_search_error", term=term, error=str(e))
+                continue
 
         return results
 
@@ -164,57 +173,56 @@ class NewsTool(BaseTool):
         """Search news using Google News RSS."""
         results: list[NewsItem] = []
 
-        async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-            for term in search_terms[:3]:
-                try:
-                    encoded_query = quote_plus(f"{term} ações Brasil")
-                    url = f"{self.GOOGLE_NEWS_URL}/rss/search?q={encoded_query}&hl=pt-BR&gl=BR&ceid=BR:pt-419"
+        for term in search_terms[:3]:
+            try:
+                encoded_query = quote_plus(f"{term} ações Brasil")
+                url = f"{self.GOOGLE_NEWS_URL}/rss/search?q={encoded_query}&hl=pt-BR&gl=BR&ceid=BR:pt-419"
 
-                    response = await client.get(url)
+                response = await self._http_client.get(url)
 
-                    if response.status_code != 200:
-                        continue
+                if response.status_code != 200:
+                    continue
 
-                    soup = BeautifulSoup(response.text, "lxml-xml")
-                    items = soup.find_all("item")
+                soup = BeautifulSoup(response.text, "lxml-xml")
+                items = soup.find_all("item")
 
-                    for item in items[:10]:
-                        try:
-                            title = item.find("title")
-                            link = item.find("link")
-                            pub_date = item.find("pubDate")
-                            source = item.find("source")
-
-                            if not title or not link:
-                                continue
-
-                            if pub_date:
-                                try:
-                                    published_dt = datetime.strptime(
-                                        pub_date.text, "%a, %d %b %Y %H:%M:%S %Z"
-                                    )
-                                except ValueError:
-                                    published_dt = datetime.now()
-                            else:
-                                published_dt = datetime.now()
+                for item in items[:10]:
+                    try:
+                        title = item.find("title")
+                        link = item.find("link")
+                        pub_date = item.find("pubDate")
+                        source = item.find("source")
 
-                            results.append(
-                                NewsItem(
-                                    title=title.text,
-                                    source=source.text if source else "Google News",
-                                    url=link.text,
-                                    published_at=published_dt,
-                                    tickers=[term.upper()] if len(term) <= 6 else [],
+                        if not title or not link:
+                            continue
+
+                        if pub_date:
+                            try:
+                                published_dt = datetime.strptime(
+                                    pub_date.text, "%a, %d %b %Y %H:%M:%S %Z"
                                 )
+                            except ValueError:
+                                published_dt = datetime.now()
+                        else:
+                            published_dt = datetime.now()
+
+                        results.append(
+                            NewsItem(
+                                title=title.text,
+                                source=source.text if source else "Google News",
+                                url=link.text,
+                                published_at=published_dt,
+                                tickers=[term.upper()] if len(term) <= 6 else [],
                             )
+                        )
 
-                        except Exception as e:
-                            self.logger.warning("google_news_item_error", error=str(e))
-                            continue
+                    except Exception as e:
+                        self.logger.warning("google_news_item_error", error=str(e))
+                        continue
 
-                except Exception as e:
-                    self.logger.warning("google_news_search_error", term=term, error=str(e))
-                    continue
+            except Exception as e:
+                self.logger.warning("google_news_search_error", term=term, error=str(e))
+                continue
 
         return results
 
@@ -223,44 +231,43 @@ class NewsTool(BaseTool):
         results: list[NewsItem] = []
 
         if self._news_api_key:
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                try:
-                    url = f"{self.NEWS_API_URL}/top-headlines"
-                    params = {
-                        "country": "br",
-                        "category": category,
-                        "pageSize": 20,
-                        "apiKey": self._news_api_key,
-                    }
-
-                    response = await client.get(url, params=params)
-
-                    if response.status_code == 200:
-                        data = response.json()
-                        for article in data.get("articles", []):
-                            try:
-                                published = article.get("publishedAt", "")
-                                if published:
-                                    published_dt = datetime.fromisoformat(
-                                        published.replace("Z", "+00:00")
-                                    )
-                                else:
-                                    published_dt = datetime.now()
-
-                                results.append(
-                                    NewsItem(
-                                        title=article.get("title", ""),
-                                        source=article.get("source", {}).get("name", "Unknown"),
-                                        url=article.get("url", ""),
-                                        published_at=published_dt,
-                                        summary=article.get("description"),
-                                    )
+            try:
+                url = f"{self.NEWS_API_URL}/top-headlines"
+                params = {
+                    "country": "br",
+                    "category": category,
+                    "pageSize": 20,
+                    "apiKey": self._news_api_key,
+                }
+
+                response = await self._http_client.get(url, params=params)
+
+                if response.status_code == 200:
+                    data = response.json()
+                    for article in data.get("articles", []):
+                        try:
+                            published = article.get("publishedAt", "")
+                            if published:
+                                published_dt = datetime.fromisoformat(
+                                    published.replace("Z", "+00:00")
+                                )
+                            else:
+                                published_dt = datetime.now()
+
+                            results.append(
+                                NewsItem(
+                                    title=article.get("title", ""),
+                                    source=article.get("source", {}).get("name", "Unknown"),
+                                    url=article.get("url", ""),
+                                    published_at=published_dt,
+                                    summary=article.get("description"),
                                 )
-                            except Exception:
-                                continue
+                            )
+                        except Exception:
+                            continue
 
-                except Exception as e:
-                    self.logger.warning("headlines_error", error=str(e))
+            except Exception as e:
+                self.logger.warning("headlines_error", error=str(e))
 
         return results
 
@@ -1,3 +1,5 @@
+import asyncio
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -15,6 +17,23 @@ class YahooFinanceTool(BaseTool):
     description = "Fetches stock quotes, historical data, and fundamental indicators from Yahoo Finance"
 
     BRAZILIAN_SUFFIX = ".SA"
+    HISTORY_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+
+    @staticmethod
+    def _fetch_info(normalized_ticker: str) -> dict[str, Any]:
+        """Fetch the raw quote info for a ticker. Blocks on network I/O."""
+        return yf.Ticker(normalized_ticker).info
+
+    @staticmethod
+    def _fetch_history(normalized_ticker: str, period: str) -> Any:
+        """Fetch the raw price history frame for a ticker. Blocks on network I/O."""
+        return yf.Ticker(normalized_ticker).history(period=period)
+
+    @staticmethod
+    def _fetch_info_and_dividends(normalized_ticker: str) -> tuple[dict[str, Any], Any]:
+        """Fetch the raw info and dividend series for a ticker. Blocks on network I/O."""
+        stock = yf.Ticker(normalized_ticker)
+        return stock.info, stock.dividends
 
     def _normalize_ticker(self, ticker: str) -> str:
         """Normalize ticker to Yahoo Finance format."""
@@ -38,6 +57,9 @@ class YahooFinanceTool(BaseTool):
         elif action == "history" and ticker:
             period = kwargs.get("period", "1mo")
             return await self._get_history(ticker, period)
+        elif action == "history_rows" and ticker:
+            period = kwargs.get("period", "1mo")
+            return self._history_rows(await self._load_history(ticker, period))
         elif action == "info" and ticker:
             return await self._get_full_info(ticker)
         else:
@@ -51,8 +73,7 @@ class YahooFinanceTool(BaseTool):
         normalized_ticker = self._normalize_ticker(ticker)
 
         try:
-            stock = yf.Ticker(normalized_ticker)
-            info = stock.info
+            info = await asyncio.to_thread(self._fetch_info, normalized_ticker)
 
             if not info or "regularMarketPrice" not in info:
                 raise ExternalAPIError(
@@ -100,80 +121,92 @@ class YahooFinanceTool(BaseTool):
 
     async def _get_multiple_quotes(self, tickers: list[str]) -> list[MarketData]:
         """Get quotes for multiple tickers."""
+        quotes = await asyncio.gather(
+            *(self._get_quote(ticker) for ticker in tickers),
+            return_exceptions=True,
+        )
+
         results: list[MarketData] = []
-        for ticker in tickers:
-            try:
-                quote = await self._get_quote(ticker)
-                results.append(quote)
-            except ExternalAPIError:
+        for ticker, quote in zip(tickers, quotes, strict=True):
+            if isinstance(quote, ExternalAPIError):
                 self.logger.warning("quote_fetch_failed", ticker=ticker)
                 continue
+            if isinstance(quote, BaseException):
+                raise quote
+            results.append(quote)
         return results
 
-    async def _get_history(
-        self,
-        ticker: str,
-        period: str = "1mo",
-    ) -> dict[str, Any]:
-        """Get historical price data."""
+    async def _load_history(self, ticker: str, period: str) -> Any:
+        """Load the historical price frame for a ticker."""
         normalized_ticker = self._normalize_ticker(ticker)
 
         try:
-            stock = yf.Ticker(normalized_ticker)
-            hist = stock.history(period=period)
-
-            if hist.empty:
-                raise ExternalAPIError(
-                    message=f"No historical data found for {ticker}",
-                    service=self.name,
-                )
-
-            return {
-                "ticker": ticker.upper(),
-                "period": period,
-                "data": [
-                    {
-                        "date": index.strftime("%Y-%m-%d"),
-                        "open": row["Open"],
-                        "high": row["High"],
-                        "low": row["Low"],
-                        "close": row["Close"],
-                        "volume": int(row["Volume"]),
-                    }
-                    for index, row in hist.iterrows()
-                ],
-                "statistics": {
-                    "min_price": float(hist["Low"].min()),
-                    "max_price": float(hist["High"].max()),
-                    "avg_price": float(hist["Close"].mean()),
-                    "total_volume": int(hist["Volume"].sum()),
-                    "price_change": float(hist["Close"].iloc[-1] - hist["Close"].iloc[0]),
-                    "price_change_percent": float(
-                        ((hist["Close"].iloc[-1] - hist["Close"].iloc[0]) / hist["Close"].iloc[0])
-                        * 100
-                    ),
-                },
-            }
-
+            hist = await asyncio.to_thread(self._fetch_history, normalized_ticker, period)
         except Exception as e:
-            if "No historical data" in str(e):
-                raise
             raise ExternalAPIError(
                 message=f"Failed to fetch history for {ticker}: {str(e)}",
                 service=self.name,
             )
 
+        if hist.empty:
+            raise ExternalAPIError(
+                message=f"No historical data found for {ticker}",
+                service=self.name,
+            )
+
+        return hist
+
+    @classmethod
+    def _history_rows(cls, hist: Any) -> Iterator[dict[str, Any]]:
+        """Yield one OHLCV record per row of a history frame."""
+        prices = hist[list(cls.HISTORY_COLUMNS)]
+        for index, open_, high, low, close, volume in prices.itertuples():
+            yield {
+                "date": index.strftime("%Y-%m-%d"),
+                "open": open_,
+                "high": high,
+                "low": low,
+                "close": close,
+                "volume": int(volume),
+            }
+
+    async def _get_history(
+        self,
+        ticker: str,
+        period: str = "1mo",
+    ) -> dict[str, Any]:
+        """Get historical price data."""
+        hist = await self._load_history(ticker, period)
+
+        return {
+            "ticker": ticker.upper(),
+            "period": period,
+            "data": list(self._history_rows(hist)),
+            "statistics": {
+                "min_price": float(hist["Low"].min()),
+                "max_price": float(hist["High"].max()),
+                "avg_price": float(hist["Close"].mean()),
+                "total_volume": int(hist["Volume"].sum()),
+                "price_change": float(hist["Close"].iloc[-1] - hist["Close"].iloc[0]),
+                "price_change_percent": float(
+                    ((hist["Close"].iloc[-1] - hist["Close"].iloc[0]) / hist["Close"].iloc[0])
+                    * 100
+                ),
+            },
+        }
+
     async def _get_full_info(self, ticker: str) -> dict[str, Any]:
         """Get comprehensive company information."""
         normalized_ticker = self._normalize_ticker(ticker)
 
         try:
-            stock = yf.Ticker(normalized_ticker)
-            info = stock.info
+            info, dividends = await asyncio.to_thread(
+                self._fetch_info_and_dividends,
+                normalized_ticker,
+            )
 
             end_date = datetime.now()
             start_date = end_date - timedelta(days=365)
-            dividends = stock.dividends
             dividends_year = dividends[dividends.index >= start_date.strftime("%Y-%m-%d")]
 
             return {
@@ -1,5 +1,5 @@
 import time
-from datetime import datetime
+from collections.abc import AsyncIterator
 from typing import Any
 from uuid import uuid4
 
@@ -7,15 +7,38 @@ from langgraph.graph import END, StateGraph
 
 from src.config.logging import LoggerMixin
 from src.config.settings import Settings
+from src.core.clock import utc_now
 from src.core.types import AgentState, ResearchQuery, ResearchResponse
 from src.infrastructure.cache import CacheService
 from src.rag.retriever import RAGRetriever
 from src.workflows.nodes import WorkflowNodes
 
+WORKFLOW_BATCH_MAX_CONCURRENCY = 16
+
 
 class FinancialResearchWorkflow(LoggerMixin):
     """Main workflow orchestrator using LangGraph."""
 
+    GRAPH_VISUALIZATION: dict[str, Any] = {
+        "nodes": [
+            {"id": "router", "label": "Router Agent"},
+            {"id": "collector", "label": "Collector Agent"},
+            {"id": "rag", "label": "RAG Agent"},
+            {"id": "analyst", "label": "Analyst Agent"},
+            {"id": "reporter", "label": "Reporter Agent"},
+        ],
+        "edges": [
+            {"from": "router", "to": "collector", "label": "needs data"},
+            {"from": "router", "to": "rag", "label": "needs docs"},
+            {"from": "router", "to": "analyst", "label": "direct"},
+            {"from": "collector", "to": "rag", "label": "needs docs"},
+            {"from": "collector", "to": "analyst", "label": "analyze"},
+            {"from": "rag", "to": "analyst", "label": "always"},
+            {"from": "analyst", "to": "reporter", "label": "always"},
+            {"from": "reporter", "to": "END", "label": "complete"},
+        ],
+    }
+
     def __init__(
         self,
         settings: Settings,
@@ -117,22 +140,7 @@ class FinancialResearchWorkflow(LoggerMixin):
             query_length=len(query),
         )
 
-        research_query = ResearchQuery(
-            query_id=query_id,
-            raw_query=query,
-            user_id=user_id,
-            timestamp=datetime.utcnow(),
-        )
-
-        initial_state: AgentState = {
-            "query": research_query,
-            "errors": [],
-            "metadata": {
-                "start_time": datetime.utcnow().isoformat(),
-                "user_id": user_id,
-            },
-            "completed_agents": [],
-        }
+        initial_state = self._build_initial_state(query_id, query, user_id)
 
         try:
             final_state = await self._graph.ainvoke(initial_state)
@@ -181,6 +189,80 @@ class FinancialResearchWorkflow(LoggerMixin):
                 processing_time_ms=processing_time,
             )
 
+    async def run_batch(
+        self,
+        queries: list[str],
+        user_id: str | None = None,
+    ) -> list[ResearchResponse]:
+        """Execute the workflow for several queries with bounded concurrency."""
+        start_time = time.perf_counter()
+        query_ids = [str(uuid4()) for _ in queries]
+        initial_states = [
+            self._build_initial_state(query_id, query, user_id)
+            for query_id, query in zip(query_ids, queries, strict=True)
+        ]
+
+        final_states = await self._graph.abatch(
+            initial_states,
+            config={"max_concurrency": WORKFLOW_BATCH_MAX_CONCURRENCY},
+            return_exceptions=True,
+        )
+        processing_time = (time.perf_counter() - start_time) * 1000
+
+        self.logger.info(
+            "workflow_batch_completed",
+            batch_size=len(queries),
+            processing_time_ms=processing_time,
+        )
+
+        responses: list[ResearchResponse] = []
+        for query_id, final_state in zip(query_ids, final_states, strict=True):
+            if isinstance(final_state, Exception):
+                self.logger.error("workflow_error", query_id=query_id, error=str(final_state))
+                content = f"Erro ao processar consulta: {str(final_state)}"
+            elif response := final_state.get("response"):
+                response.processing_time_ms = processing_time
+                responses.append(response)
+                continue
+            else:
+                content = "Não foi possível processar sua consulta. Por favor, tente novamente."
+
+            responses.append(
+                ResearchResponse(
+                    response_id=str(uuid4()),
+                    query_id=query_id,
+                    content=content,
+                    format="plain",
+                    processing_time_ms=processing_time,
+                )
+            )
+
+        return responses
+
+    def _build_initial_state(
+        self,
+        query_id: str,
+        query: str,
+        user_id: str | None,
+    ) -> AgentState:
+        """Build the initial workflow state for a query."""
+        research_query = ResearchQuery(
+            query_id=query_id,
+            raw_query=query,
+            user_id=user_id,
+            timestamp=utc_now(),
+        )
+
+        return {
+            "query": research_query,
+            "errors": [],
+            "metadata": {
+                "start_time": utc_now().isoformat(),
+                "user_id": user_id,
+            },
+            "completed_agents": [],
+        }
+
     async def run_with_state(
         self,
         query: str,
@@ -220,24 +302,30 @@ class FinancialResearchWorkflow(LoggerMixin):
 
         return fallback_response, final_state
 
+    async def run_events(
+        self,
+        query: str,
+        user_id: str | None = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Execute the workflow, yielding events as each agent completes."""
+        start_time = time.perf_counter()
+        query_id = str(uuid4())
+
+        yield "start", {"query_id": query_id}
+
+        final_state = self._build_initial_state(query_id, query, user_id)
+        async for update in self._graph.astream(final_state, stream_mode="updates"):
+            for agent, state in update.items():
+                if state:
+                    final_state = state
+                yield "agent_complete", {"agent": agent}
+
+        processing_time = (time.perf_counter() - start_time) * 1000
+        response = final_state.get("response")
+
+        yield "content", {"content": response.content if response else "Processamento incompleto"}
+        yield "done", {"processing_time_ms": processing_time}
+
     def get_graph_visualization(self) -> dict[str, Any]:
         """Get graph structure for visualization."""
-        return {
-            "nodes": [
-                {"id": "router", "label": "Router Agent"},
-                {"id": "collector", "label": "Collector Agent"},
-                {"id": "rag", "label": "RAG Agent"},
-                {"id": "analyst", "label": "Analyst Agent"},
-                {"id": "reporter", "label": "Reporter Agent"},
-            ],
-            "edges": [
-                {"from": "router", "to": "collector", "label": "needs data"},
-                {"from": "router", "to": "rag", "label": "needs docs"},
-                {"from": "router", "to": "analyst", "label": "direct"},
-                {"from": "collector", "to": "rag", "label": "needs docs"},
-                {"from": "collector", "to": "analyst", "label": "analyze"},
-                {"from": "rag", "to": "analyst", "label": "always"},
-                {"from": "analyst", "to": "reporter", "label": "always"},
-                {"from": "reporter", "to": "END", "label": "complete"},
-            ],
-        }
+        return self.GRAPH_VISUALIZATION
@@ -9,6 +9,7 @@ from src.config.logging import LoggerMixin
 from src.config.settings import Settings
 from src.core.types import AgentState
 from src.infrastructure.cache import CacheService
+from src.infrastructure.semantic_cache import SemanticCache
 from src.rag.retriever import RAGRetriever
 
 
@@ -24,11 +25,18 @@ class WorkflowNodes(LoggerMixin):
         self._settings = settings
         self._cache = cache_service
         self._retriever = rag_retriever
+        self._semantic_cache = (
+            SemanticCache(settings, cache_service)
+            if cache_service and settings.semantic_cache_enabled
+            else None
+        )
 
-        self._router = RouterAgent(settings)
+        self._router = RouterAgent(settings, cache_service)
         self._collector = CollectorAgent(settings, cache_service)
-        self._rag = RAGAgent(settings, rag_retriever) if rag_retriever else None
-        self._analyst = AnalystAgent(settings, rag_retriever)
+        self._rag = (
+            RAGAgent(settings, rag_retriever, self._semantic_cache) if rag_retriever else None
+        )
+        self._analyst = AnalystAgent(settings, rag_retriever, self._semantic_cache)
         self._reporter = ReporterAgent(settings)
 
     async def route_query(self, state: AgentState) -> AgentState:
@@ -64,6 +64,8 @@ def mock_cache() -> MagicMock:
     mock.set = AsyncMock(return_value=True)
     mock.get_model = AsyncMock(return_value=None)
     mock.set_model = AsyncMock(return_value=True)
+    mock.get_models_many = AsyncMock(side_effect=lambda keys, model_class: [None] * len(keys))
+    mock.set_many = AsyncMock(return_value=True)
     mock.health_check = AsyncMock(return_value=True)
     return mock
 
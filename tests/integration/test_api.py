@@ -1,5 +1,12 @@
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
+
+from src.api.app import create_app
+from src.api.dependencies import ServiceRegistry, close_services, get_workflow
+from src.api.schemas.responses import MarketDataResponse, NewsItemResponse
+from src.core.types import MarketData, NewsItem
 
 
 class TestHealthEndpoints:
@@ -68,6 +75,46 @@ class TestResearchEndpoints:
         assert "edges" in data
 
 
+class TestResearchStreaming:
+    """Tests for the streaming research endpoint."""
+
+    @pytest.fixture
+    def stream_client(self) -> AsyncClient:
+        async def run_events(query: str, user_id: str | None = None):
+            yield "started", {"query": query}
+
+        workflow = MagicMock(run_events=run_events)
+        app = create_app()
+        app.dependency_overrides[get_workflow] = lambda: workflow
+        return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+    @pytest.mark.asyncio
+    async def test_stream_gzipped_when_accepted(self, stream_client: AsyncClient) -> None:
+        """Test that the event stream is gzipped for clients that accept gzip."""
+        async with stream_client as client:
+            response = await client.post(
+                "/research/query/stream",
+                json={"query": "Cotação de PETR4"},
+                headers={"Accept-Encoding": "br, gzip;q=0.8"},
+            )
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert '"type":"started"' in response.text
+
+    @pytest.mark.asyncio
+    async def test_stream_uncompressed_when_gzip_refused(self, stream_client: AsyncClient) -> None:
+        """Test that gzip;q=0 keeps the event stream uncompressed."""
+        async with stream_client as client:
+            response = await client.post(
+                "/research/query/stream",
+                json={"query": "Cotação de PETR4"},
+                headers={"Accept-Encoding": "gzip;q=0, identity"},
+            )
+
+        assert "content-encoding" not in response.headers
+        assert '"type":"started"' in response.text
+
+
 class TestMarketEndpoints:
     """Tests for market data endpoints."""
 
@@ -78,6 +125,16 @@ class TestMarketEndpoints:
 
         assert response.status_code == 400
 
+    def test_response_models_mirror_domain_models(self) -> None:
+        """Test that market responses only use fields the domain models provide."""
+        for response_model, domain_model in (
+            (MarketDataResponse, MarketData),
+            (NewsItemResponse, NewsItem),
+        ):
+            for name, field in response_model.model_fields.items():
+                assert name in domain_model.model_fields
+                assert field.annotation == domain_model.model_fields[name].annotation
+
 
 class TestDocumentEndpoints:
     """Tests for document endpoints."""
@@ -121,3 +178,43 @@ class TestRootEndpoint:
         data = response.json()
         assert "name" in data
         assert "version" in data
+
+
+class TestErrorHandling:
+    """Tests for unexpected error responses."""
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_keeps_middleware_headers(self) -> None:
+        """Test that an unhandled error still gets request id and CORS headers."""
+        app = create_app()
+
+        @app.get("/boom")
+        async def boom() -> None:
+            raise RuntimeError("boom")
+
+        transport = ASGITransport(app=app, raise_app_exceptions=False)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/boom", headers={"Origin": "http://example.com"})
+
+        assert response.status_code == 500
+        assert response.json()["error"] == "INTERNAL_SERVER_ERROR"
+        assert "x-request-id" in response.headers
+        assert "access-control-allow-origin" in response.headers
+
+
+class TestServiceLifecycle:
+    """Tests for service shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_close_failure_does_not_skip_other_services(self) -> None:
+        """Test that one service failing to close still closes the others."""
+        database = MagicMock(close=AsyncMock())
+        cache = MagicMock(close=AsyncMock(side_effect=ConnectionError("redis down")))
+        vector_store = MagicMock(close=AsyncMock())
+        services = ServiceRegistry(database=database, cache=cache, vector_store=vector_store)
+
+        await close_services(services)
+
+        database.close.assert_awaited_once()
+        cache.close.assert_awaited_once()
+        vector_store.close.assert_awaited_once()
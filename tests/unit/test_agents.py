@@ -2,8 +2,15 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
+from src.agents.analyst import AnalystAgent
 from src.agents.router import RouterAgent
-from src.core.types import AgentState, QueryIntent, QueryIntentType, ResearchQuery
+from src.core.types import (
+    AgentState,
+    MarketData,
+    QueryIntent,
+    QueryIntentType,
+    ResearchQuery,
+)
 
 
 class TestRouterAgent:
@@ -66,6 +73,168 @@ class TestRouterAgent:
         assert intent.intent_type == QueryIntentType.GENERAL
         assert intent.confidence == 0.5
 
+    def test_parse_intent_json_in_text(self, router: RouterAgent) -> None:
+        """Test parsing JSON embedded in surrounding text."""
+        llm_response = 'Resultado:\n```json\n{"intent_type": "market_data"}\n```'
+
+        intent = router._parse_intent(llm_response, [])
+
+        assert intent.intent_type == QueryIntentType.MARKET_DATA
+
+    @pytest.mark.asyncio
+    async def test_execute_reuses_memoized_intent(self, router: RouterAgent) -> None:
+        """Test that a repeated query is classified only once."""
+        router.invoke_llm = AsyncMock(return_value='{"intent_type": "market_data"}')
+        state: AgentState = {
+            "query": ResearchQuery(query_id="test-id", raw_query="Cotação de PETR4"),
+            "errors": [],
+            "metadata": {},
+            "completed_agents": [],
+        }
+
+        first = await router.execute(state)
+        second = await router.execute(state)
+
+        assert router.invoke_llm.await_count == 1
+        assert second["intent"] == first["intent"]
+
+    @pytest.mark.asyncio
+    async def test_execute_does_not_cache_unparsed_intent(self, router: RouterAgent) -> None:
+        """Test that a malformed LLM reply is not cached for the query."""
+        router._cache = MagicMock()
+        router._cache.get_model = AsyncMock(return_value=None)
+        router._cache.set_model = AsyncMock(return_value=True)
+        router.invoke_llm = AsyncMock(return_value="Invalid response without JSON")
+        state: AgentState = {
+            "query": ResearchQuery(query_id="test-id", raw_query="Cotação de PETR4"),
+            "errors": [],
+            "metadata": {},
+            "completed_agents": [],
+        }
+
+        result = await router.execute(state)
+
+        assert result["intent"].intent_type == QueryIntentType.GENERAL
+        router._cache.set_model.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_execute_reclassifies_after_unparsed_intent(self, router: RouterAgent) -> None:
+        """Test that a fallback intent is not memoized in process either."""
+        router.invoke_llm = AsyncMock(
+            side_effect=["Invalid response without JSON", '{"intent_type": "market_data"}']
+        )
+        state: AgentState = {
+            "query": ResearchQuery(query_id="test-id", raw_query="Cotação de PETR4"),
+            "errors": [],
+            "metadata": {},
+            "completed_agents": [],
+        }
+
+        await router.execute(state)
+        result = await router.execute(state)
+
+        assert router.invoke_llm.await_count == 2
+        assert result["intent"].intent_type == QueryIntentType.MARKET_DATA
+        assert "cotação de petr4" in router._intent_memo
+
+
+class TestAnalystAgent:
+    """Tests for Analyst Agent."""
+
+    @pytest.fixture
+    def analyst(self, test_settings) -> AnalystAgent:
+        return AnalystAgent(test_settings)
+
+    def test_parse_analysis_ignores_trailing_braces(self, analyst: AnalystAgent) -> None:
+        """Test that text after the JSON object does not break parsing."""
+        llm_response = (
+            'Segue a análise: {"summary": "Resultado {forte}", "sentiment": "positivo"}'
+            " Observação: valores em {R$}."
+        )
+
+        analysis = analyst._parse_analysis(llm_response)
+
+        assert analysis.summary == "Resultado {forte}"
+        assert analysis.sentiment == "positivo"
+
+    def test_cache_scope_separates_tickers(self, analyst: AnalystAgent) -> None:
+        """Test that analyses for different tickers never share a cache scope."""
+        petr = QueryIntent(intent_type=QueryIntentType.FINANCIAL_ANALYSIS, tickers=["PETR4"])
+        vale = QueryIntent(intent_type=QueryIntentType.FINANCIAL_ANALYSIS, tickers=["VALE3"])
+
+        assert analyst._cache_scope(petr) != analyst._cache_scope(vale)
+
+    def test_cache_scope_ignores_ticker_order(self, analyst: AnalystAgent) -> None:
+        """Test that the same tickers in another order share a cache scope."""
+        first = QueryIntent(intent_type=QueryIntentType.COMPARISON, tickers=["PETR4", "VALE3"])
+        second = QueryIntent(intent_type=QueryIntentType.COMPARISON, tickers=["VALE3", "PETR4"])
+
+        assert analyst._cache_scope(first) == analyst._cache_scope(second)
+
+    @pytest.mark.asyncio
+    async def test_execute_does_not_cache_unparsed_analysis(self, test_settings) -> None:
+        """Test that a fallback analysis is not stored in the semantic cache."""
+        retriever = MagicMock()
+        retriever.embed_query = AsyncMock(return_value=[0.1, 0.2, 0.3])
+        semantic_cache = MagicMock()
+        semantic_cache.get = AsyncMock(return_value=None)
+        semantic_cache.put = AsyncMock()
+        analyst = AnalystAgent(test_settings, retriever=retriever, semantic_cache=semantic_cache)
+        analyst._stream_analysis = AsyncMock(return_value="Sem dados suficientes")
+        state: AgentState = {
+            "query": ResearchQuery(query_id="test-id", raw_query="Análise de PETR4"),
+            "errors": [],
+            "metadata": {},
+            "completed_agents": [],
+        }
+
+        result = await analyst.execute(state)
+
+        assert result["analysis"].confidence_score == 0.5
+        semantic_cache.put.assert_not_awaited()
+
+    def test_format_market_data_missing_metrics(self, analyst: AnalystAgent) -> None:
+        """Test that missing optional metrics are rendered as N/A."""
+        md = MarketData(
+            ticker="PETR4",
+            company_name="Petrobras",
+            current_price=35.5,
+            change_percent=2.5,
+            volume=50000000,
+        )
+
+        formatted = analyst._format_market_data(md)
+
+        assert "- Market Cap: N/A" in formatted
+        assert "- P/E: N/A" in formatted
+        assert "- Dividend Yield: N/A" in formatted
+
+    def test_format_market_data_with_metrics(self, analyst: AnalystAgent) -> None:
+        """Test formatting when all metrics are present."""
+        md = MarketData(
+            ticker="PETR4",
+            company_name="Petrobras",
+            current_price=35.5,
+            change_percent=2.5,
+            volume=50000000,
+            market_cap=450000000000,
+            pe_ratio=5.2,
+            dividend_yield=0.15,
+        )
+
+        formatted = analyst._format_market_data(md)
+
+        assert "- Market Cap: R$ 450,000,000,000" in formatted
+        assert "- P/E: 5.20" in formatted
+        assert "- Dividend Yield: 15.00%" in formatted
+
+    def test_parse_analysis_without_json(self, analyst: AnalystAgent) -> None:
+        """Test fallback when the response has no JSON object."""
+        analysis = analyst._parse_analysis("Sem dados suficientes")
+
+        assert analysis.summary == "Sem dados suficientes"
+        assert analysis.confidence_score == 0.5
+
 
 class TestAgentState:
     """Tests for AgentState operations."""
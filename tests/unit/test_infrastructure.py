@@ -0,0 +1,236 @@
+import asyncio
+from datetime import datetime
+from typing import Any
+
+import msgspec
+import pytest
+import xxhash
+
+from src.config.settings import Settings
+from src.core.singleflight import SingleFlight
+from src.infrastructure.cache import CacheService
+from src.infrastructure.database import DatabaseService
+from src.infrastructure.semantic_cache import SemanticCache
+
+
+class InMemoryCache:
+    """Minimal stand-in for CacheService backed by dictionaries."""
+
+    def __init__(self) -> None:
+        self.values: dict = {}
+        self.sets: dict[str, set[str]] = {}
+
+    async def get_json(self, key: str) -> dict | None:
+        return self.values.get(key)
+
+    async def get_json_many(self, keys: list[str], value_type: Any = Any) -> list:
+        return [
+            msgspec.convert(self.values[key], value_type) if key in self.values else None
+            for key in keys
+        ]
+
+    async def set_json(self, key: str, value: dict, ttl: int | None = None) -> bool:
+        self.values[key] = value
+        return True
+
+    async def add_to_sets(self, keys: list[str], *members: str, ttl: int | None = None) -> bool:
+        for key in keys:
+            self.sets.setdefault(key, set()).update(members)
+        return True
+
+    async def get_set_union(self, keys: list[str]) -> set[str]:
+        return set().union(*(self.sets.get(key, set()) for key in keys))
+
+    async def remove_from_sets(self, keys: list[str], *members: str) -> bool:
+        for key in keys:
+            self.sets.get(key, set()).difference_update(members)
+        return True
+
+
+class TestCacheKey:
+    """Tests for cache key generation."""
+
+    def test_two_part_keys_match_generic_join(self) -> None:
+        """Test that the two-string fast path hashes the same string as the join."""
+        expected = f"fra:{xxhash.xxh3_64_hexdigest(b'quote:PETR4')}"
+
+        assert CacheService.generate_key("quote", "PETR4") == expected
+
+    def test_multi_part_keys_join_with_colons(self) -> None:
+        """Test that other arities hash the colon-joined parts."""
+        expected = f"fra:{xxhash.xxh3_64_hexdigest(b'semantic:rag:0:42')}"
+
+        assert CacheService.generate_key("semantic", "rag", "0", "42") == expected
+
+    def test_keys_are_namespaced(self) -> None:
+        """Test that generated keys carry the application prefix."""
+        assert CacheService.generate_key("intent", "what is petr4").startswith("fra:")
+
+
+class TestRateLimitBlocks:
+    """Tests for the local rate-limit block map."""
+
+    def test_expired_blocks_are_swept_as_map_grows(self, test_settings: Settings) -> None:
+        """Test that identifiers whose block expired do not accumulate."""
+        cache = CacheService(test_settings)
+        for i in range(CacheService.BLOCKED_PRUNE_THRESHOLD):
+            cache._block_locally(f"10.0.0.{i}", 0)
+
+        cache._block_locally("10.0.1.1", 60)
+
+        assert list(cache._blocked_until) == ["10.0.1.1"]
+
+    @pytest.mark.asyncio
+    async def test_check_before_connect_raises(self, test_settings: Settings) -> None:
+        """Test that an unconnected cache is reported instead of failing open."""
+        cache = CacheService(test_settings)
+
+        with pytest.raises(RuntimeError, match="not connected"):
+            await cache.check_rate_limit("ip:10.0.0.1", limit=10, window=60)
+
+        with pytest.raises(RuntimeError, match="not connected"):
+            await cache.check_rate_limit_sliding("ip:10.0.0.1", limit=10, window=60)
+
+
+class TestDatabaseRows:
+    """Tests for the argument tuples shared by single and batch inserts."""
+
+    def test_document_row_matches_insert_columns(self) -> None:
+        """Test that document rows follow INSERT_DOCUMENT_SQL's column order."""
+        reference_date = datetime(2024, 3, 31)
+
+        row = DatabaseService._document_row(
+            document_id="doc-1",
+            company="Petrobras",
+            ticker="petr4",
+            document_type="quarterly_report",
+            reference_date=reference_date,
+            file_hash="abc123",
+        )
+
+        assert row == (
+            "doc-1",
+            "Petrobras",
+            "PETR4",
+            "quarterly_report",
+            reference_date,
+            None,
+            "abc123",
+            None,
+            {},
+        )
+        assert len(row) == DatabaseService.INSERT_DOCUMENT_SQL.count("$")
+
+    def test_query_history_row_matches_insert_columns(self) -> None:
+        """Test that query history rows follow INSERT_QUERY_HISTORY_SQL's column order."""
+        row = DatabaseService._query_history_row(
+            query_id="query-1",
+            query_text="Cotação de PETR4",
+            intent_type="market_data",
+            tokens_used=42,
+            user_id="user-1",
+        )
+
+        assert row == (
+            "query-1",
+            "Cotação de PETR4",
+            "market_data",
+            [],
+            None,
+            42,
+            0,
+            "user-1",
+            {},
+        )
+        assert len(row) == DatabaseService.INSERT_QUERY_HISTORY_SQL.count("$")
+
+
+class TestSemanticCache:
+    """Tests for the LSH semantic cache."""
+
+    @pytest.fixture
+    def cache(self, test_settings: Settings) -> SemanticCache:
+        return SemanticCache(test_settings, InMemoryCache())
+
+    @pytest.fixture
+    def vector(self, test_settings: Settings) -> list[float]:
+        return [float(i % 7) - 3.0 for i in range(test_settings.qdrant_vector_size)]
+
+    @pytest.mark.asyncio
+    async def test_get_returns_value_for_same_vector(
+        self, cache: SemanticCache, vector: list[float]
+    ) -> None:
+        """Test that an identical vector hits the cache."""
+        await cache.put(vector, {"summary": "cached"}, scope="analyst")
+
+        assert await cache.get(vector, scope="analyst") == {"summary": "cached"}
+
+    @pytest.mark.asyncio
+    async def test_get_misses_for_dissimilar_vector(
+        self, cache: SemanticCache, vector: list[float]
+    ) -> None:
+        """Test that an opposite vector does not hit the cache."""
+        await cache.put(vector, {"summary": "cached"}, scope="analyst")
+
+        assert await cache.get([-v for v in vector], scope="analyst") is None
+
+    @pytest.mark.asyncio
+    async def test_scopes_are_isolated(self, cache: SemanticCache, vector: list[float]) -> None:
+        """Test that entries are only visible within their scope."""
+        await cache.put(vector, {"summary": "cached"}, scope="analyst")
+
+        assert await cache.get(vector, scope="rag") is None
+
+    @pytest.mark.asyncio
+    async def test_get_prunes_expired_entry_ids(
+        self, cache: SemanticCache, vector: list[float]
+    ) -> None:
+        """Test that bucket ids whose entry expired are removed on lookup."""
+        await cache.put(vector, {"summary": "cached"}, scope="analyst")
+        store = cache._cache
+        store.values.clear()
+
+        assert await cache.get(vector, scope="analyst") is None
+        assert not any(store.sets.values())
+
+    def test_quantize_preserves_similarity(self, vector: list[float]) -> None:
+        """Test that int8 codes reproduce the unit vector's self-similarity."""
+        codes, scale = SemanticCache._quantize(SemanticCache._normalize(vector))
+
+        assert codes.dtype.name == "int8"
+        assert abs(float((codes.astype("int32") ** 2).sum()) * scale**2 - 1.0) < 0.01
+
+
+class TestSingleFlight:
+    """Tests for in-process request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self) -> None:
+        """Test that concurrent callers with the same key run the call once."""
+        flights = SingleFlight()
+        calls = 0
+
+        async def fetch() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "quote"
+
+        results = await asyncio.gather(*(flights.do("PETR4", fetch) for _ in range(5)))
+
+        assert results == ["quote"] * 5
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_completed_call_is_not_reused(self) -> None:
+        """Test that a finished call is forgotten so the next caller refetches."""
+        flights = SingleFlight()
+        calls = 0
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flights.do("PETR4", fetch) == 1
+        assert await flights.do("PETR4", fetch) == 2
@@ -1,7 +1,12 @@
+import asyncio
+
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from src.rag.chunker import DocumentChunker
+from src.core.types import DocumentChunk
+from src.rag.embeddings import EmbeddingService
+from src.rag.processor import DocumentProcessor
 from src.config.settings import Settings
 
 
@@ -21,6 +26,12 @@ class TestDocumentChunker:
         assert "\r\n" not in normalized
         assert normalized == "Multiple spaces and\n\nnewlines"
 
+    def test_normalize_text_collapses_tabs_with_spaces(self, chunker: DocumentChunker) -> None:
+        """Test that mixed runs of tabs and spaces collapse to one space."""
+        normalized = chunker._normalize_text("Receita\t \tlíquida \t\rLucro\n\n\n\nEbitda")
+
+        assert normalized == "Receita líquida \nLucro\n\nEbitda"
+
     def test_chunk_document_empty(self, chunker: DocumentChunker) -> None:
         """Test chunking empty document."""
         chunks = chunker.chunk_document("doc-1", "")
@@ -99,3 +110,87 @@ class TestChunkIndexing:
 
         chunk_ids = [chunk.chunk_id for chunk in chunks]
         assert len(chunk_ids) == len(set(chunk_ids))
+
+
+class TestEmbeddingService:
+    """Tests for batched embedding generation."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_keep_input_order(self, test_settings: Settings) -> None:
+        """Test that embeddings line up with their texts when batches finish out of order."""
+        service = EmbeddingService(test_settings)
+
+        async def create(model: str, input: list[str]) -> MagicMock:
+            # Later batches finish first.
+            await asyncio.sleep(0.01 / (1 + int(input[0])))
+            return MagicMock(
+                data=[MagicMock(embedding=[float(text)]) for text in input],
+                usage=MagicMock(total_tokens=len(input)),
+            )
+
+        service._openai_client = MagicMock()
+        service._openai_client.embeddings.create = AsyncMock(side_effect=create)
+        texts = [str(i) for i in range(250)]
+
+        embeddings = await service.embed_texts(texts)
+
+        assert embeddings == [[float(i)] for i in range(250)]
+        assert service._openai_client.embeddings.create.await_count == 3
+
+
+class TestDocumentProcessorEmbeddings:
+    """Tests for chunk embedding in the document processor."""
+
+    @pytest.fixture
+    def embedding_service(self) -> MagicMock:
+        service = MagicMock()
+        service.embed_texts = AsyncMock(
+            side_effect=lambda texts: [[float(len(text))] for text in texts]
+        )
+        return service
+
+    @pytest.fixture
+    def processor(
+        self, test_settings: Settings, embedding_service: MagicMock
+    ) -> DocumentProcessor:
+        return DocumentProcessor(
+            test_settings,
+            embedding_service,
+            MagicMock(),
+            DocumentChunker(test_settings),
+        )
+
+    @staticmethod
+    def _chunks(*contents: str) -> list[DocumentChunk]:
+        return [
+            DocumentChunk(
+                chunk_id=f"chunk-{i}",
+                document_id="doc-1",
+                content=content,
+                chunk_index=i,
+            )
+            for i, content in enumerate(contents)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_chunks_are_embedded_once(
+        self, processor: DocumentProcessor, embedding_service: MagicMock
+    ) -> None:
+        """Test that repeated chunk texts share one embedding request."""
+        chunks = await processor._generate_embeddings(
+            self._chunks("Aviso legal.", "Receita cresceu.", "Aviso legal.")
+        )
+
+        embedding_service.embed_texts.assert_awaited_once_with(["Aviso legal.", "Receita cresceu."])
+        assert [chunk.embedding for chunk in chunks] == [[12.0], [16.0], [12.0]]
+
+    @pytest.mark.asyncio
+    async def test_repeated_text_across_documents_is_memoized(
+        self, processor: DocumentProcessor, embedding_service: MagicMock
+    ) -> None:
+        """Test that text embedded for one document is reused for the next."""
+        await processor._generate_embeddings(self._chunks("Aviso legal."))
+        chunks = await processor._generate_embeddings(self._chunks("Aviso legal.", "Novo texto."))
+
+        embedding_service.embed_texts.assert_awaited_with(["Novo texto."])
+        assert chunks[0].embedding == [12.0]
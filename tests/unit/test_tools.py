@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -52,6 +53,36 @@ class TestYahooFinanceTool:
             assert result.success
             assert result.data.ticker == "PETR4"
 
+    @pytest.mark.asyncio
+    async def test_history_rows_streams_frame_records(self, tool: YahooFinanceTool) -> None:
+        """Test that history rows are produced lazily from the price frame."""
+        frame = pd.DataFrame(
+            {
+                "Open": [10.0, 11.0],
+                "High": [12.0, 13.0],
+                "Low": [9.0, 10.0],
+                "Close": [11.0, 12.5],
+                "Volume": [1000, 2000],
+                "Dividends": [0.0, 0.0],
+            },
+            index=pd.to_datetime(["2024-01-02", "2024-01-03"]),
+        )
+
+        with patch.object(tool, "_fetch_history", return_value=frame):
+            result = await tool.execute(action="history_rows", ticker="PETR4", period="5d")
+
+        assert result.success
+        rows = list(result.data)
+        assert [row["date"] for row in rows] == ["2024-01-02", "2024-01-03"]
+        assert rows[1] == {
+            "date": "2024-01-03",
+            "open": 11.0,
+            "high": 13.0,
+            "low": 10.0,
+            "close": 12.5,
+            "volume": 2000,
+        }
+
     @pytest.mark.asyncio
     async def test_execute_invalid_action(self, tool: YahooFinanceTool) -> None:
         """Test that invalid action returns error."""